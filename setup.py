@@ -15,11 +15,13 @@ setup(
 	packages=find_packages(),
 	project_urls={'Bug Tracker':'https://github.com/thammo4/uvatradier/issues'},
 	keywords='tradier finance api',
+	python_requires='>=3.9',
     install_requires=[
         'requests>=2.0', 
         'pandas>=1.0', 
+        'numpy>=1.20',
         'matplotlib>=3.0',
-        'websockets>=8.1',
+        'websockets>=13.0',
         'asyncio'  			# asyncio is included in the standard library for Python 3.7 and later - unneeded if using these versions.
     ]
 );
@@ -0,0 +1,123 @@
+import os;
+import sys;
+import threading;
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer;
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))));
+
+import pytest;
+
+from uvatradier.json_decoder import get_json_loads;
+
+
+class FakeResponse:
+	def __init__ (self, payload, status_code=200, headers=None):
+		self.payload 		= payload;
+		self.status_code 	= status_code;
+		self.headers 		= headers or dict();
+
+	def json (self):
+		return self.payload;
+
+	def raise_for_status (self):
+		if self.status_code >= 400:
+			raise RuntimeError(f"HTTP {self.status_code}");
+
+
+class FakeTransport:
+	'''
+	Stand-in for Transport answering requests from `routes`: {endpoint path suffix: payload or callable(params) -> payload}.
+	'''
+
+	def __init__ (self, routes):
+		self.routes 	= routes;
+		self.calls 		= list();
+		self.retry 		= None;
+		self.timeout 	= (3.05, 30);
+		self.json_loads = get_json_loads('auto');
+
+	def request (self, method, url, params=None, data=None, **kwargs):
+		self.calls.append((method, url, params or data));
+		route = next(value for suffix, value in self.routes.items() if url.endswith(suffix));
+		return FakeResponse(route(params or data) if callable(route) else route);
+
+	def get (self, url, params=None, **kwargs):
+		return self.request('GET', url, params=params, **kwargs);
+
+	def post (self, url, data=None, **kwargs):
+		return self.request('POST', url, data=data, **kwargs);
+
+
+@pytest.fixture
+def fake_transport ():
+	return FakeTransport;
+
+
+class LocalServer:
+	'''
+	HTTP/1.1 server on 127.0.0.1 answering every request with `respond(method, path, body) -> (status, headers, body)`.
+	A bytes/str body is sent whole; any other iterable is sent chunk by chunk with chunked transfer encoding.
+	Records each request as (method, path, body, client port) in `requests`.
+	'''
+
+	def __init__ (self, respond):
+		self.respond 	= respond;
+		self.requests 	= list();
+		server = self;
+
+		class Handler (BaseHTTPRequestHandler):
+			protocol_version = 'HTTP/1.1';
+
+			def handle_one (self):
+				body = self.rfile.read(int(self.headers.get('Content-Length') or 0));
+				server.requests.append((self.command, self.path, body, self.client_address[1]));
+				status, headers, payload = server.respond(self.command, self.path, body);
+				self.send_response(status);
+				for name, value in headers.items():
+					self.send_header(name, value);
+
+				if isinstance(payload, (bytes, str)):
+					payload = payload if isinstance(payload, bytes) else payload.encode();
+					self.send_header('Content-Length', str(len(payload)));
+					self.end_headers();
+					self.wfile.write(payload);
+					return;
+
+				self.send_header('Transfer-Encoding', 'chunked');
+				self.end_headers();
+				try:
+					for chunk in payload:
+						chunk = chunk if isinstance(chunk, bytes) else chunk.encode();
+						self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk));
+						self.wfile.flush();
+					self.wfile.write(b"0\r\n\r\n");
+				except OSError:
+					self.close_connection = True; 		# client hung up mid-stream
+
+			do_GET = do_POST = do_PUT = do_DELETE = handle_one;
+
+			def log_message (self, *args):
+				pass;
+
+		self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler);
+		self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}";
+		self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True);
+		self.thread.start();
+
+	def close (self):
+		self.httpd.shutdown();
+		self.httpd.server_close();
+
+
+@pytest.fixture
+def local_server ():
+	servers = list();
+
+	def start (respond):
+		servers.append(LocalServer(respond));
+		return servers[-1];
+
+	yield start;
+
+	for server in servers:
+		server.close();
@@ -0,0 +1,41 @@
+import time;
+import asyncio;
+import threading;
+
+from uvatradier import AsyncQuotes, Transport;
+
+
+def test_pool_is_sized_for_max_concurrency ():
+	transport = Transport(pool_maxsize=2);
+	quotes = AsyncQuotes('acct', 'token', transport=transport, max_concurrency=8);
+
+	assert quotes.max_concurrency == 8;
+	assert transport.pool_maxsize == 8;
+	assert transport.session.get_adapter('https://api.tradier.com').poolmanager.connection_pool_kw['maxsize'] == 8;
+	quotes.close();
+
+
+def test_pool_is_never_shrunk ():
+	transport = Transport(pool_maxsize=64);
+	AsyncQuotes('acct', 'token', transport=transport, max_concurrency=8).close();
+
+	assert transport.pool_maxsize == 64;
+
+
+def test_calls_in_flight_are_capped_by_max_concurrency ():
+	active, peak, lock = [0], [0], threading.Lock();
+
+	def call ():
+		with lock:
+			active[0] += 1;
+			peak[0] = max(peak[0], active[0]);
+		time.sleep(0.05);
+		with lock:
+			active[0] -= 1;
+
+	async def main ():
+		async with AsyncQuotes('acct', 'token', transport=Transport(), max_concurrency=4) as quotes:
+			await asyncio.gather(*[quotes.run(call) for _ in range(12)]);
+
+	asyncio.run(main());
+	assert peak[0] == 4;
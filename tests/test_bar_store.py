@@ -0,0 +1,78 @@
+import os;
+import threading;
+import time;
+
+import pandas as pd;
+
+from uvatradier import bar_store as bar_store_module;
+from uvatradier.bar_store import BarStore;
+from uvatradier.quotes import Quotes;
+
+
+def bars (start, end):
+	dates = pd.bdate_range(start, end);
+	return pd.DataFrame({'date': dates, 'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 100});
+
+
+def test_coverage_is_recomputed_after_crash_between_writes (tmp_path, monkeypatch):
+	store = BarStore(str(tmp_path), format='pickle');
+	store.merge('MTB', 'daily', bars('2024-01-01', '2024-01-31'), '2024-01-01', '2024-01-31');
+
+	def crash (obj, path):
+		raise KeyboardInterrupt;
+
+	monkeypatch.setattr(bar_store_module, 'write_json', crash);
+	try:
+		store.merge('MTB', 'daily', bars('2024-02-01', '2024-02-29'), '2024-02-01', '2024-03-10');
+	except KeyboardInterrupt:
+		pass;
+	monkeypatch.undo();
+
+	# The bars were written but the coverage file still describes January only
+	assert store.coverage('MTB', 'daily') == ('2024-01-01', '2024-02-29');
+	assert store.missing_ranges('MTB', 'daily', '2024-01-01', '2024-03-10') == [('2024-02-29', '2024-03-10')];
+
+
+def test_coverage_never_claims_missing_bars (tmp_path):
+	store = BarStore(str(tmp_path), format='pickle');
+	store.merge('MTB', 'daily', bars('2024-01-01', '2024-01-31'), '2024-01-01', '2024-01-31');
+
+	os.remove(store.path('MTB', 'daily'));
+
+	assert store.coverage('MTB', 'daily') is None;
+	assert store.missing_ranges('MTB', 'daily', '2024-01-01', '2024-01-31') == [('2024-01-01', '2024-01-31')];
+
+
+def test_empty_download_keeps_requested_coverage (tmp_path):
+	store = BarStore(str(tmp_path), format='pickle');
+	store.merge('MTB', 'daily', pd.DataFrame(), '2024-01-06', '2024-01-07');
+
+	assert store.coverage('MTB', 'daily') == ('2024-01-06', '2024-01-07');
+
+
+def test_concurrent_callers_fetch_a_gap_once (tmp_path, fake_transport):
+	requests = [];
+
+	def history (params):
+		requests.append((params['start'], params['end']));
+		time.sleep(0.05);
+		days = bars(params['start'], params['end']);
+		return {'history': {'day': [{**row, 'date': row['date'].strftime('%Y-%m-%d')} for row in days.to_dict('records')]}};
+
+	quotes = Quotes('acct', 'token', transport=fake_transport({'v1/markets/history': history}), bar_store=BarStore(str(tmp_path), format='pickle'));
+
+	barrier = threading.Barrier(4);
+	results = [];
+
+	def work ():
+		barrier.wait();
+		results.append(quotes.get_historical_quotes('MTB', start_date='2024-01-01', end_date='2024-01-31'));
+
+	threads = [threading.Thread(target=work) for _ in range(4)];
+	for thread in threads:
+		thread.start();
+	for thread in threads:
+		thread.join();
+
+	assert requests == [('2024-01-01', '2024-01-31')];
+	assert all(len(df) == 23 for df in results);
@@ -0,0 +1,113 @@
+import numpy as np;
+import pandas as pd;
+
+from uvatradier.chain_store import ChainStore;
+
+
+DAY = '2024-10-18';
+
+
+def chain (bid=(1.0, 2.0, 3.0), volume=(10, 20, 30), symbols=('SPY241220C00590000', 'SPY241220C00600000', 'SPY241220C00610000')):
+	n = len(symbols);
+	return pd.DataFrame({
+		'symbol' 		: list(symbols),
+		'bid' 			: np.array(bid[:n], dtype=np.float64),
+		'volume' 		: np.array(volume[:n], dtype=np.int64),
+		'bidexch' 		: pd.array(['Q', None, 'C'][:n], dtype=object),
+		'note' 			: pd.array(['a', 'b', None][:n], dtype='string'),
+		'halted' 		: np.array([False, False, True][:n]),
+		'trade_date' 	: pd.to_datetime(['2024-10-18 09:30', None, '2024-10-18 09:31'][:n])
+	});
+
+
+def at (minute):
+	return pd.Timestamp(f"{DAY} 09:{minute:02d}");
+
+
+def assert_same (left, right):
+	pd.testing.assert_frame_equal(left.reset_index(drop=True), right.reset_index(drop=True));
+
+
+def test_delta_round_trip_across_nan_and_value_changes (tmp_path):
+	store = ChainStore(str(tmp_path), format='pickle');
+	snapshots = [
+		chain(),
+		chain(bid=(1.0, np.nan, 3.5)),
+		chain(bid=(np.nan, 2.5, 3.5), volume=(11, 20, 31)),
+		chain(bid=(np.nan, 2.5, 3.5), volume=(11, 20, 31))
+	];
+
+	kinds = [store.write('SPY', snapshot, at(30 + i)) for i, snapshot in enumerate(snapshots)];
+
+	assert kinds == ['key', 'delta', 'delta', 'delta'];
+	for i, snapshot in enumerate(snapshots):
+		assert_same(store.read('SPY', at(30 + i)), snapshot);
+
+
+def test_object_string_bool_category_and_datetime_columns (tmp_path):
+	store = ChainStore(str(tmp_path), format='pickle');
+	first = chain().assign(askexch=pd.Categorical(['Q', 'Z', 'Q'], categories=['Q', 'Z']));
+
+	second = chain().assign(askexch=pd.Categorical(['Z', 'Z', None], categories=['Q', 'Z']));
+	second['bidexch'] = pd.array([None, 'X', 'C'], dtype=object);
+	second['note'] = pd.array([None, 'b', 'c'], dtype='string');
+	second['halted'] = np.array([True, False, False]);
+	second['trade_date'] = pd.to_datetime([None, '2024-10-18 09:32', '2024-10-18 09:31']);
+
+	store.write('SPY', first, at(30));
+	assert store.write('SPY', second, at(31)) == 'delta';
+
+	assert_same(store.read('SPY', at(30)), first);
+	assert_same(store.read('SPY', at(31)), second);
+
+
+def test_keyframe_forced_when_contracts_change (tmp_path):
+	store = ChainStore(str(tmp_path), format='pickle');
+	listed = ('SPY241220C00590000', 'SPY241220C00600000', 'SPY241220C00605000');
+
+	store.write('SPY', chain(), at(30));
+	store.write('SPY', chain(bid=(1.1, 2.0, 3.0)), at(31));
+	assert store.write('SPY', chain(symbols=listed), at(32)) == 'key';
+	assert store.write('SPY', chain(symbols=listed[:2]), at(33)) == 'key';
+	assert store.write('SPY', chain(bid=(5.0, 6.0), symbols=listed[:2]), at(34)) == 'delta';
+
+	assert [s['kind'] for s in store.manifest('SPY', DAY)['snapshots']] == ['key', 'delta', 'key', 'key', 'delta'];
+	assert_same(store.read('SPY', at(32)), chain(symbols=listed));
+	assert_same(store.read('SPY', at(34)), chain(bid=(5.0, 6.0), symbols=listed[:2]));
+
+
+def test_keyframe_every (tmp_path):
+	store = ChainStore(str(tmp_path), format='pickle', keyframe_every=2);
+
+	assert [store.write('SPY', chain(bid=(i, 2.0, 3.0)), at(30 + i)) for i in range(5)] == ['key', 'delta', 'key', 'delta', 'key'];
+
+
+def test_read_before_first_snapshot (tmp_path):
+	store = ChainStore(str(tmp_path), format='pickle');
+
+	assert store.read('SPY', at(30)).empty;
+
+	store.write('SPY', chain(), at(31));
+
+	assert store.read('SPY', at(30)).empty;
+	assert store.read('SPY', '2024-10-17 16:00').empty;
+	assert_same(store.read('SPY', at(45)), chain());
+
+
+def test_replay_and_reopen (tmp_path):
+	store = ChainStore(str(tmp_path), format='pickle');
+	snapshots = [chain(bid=(1.0 + i, 2.0, 3.0 - i)) for i in range(4)];
+
+	for i, snapshot in enumerate(snapshots[:2]):
+		store.write('SPY', snapshot, at(30 + i));
+
+	reopened = ChainStore(str(tmp_path), format='pickle');
+	for i, snapshot in enumerate(snapshots[2:], start=2):
+		assert reopened.write('SPY', snapshot, at(30 + i)) == 'delta';
+
+	replayed = list(reopened.replay('SPY', at(31), at(33)));
+
+	assert [time for time, _ in replayed] == [at(31), at(32), at(33)];
+	for (_, replayed_chain), snapshot in zip(replayed, snapshots[1:]):
+		assert_same(replayed_chain, snapshot);
+	assert list(reopened.snapshots('SPY')) == [at(30 + i) for i in range(4)];
@@ -0,0 +1,235 @@
+import asyncio;
+import json;
+import threading;
+import time;
+from types import SimpleNamespace;
+from urllib.parse import parse_qs;
+
+import pytest;
+from websockets.asyncio.server import serve;
+
+from uvatradier.retry import RetryPolicy;
+from uvatradier.transport import Transport;
+from uvatradier.event_stream import MarketEventStream, ShardedMarketStream;
+
+
+class FakeStreamClient:
+	'''
+	Just enough of Stream for the event streams: endpoints, a JSON decoder and numbered stream sessions.
+	'''
+
+	MARKET_EVENTS_STREAM_ENDPOINT = 'v1/markets/events';
+
+	def __init__ (self, websocket_url='ws://127.0.0.1:1', stream_url='http://127.0.0.1:1', transport=None):
+		self.WEBSOCKET_URL = websocket_url;
+		self.STREAM_URL = stream_url;
+		self.REQUESTS_HEADERS = {'Accept':'application/json'};
+		self.transport = transport if transport is not None else SimpleNamespace(json_loads=json.loads);
+		self.sessions = 0;
+
+	def http_market_stream_connect (self, max_attempts):
+		self.sessions += 1;
+		return f"session-{self.sessions}";
+
+
+def test_sharded_add_symbols_returns_merged_change ():
+	stream = ShardedMarketStream(FakeStreamClient(), ['SPY', 'QQQ'], shards=2);
+
+	change = asyncio.run(stream.add_symbols(['QQQ', 'IWM', 'DIA', 'IWM']));
+
+	assert change == {'added': ['IWM', 'DIA'], 'removed': [], 'filter_changed': False};
+	assert sorted(stream.symbol_list) == ['DIA', 'IWM', 'QQQ', 'SPY'];
+
+
+def test_sharded_remove_symbols_returns_merged_change ():
+	stream = ShardedMarketStream(FakeStreamClient(), ['SPY', 'QQQ', 'IWM', 'DIA'], shards=2);
+
+	change = asyncio.run(stream.remove_symbols(['QQQ', 'DIA', 'AAPL']));
+
+	assert change['added'] == [] and change['filter_changed'] is False;
+	assert sorted(change['removed']) == ['DIA', 'QQQ'];
+	assert sorted(stream.symbol_list) == ['IWM', 'SPY'];
+	assert asyncio.run(stream.remove_symbols(['AAPL'])) == {'added': [], 'removed': [], 'filter_changed': False};
+
+
+def test_sharded_set_filter_updates_every_shard_in_place ():
+	payloads = dict(); 		# connection -> subscription payloads received on it
+
+	async def handler (websocket):
+		async for message in websocket:
+			payloads.setdefault(id(websocket), []).append(json.loads(message));
+
+	async def scenario ():
+		async with serve(handler, '127.0.0.1', 0) as server:
+			port = server.sockets[0].getsockname()[1];
+			client = FakeStreamClient(f"ws://127.0.0.1:{port}");
+			stream = ShardedMarketStream(client, ['SPY', 'QQQ', 'IWM'], shards=3);
+			stream.start();
+
+			async def wait_for (condition):
+				for _ in range(200):
+					if condition():
+						return;
+					await asyncio.sleep(0.01);
+				raise AssertionError("timed out");
+
+			await wait_for(lambda: len(payloads) == 3 and all(shard.is_connected for shard in stream.shards));
+
+			change = await stream.set_filter(['quote', 'trade']);
+			await wait_for(lambda: all(len(received) == 2 for received in payloads.values()));
+
+			unchanged = await stream.set_filter(['quote', 'trade']);
+			stats = stream.stats();
+			await stream.close();
+
+			return client, change, unchanged, stats;
+
+	client, change, unchanged, stats = asyncio.run(scenario());
+
+	assert change == {'added': [], 'removed': [], 'filter_changed': True};
+	assert unchanged['filter_changed'] is False;
+
+	assert client.sessions == 3 and len(payloads) == 3;
+	assert stats['reconnects'] == 0 and all(shard['reconnects'] == 0 for shard in stats['shards']);
+
+	for first, second in payloads.values():
+		assert 'filter' not in first;
+		assert second['filter'] == ['quote', 'trade'];
+		assert second['symbols'] == first['symbols'] and second['sessionid'] == first['sessionid'];
+
+
+QUICK_RETRY = RetryPolicy(backoff_factor=0.001, backoff_max=0.001, jitter=False);
+
+
+def run_against_server (handler, consume):
+	async def scenario ():
+		async with serve(handler, '127.0.0.1', 0) as server:
+			port = server.sockets[0].getsockname()[1];
+			return await consume(FakeStreamClient(f"ws://127.0.0.1:{port}"));
+
+	return asyncio.run(scenario());
+
+
+def test_max_reconnects_counts_clean_closes ():
+	connections = [];
+
+	async def handler (websocket):
+		connections.append(await websocket.recv());
+		await websocket.close();
+
+	async def consume (client):
+		stream = MarketEventStream(client, ['SPY'], retry=QUICK_RETRY, max_reconnects=2);
+		async with stream:
+			with pytest.raises(ConnectionError):
+				async for event in stream:
+					pass;
+		return stream;
+
+	stream = run_against_server(handler, consume);
+
+	assert len(connections) == 3;
+	assert stream.reconnects == 2 and not stream.is_connected;
+
+
+def test_max_reconnects_resets_after_a_message ():
+	connections = [];
+
+	async def handler (websocket):
+		connections.append(await websocket.recv());
+		await websocket.send(json.dumps({'type':'trade', 'symbol':'SPY', 'price':'1.0'}));
+		await websocket.close();
+
+	async def consume (client):
+		events = [];
+		async with MarketEventStream(client, ['SPY'], retry=QUICK_RETRY, max_reconnects=1) as stream:
+			async for event in stream:
+				events.append(event);
+				if len(events) == 5:
+					break;
+		return stream, events;
+
+	stream, events = run_against_server(handler, consume);
+
+	assert len(events) == 5 and all(event.symbol == 'SPY' for event in events);
+	assert len(connections) >= 5 and stream.reconnects >= 4;
+
+
+def http_client (server):
+	return FakeStreamClient(stream_url=server.url, transport=Transport(rate_limiter=False, retry=False));
+
+
+def subscription (body):
+	return {key:values[0] for key, values in parse_qs(body.decode()).items()};
+
+
+def test_http_stream_reads_messages_split_across_chunks (local_server):
+	messages = json.dumps({'type':'trade', 'symbol':'SPY', 'price':'600.5', 'size':'10'}) + json.dumps({'type':'quote', 'symbol':'SPY', 'bid':600.4, 'ask':600.6});
+	chunks = [messages[:7], messages[7:50], messages[50:51], messages[51:]];
+	server = local_server(lambda method, path, body: (200, {'Content-Type':'application/json'}, chunks));
+	client = http_client(server);
+
+	async def consume ():
+		stream = MarketEventStream(client, ['SPY', 'QQQ'], filter_list=['trade', 'quote'], protocol='http', reconnect=False);
+		return [event async for event in stream];
+
+	events = asyncio.run(consume());
+
+	assert [event.TYPE for event in events] == ['trade', 'quote'];
+	assert events[0].price == 600.5 and events[0].size == 10 and events[1].ask == 600.6;
+
+	[(method, path, body, _)] = server.requests;
+	assert method == 'POST' and path == '/v1/markets/events';
+	assert subscription(body) == {'sessionid':'session-1', 'symbols':'SPY,QQQ', 'filter':'trade,quote', 'linebreak':'false', 'validOnly':'true', 'advancedDetails':'true'};
+
+
+def test_http_stream_resubscribe_reconnects_with_new_symbols (local_server):
+	release = threading.Event();
+
+	def respond (method, path, body):
+		def chunks ():
+			for symbol in subscription(body)['symbols'].split(','):
+				yield json.dumps({'type':'trade', 'symbol':symbol, 'price':'1.0'});
+			release.wait(5); 			# hold the stream open until the client hangs up or the test ends
+		return 200, {'Content-Type':'application/json'}, chunks();
+
+	server = local_server(respond);
+	client = http_client(server);
+
+	async def consume ():
+		symbols = [];
+		async with MarketEventStream(client, ['SPY'], protocol='http', retry=QUICK_RETRY) as stream:
+			async for event in stream:
+				symbols.append(event.symbol);
+				if symbols == ['SPY']:
+					await stream.add_symbols(['QQQ']);
+				if len(symbols) == 3:
+					break;
+		return stream, symbols;
+
+	started = time.monotonic();
+	try:
+		stream, symbols = asyncio.run(consume());
+	finally:
+		release.set();
+
+	assert time.monotonic() - started < 2; 		# did not wait for the server to end the first stream
+	assert symbols == ['SPY', 'SPY', 'QQQ'];
+	assert [subscription(body)['symbols'] for _, _, body, _ in server.requests] == ['SPY', 'SPY,QQQ'];
+	assert [subscription(body)['sessionid'] for _, _, body, _ in server.requests] == ['session-1', 'session-2'];
+	assert stream.reconnects == 1;
+
+
+def test_http_stream_error_status_is_raised (local_server):
+	server = local_server(lambda method, path, body: (401, {}, 'Invalid session'));
+
+	async def consume ():
+		async for event in MarketEventStream(http_client(server), ['SPY'], protocol='http', reconnect=False):
+			pass;
+
+	with pytest.raises(Exception, match='401'):
+		asyncio.run(consume());
+
+
+def test_invalid_protocol ():
+	with pytest.raises(ValueError):
+		MarketEventStream(FakeStreamClient(), ['SPY'], protocol='sse');
@@ -0,0 +1,60 @@
+import random;
+import threading;
+from datetime import datetime, timedelta;
+
+from uvatradier.expiry_index import ExpiryIndex;
+from uvatradier.options_data import OptionsData;
+
+
+EXPIRIES = ['2024-10-18', '2024-10-25', '2024-11-01', '2024-11-15', '2024-12-20'];
+
+
+def closest_by_min (expiries, target):
+	# The original get_closest_expiry: nearest by datetime distance, first expiry wins exact ties
+	return min(expiries, key=lambda d: abs(datetime.strptime(d, "%Y-%m-%d") - target));
+
+
+def test_time_of_day_counts ():
+	index = ExpiryIndex(EXPIRIES);
+
+	# 2024-10-21 12:00 is halfway between the 18th and the 25th
+	assert index.nearest(datetime(2024, 10, 21, 15, 0)) == '2024-10-25';
+	assert index.nearest(datetime(2024, 10, 21, 9, 0)) == '2024-10-18';
+	assert index.nearest(datetime(2024, 10, 21).date()) == '2024-10-18';
+
+
+def test_exact_tie_goes_to_earlier_expiry ():
+	assert ExpiryIndex(EXPIRIES).nearest(datetime(2024, 10, 21, 12, 0)) == '2024-10-18';
+
+
+def test_nearest_matches_original_semantics ():
+	index = ExpiryIndex(EXPIRIES);
+	rng = random.Random(7);
+	start = datetime(2024, 10, 1);
+
+	targets = [start + timedelta(hours=rng.randrange(0, 24 * 120)) for _ in range(2000)];
+
+	assert list(index.nearest_many(targets)) == [closest_by_min(EXPIRIES, t) for t in targets];
+
+
+def test_expiry_index_concurrent_access (fake_transport):
+	transport = fake_transport({'v1/markets/options/expirations': {'expirations': {'date': EXPIRIES}}});
+	options = OptionsData('acct', 'token', transport=transport);
+
+	indexes = [];
+	barrier = threading.Barrier(8);
+
+	def work ():
+		barrier.wait();
+		for _ in range(50):
+			indexes.append(options.get_expiry_index('SPY'));
+			options.invalidate_cache('SPY');
+
+	threads = [threading.Thread(target=work) for _ in range(8)];
+	for thread in threads:
+		thread.start();
+	for thread in threads:
+		thread.join();
+
+	assert len(indexes) == 400;
+	assert all(list(index.dates.astype(str)) == EXPIRIES for index in indexes);
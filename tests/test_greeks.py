@@ -0,0 +1,36 @@
+import numpy as np;
+
+from uvatradier.greeks import call_mask, bs_price, bs_greeks, implied_volatility;
+
+
+def test_call_mask_formats ():
+	assert call_mask(['call', 'PUT', 'c', 'P']).tolist() == [True, False, True, False];
+	assert call_mask(np.array([True, False])).tolist() == [True, False];
+	assert call_mask('call') == True;
+
+
+def test_empty_inputs ():
+	empty = np.array([]);
+
+	assert call_mask(np.array([], dtype=object)).shape == (0,);
+	assert bs_price(empty, empty, empty, empty, np.array([], dtype=str)).shape == (0,);
+	assert all(value.shape == (0,) for value in bs_greeks(empty, empty, empty, empty, []).values());
+	assert implied_volatility(empty, empty, empty, empty, []).shape == (0,);
+
+
+def test_put_call_parity ():
+	K = np.array([90.0, 100.0, 110.0]);
+	call = bs_price(100, K, 0.5, 0.25, 'call', r=0.03, q=0.01);
+	put = bs_price(100, K, 0.5, 0.25, 'put', r=0.03, q=0.01);
+
+	np.testing.assert_allclose(call - put, 100 * np.exp(-0.01 * 0.5) - K * np.exp(-0.03 * 0.5), atol=1e-10);
+
+
+def test_implied_volatility_recovers_sigma ():
+	sigma = np.array([0.15, 0.3, 0.6, 1.2]);
+	option_type = np.array(['call', 'put', 'call', 'put']);
+	K = np.array([95.0, 100.0, 105.0, 120.0]);
+	price = bs_price(100, K, 30 / 365, sigma, option_type, r=0.05);
+
+	np.testing.assert_allclose(implied_volatility(price, 100, K, 30 / 365, option_type, r=0.05), sigma, atol=1e-6);
+	assert np.isnan(implied_volatility(0.01, 100, 50, 30 / 365, 'call'));
@@ -0,0 +1,45 @@
+import numpy as np;
+import pytest;
+
+from uvatradier.occ import parse_occ, build_occ, InvalidOCCSymbolError;
+
+
+def test_parse_occ_components ():
+	parsed = parse_occ(['LMT240119C00300000', 'SPXW241220P05850000', 'SPY   240229C00500500']);
+
+	assert list(parsed['root_symbol']) == ['LMT', 'SPXW', 'SPY'];
+	assert list(parsed['expiration_date'].dt.strftime('%Y-%m-%d')) == ['2024-01-19', '2024-12-20', '2024-02-29'];
+	assert list(parsed['option_type']) == ['call', 'put', 'call'];
+	assert list(parsed['strike']) == [300.0, 5850.0, 500.5];
+
+
+@pytest.mark.parametrize('symbol', ['SPY240231C00500000', 'SPY230229C00500000', 'SPY240431P00500000', 'SPY241300C00500000'])
+def test_parse_occ_rejects_impossible_dates (symbol):
+	with pytest.raises(InvalidOCCSymbolError):
+		parse_occ(symbol);
+
+	parsed = parse_occ(symbol, errors='coerce');
+	assert parsed['root_symbol'].isna().all();
+	assert parsed['expiration_date'].isna().all();
+
+
+@pytest.mark.parametrize('symbol', ['spy240119C00300000', 'Spy240119C00300000', 'SPÉ240119C00300000', 'S Y240119C00300000'])
+def test_parse_occ_rejects_non_uppercase_roots (symbol):
+	with pytest.raises(InvalidOCCSymbolError):
+		parse_occ(symbol);
+
+	assert parse_occ(symbol, errors='coerce')['strike'].isna().all();
+
+
+def test_parse_occ_coerce_keeps_valid_rows ():
+	parsed = parse_occ(['SPY240231C00500000', 'BRK240119C00300000', 'brk240119C00300000'], errors='coerce');
+
+	assert list(parsed['root_symbol'].notna()) == [False, True, False];
+	assert parsed['expiration_date'].iloc[1] == np.datetime64('2024-01-19');
+
+
+def test_build_occ_round_trip ():
+	symbols = build_occ('SPY', ['2024-02-29', '2024-12-31'], ['call', 'put'], [600, 605.5]);
+
+	assert list(symbols) == ['SPY240229C00600000', 'SPY241231P00605500'];
+	assert list(parse_occ(symbols)['strike']) == [600.0, 605.5];
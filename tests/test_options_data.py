@@ -0,0 +1,107 @@
+import json;
+import threading;
+import time;
+import pandas as pd;
+
+from uvatradier import OptionsData;
+
+
+EXPIRY = '2024-12-20';
+STRIKES = [590.0, 595.0, 600.0, 605.0, 610.0];
+
+
+def chain_records (expiry=EXPIRY):
+	return [
+		{'symbol':f"SPY{expiry[2:].replace('-', '')}{t[0].upper()}{int(k * 1000):08d}", 'description':'', 'underlying':'SPY', 'strike':k, 'option_type':t,
+		 'expiration_date':expiry, 'bid':1.0 + i, 'ask':1.1 + i, 'volume':i}
+		for i, (k, t) in enumerate((k, t) for k in STRIKES for t in ('call', 'put'))
+	];
+
+
+def options_data (fake_transport):
+	transport = fake_transport({
+		'v1/markets/options/expirations' 	: {'expirations':{'expiration':[{'date':EXPIRY, 'strikes':{'strike':STRIKES}}]}},
+		'v1/markets/options/chains' 		: {'options':{'option':chain_records()}}
+	});
+	return OptionsData('acct', 'token', transport=transport, cache=False);
+
+
+def test_chain_day_one_strike_window (fake_transport):
+	chain = options_data(fake_transport).get_chain_day('SPY', EXPIRY, strike=600, strike_window=0);
+
+	assert len(chain) == 2;
+	assert set(chain['option_type']) == {'call', 'put'};
+
+
+def test_chain_day_one_strike_window_one_type (fake_transport):
+	chain = options_data(fake_transport).get_chain_day('SPY', EXPIRY, strike=600, strike_window=0, option_type='put');
+
+	assert len(chain) == 1;
+	assert chain['symbol'].iloc[0] == 'SPY241220P00600000';
+
+
+def test_chain_day_filters_keep_filter_columns (fake_transport):
+	chain = options_data(fake_transport).get_chain_day('SPY', EXPIRY, strike_low=595, strike_high=605, option_type='call');
+
+	assert chain['strike'].tolist() == [595.0, 600.0, 605.0];
+	assert 'description' not in chain and 'underlying' not in chain;
+
+
+def test_chain_day_strike_centers_window (fake_transport):
+	by_strike = options_data(fake_transport).get_chain_day('SPY', EXPIRY, strike=600, strike_window=1, option_type='call');
+	by_center = options_data(fake_transport).get_chain_day('SPY', EXPIRY, center=600, strike_window=1, option_type='call');
+
+	assert by_strike['strike'].tolist() == [595.0, 600.0, 605.0];
+	assert by_strike['symbol'].tolist() == by_center['symbol'].tolist();
+
+
+def test_cached_results_have_uncached_types (fake_transport):
+	routes = {
+		'v1/markets/options/expirations' 	: lambda params: {'expirations':{'expiration':[{'date':EXPIRY, 'strikes':{'strike':list(STRIKES)}}]}},
+		'v1/markets/options/lookup' 		: lambda params: {'symbols':[{'rootSymbol':'SPY', 'options':['SPY241220C00600000', 'SPY241220P00600000']}]}
+	};
+	cached = OptionsData('acct', 'token', transport=fake_transport(routes));
+	uncached = OptionsData('acct', 'token', transport=fake_transport(routes), cache=False);
+
+	for options in (cached, uncached):
+		expirations = options.get_expiry_dates('SPY', strikes=True);
+		symbols = options.get_options_symbols('SPY');
+
+		assert type(expirations) is dict and type(symbols) is list;
+		assert json.loads(json.dumps(expirations)) == expirations;
+
+		expirations['expiration'].clear();
+		symbols.append('SPY241220C00605000');
+
+		assert options.get_expiry_dates('SPY', strikes=True)['expiration'][0]['date'] == EXPIRY;
+		assert len(options.get_options_symbols('SPY')) == 2;
+
+
+def test_chain_all_fetches_expiries_concurrently_in_order (fake_transport):
+	expiries = ['2024-11-15', '2024-12-20', '2025-01-17'];
+	everyone_in_flight = threading.Barrier(len(expiries), timeout=5);
+
+	def chain (params):
+		everyone_in_flight.wait();
+		time.sleep(0.01 * (len(expiries) - expiries.index(params['expiration'])));
+		return {'options':{'option':chain_records(params['expiration'])}};
+
+	transport = fake_transport({
+		'v1/markets/options/expirations' 	: {'expirations':{'date':expiries}},
+		'v1/markets/options/chains' 		: chain
+	});
+	chain_all = OptionsData('acct', 'token', transport=transport, cache=False).get_chain_all('SPY', max_workers=len(expiries), drop_constant=False);
+
+	assert len(chain_all) == len(expiries) * len(STRIKES) * 2;
+	assert list(dict.fromkeys(chain_all['expiration_date'].astype(str))) == expiries;
+
+
+def test_chain_all_sequential_matches_concurrent (fake_transport):
+	expiries = ['2024-11-15', '2024-12-20'];
+	transport = fake_transport({
+		'v1/markets/options/expirations' 	: {'expirations':{'date':expiries}},
+		'v1/markets/options/chains' 		: lambda params: {'options':{'option':chain_records(params['expiration'])}}
+	});
+	options = OptionsData('acct', 'token', transport=transport, cache=False);
+
+	pd.testing.assert_frame_equal(options.get_chain_all('SPY', max_workers=1), options.get_chain_all('SPY', max_workers=4));
@@ -0,0 +1,101 @@
+import numpy as np;
+import pandas as pd;
+import requests;
+
+from uvatradier import Quotes;
+
+
+def quote_record (symbol):
+	return {'symbol':symbol, 'description':f"{symbol} Inc", 'exch':'Q', 'type':'stock', 'last':100.25, 'volume':1200,
+			'bid':100.2, 'ask':100.3, 'trade_date':1720726003419, 'bidexch':'P', 'askexch':'N', 'root_symbols':symbol};
+
+
+def quote_reply (data):
+	records = [quote_record(symbol) for symbol in data['symbols'].split(',')];
+	return {'quotes':{'quote':records[0] if len(records) == 1 else records}};
+
+
+def quotes (fake_transport, routes):
+	return Quotes('acct', 'token', transport=fake_transport(routes));
+
+
+def test_quote_data_posts_chunks_in_order (fake_transport):
+	q = quotes(fake_transport, {'v1/markets/quotes':quote_reply});
+	df = q.get_quote_data(['aapl', 'MSFT', 'NVDA', 'AMZN', 'META'], chunk_size=2);
+
+	assert df['symbol'].tolist() == ['AAPL', 'MSFT', 'NVDA', 'AMZN', 'META'];
+	assert sorted(data['symbols'] for _, _, data in q.transport.calls) == ['AAPL,MSFT', 'META', 'NVDA,AMZN'];
+	assert all(method == 'POST' and data['greeks'] == 'false' for method, _, data in q.transport.calls);
+
+
+def test_quote_data_single_symbol (fake_transport):
+	q = quotes(fake_transport, {'v1/markets/quotes':quote_reply});
+	df = q.get_quote_data('spy');
+
+	assert df['symbol'].tolist() == ['SPY'];
+	assert len(q.transport.calls) == 1;
+
+
+def test_quote_data_chunk_failure_returns_empty_frame (fake_transport, capsys):
+	def flaky (data):
+		if 'NVDA' in data['symbols']:
+			raise requests.exceptions.ConnectionError('connection reset');
+		return quote_reply(data);
+
+	df = quotes(fake_transport, {'v1/markets/quotes':flaky}).get_quote_data(['AAPL', 'MSFT', 'NVDA', 'AMZN'], chunk_size=2);
+
+	assert isinstance(df, pd.DataFrame) and df.empty;
+	assert 'Failed API Request: connection reset' in capsys.readouterr().out;
+
+
+def test_quote_data_missing_quotes_key (fake_transport, capsys):
+	df = quotes(fake_transport, {'v1/markets/quotes':{'quotes':None}}).get_quote_data(['AAPL']);
+
+	assert df.empty;
+	assert "No 'quote' key" in capsys.readouterr().out;
+
+
+def test_quote_data_compact (fake_transport):
+	q = quotes(fake_transport, {'v1/markets/quotes':quote_reply});
+	df = q.get_quote_data(['AAPL', 'MSFT'], compact=True);
+
+	assert df['last'].dtype == np.float32 and df['volume'].dtype == np.int16;
+	assert df['trade_date'].iloc[0] == pd.Timestamp('2024-07-11 19:26:43.419');
+	assert isinstance(df['exch'].dtype, pd.CategoricalDtype) and isinstance(df['bidexch'].dtype, pd.CategoricalDtype);
+	assert q.get_quote_data(['AAPL', 'MSFT'])['last'].dtype == np.float64;
+
+
+DAYS = ['2024-10-01', '2024-10-02', '2024-10-03'];
+
+
+def history_reply (params):
+	if params['symbol'] == 'XYZXYZ':
+		return {'history':None};
+	base = {'MTB':175.0, 'C':62.0}[params['symbol']];
+	return {'history':{'day':[{'date':day, 'open':base + i, 'high':base + i + 1, 'low':base + i - 1, 'close':base + i, 'volume':1000 * (i + 1)} for i, day in enumerate(DAYS)]}};
+
+
+def test_historical_bulk_keeps_order_and_records_failures (fake_transport, capsys):
+	bars = quotes(fake_transport, {'v1/markets/history':history_reply}).get_historical_quotes_bulk(['MTB', 'XYZXYZ', 'C'], start_date=DAYS[0], end_date=DAYS[-1]);
+
+	assert bars.columns[0] == 'symbol';
+	assert bars['symbol'].tolist() == ['MTB'] * 3 + ['C'] * 3;
+	assert bars['close'].tolist() == [175.0, 176.0, 177.0, 62.0, 63.0, 64.0];
+	assert list(bars.attrs['failures']) == ['XYZXYZ'];
+	assert 'No historical data' in bars.attrs['failures']['XYZXYZ'];
+	assert '1 of 3 symbols failed: XYZXYZ' in capsys.readouterr().out;
+
+
+def test_historical_bulk_multi_index (fake_transport):
+	bars = quotes(fake_transport, {'v1/markets/history':history_reply}).get_historical_quotes_bulk(['C', 'MTB'], start_date=DAYS[0], end_date=DAYS[-1], multi_index=True, max_workers=1);
+
+	assert bars.index.names == ['symbol', 'date'];
+	assert bars.loc[('MTB', pd.Timestamp(DAYS[1])), 'close'] == 176.0;
+	assert bars.attrs['failures'] == dict();
+
+
+def test_historical_bulk_all_failed (fake_transport):
+	bars = quotes(fake_transport, {'v1/markets/history':history_reply}).get_historical_quotes_bulk(['XYZXYZ'], start_date=DAYS[0], end_date=DAYS[-1]);
+
+	assert bars.empty and 'symbol' in bars.columns;
+	assert list(bars.attrs['failures']) == ['XYZXYZ'];
@@ -0,0 +1,28 @@
+import time;
+
+from uvatradier import RateLimiter;
+
+from conftest import FakeResponse;
+
+
+def resume_in (limiter, headers):
+	limiter.update('market_data', FakeResponse({}, status_code=429, headers=headers));
+	return limiter.budget('market_data')['resume_in'];
+
+
+def test_429_pauses_for_retry_after ():
+	assert 0.5 < resume_in(RateLimiter(), {'Retry-After':'1'}) <= 1.0;
+
+
+def test_429_retry_after_overrides_window_expiry ():
+	expiry = str(int((time.time() + 45) * 1000));
+	assert resume_in(RateLimiter(), {'Retry-After':'2', 'X-Ratelimit-Expiry':expiry}) <= 2.0;
+
+
+def test_429_pauses_until_window_expiry ():
+	expiry = str(int((time.time() + 10) * 1000));
+	assert 9.0 < resume_in(RateLimiter(), {'X-Ratelimit-Expiry':expiry}) <= 10.0;
+
+
+def test_429_without_headers_pauses_a_full_window ():
+	assert 59.0 < resume_in(RateLimiter(), {}) <= 60.0;
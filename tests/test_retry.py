@@ -0,0 +1,134 @@
+import time;
+from email.utils import formatdate;
+
+import pytest;
+import requests;
+
+from conftest import FakeResponse;
+from uvatradier import transport as transport_module;
+from uvatradier.retry import RetryPolicy, parse_retry_after;
+from uvatradier.transport import Transport;
+
+
+def scripted (*replies):
+	'''
+	Server responder answering with `replies` in turn: (status, headers), then 200 once they run out.
+	'''
+	replies = list(replies);
+
+	def respond (method, path, body):
+		status, headers = replies.pop(0) if replies else (200, dict());
+		return status, dict(headers, **{'Content-Type':'application/json'}), '{"status": %d}' % status;
+
+	return respond;
+
+
+@pytest.fixture
+def sleeps (monkeypatch):
+	slept = list();
+	monkeypatch.setattr(transport_module.time, 'sleep', slept.append);
+	return slept;
+
+
+def policy (**kwargs):
+	return RetryPolicy(**dict(dict(backoff_factor=0.1, jitter=False), **kwargs));
+
+
+def test_retries_5xx_with_exponential_backoff (local_server, sleeps):
+	server = local_server(scripted((503, {}), (502, {})));
+	r = Transport(rate_limiter=False, retry=policy()).get(server.url + '/v1/markets/quotes');
+
+	assert r.status_code == 200 and r.json() == {'status': 200};
+	assert len(server.requests) == 3;
+	assert sleeps == [0.1, 0.2];
+
+
+def test_honors_retry_after (local_server, sleeps):
+	server = local_server(scripted((429, {'Retry-After':'2'})));
+	r = Transport(rate_limiter=False, retry=policy()).get(server.url + '/v1/markets/quotes');
+
+	assert r.status_code == 200;
+	assert sleeps == [2.0];
+
+
+def test_retry_after_is_capped (local_server, sleeps):
+	server = local_server(scripted((429, {'Retry-After':'600'})));
+	Transport(rate_limiter=False, retry=policy(retry_after_max=5)).get(server.url + '/v1/markets/quotes');
+
+	assert sleeps == [5];
+
+
+def test_exhausted_retries_return_last_response (local_server, sleeps):
+	server = local_server(scripted(*[(503, {})] * 10));
+	r = Transport(rate_limiter=False, retry=policy(total=2)).get(server.url + '/v1/markets/quotes');
+
+	assert r.status_code == 503;
+	assert len(server.requests) == 3;
+	with pytest.raises(requests.exceptions.HTTPError):
+		r.raise_for_status();
+
+
+def test_post_retried_only_when_asked (local_server, sleeps):
+	server = local_server(scripted((503, {}), (503, {})));
+	transport = Transport(rate_limiter=False, retry=policy());
+
+	assert transport.post(server.url + '/v1/accounts/acct/orders', data={'side':'buy'}).status_code == 503;
+	assert len(server.requests) == 1;
+
+	assert transport.post(server.url + '/v1/markets/quotes', data={'symbols':'SPY'}, retry=True).status_code == 200;
+	assert len(server.requests) == 3;
+
+
+def test_retry_false_disables_retries (local_server, sleeps):
+	server = local_server(scripted((503, {})));
+
+	assert Transport(rate_limiter=False, retry=policy()).get(server.url + '/v1/markets/quotes', retry=False).status_code == 503;
+	assert Transport(rate_limiter=False, retry=False).get(server.url + '/v1/markets/quotes').status_code == 200;
+	assert sleeps == [];
+
+
+def test_connection_errors_retried_then_raised (monkeypatch, sleeps):
+	transport = Transport(rate_limiter=False, retry=policy(total=2));
+	attempts = list();
+
+	def refuse (**kwargs):
+		attempts.append(kwargs['method']);
+		raise requests.exceptions.ConnectionError('refused');
+
+	monkeypatch.setattr(transport.session, 'request', refuse);
+
+	with pytest.raises(requests.exceptions.ConnectionError):
+		transport.get('http://127.0.0.1/v1/markets/quotes');
+	assert len(attempts) == 3 and len(sleeps) == 2;
+
+
+def test_connect_timeout_retried_for_post (monkeypatch, sleeps):
+	transport = Transport(rate_limiter=False, retry=policy(total=1));
+	attempts = list();
+
+	def timeout (**kwargs):
+		attempts.append(kwargs['method']);
+		raise requests.exceptions.ConnectTimeout('no route');
+
+	monkeypatch.setattr(transport.session, 'request', timeout);
+
+	with pytest.raises(requests.exceptions.ConnectTimeout):
+		transport.post('http://127.0.0.1/v1/accounts/acct/orders');
+	assert attempts == ['POST', 'POST'];
+
+
+def test_backoff_capped_and_jittered ():
+	assert [policy(backoff_max=0.5).backoff(n) for n in range(5)] == [0.1, 0.2, 0.4, 0.5, 0.5];
+
+	jittered = RetryPolicy(backoff_factor=0.1, backoff_max=0.5, jitter=True);
+	for n in range(5):
+		assert all(0 <= jittered.backoff(n) <= min(0.5, 0.1 * 2 ** n) for _ in range(50));
+
+
+def test_parse_retry_after ():
+	assert parse_retry_after(FakeResponse(None, headers={'Retry-After':'3'})) == 3.0;
+	assert parse_retry_after(FakeResponse(None, headers={'Retry-After':'-1'})) == 0.0;
+	assert parse_retry_after(FakeResponse(None, headers={'Retry-After':'soon'})) is None;
+	assert parse_retry_after(FakeResponse(None)) is None;
+	assert parse_retry_after(None) is None;
+	assert 28 <= parse_retry_after(FakeResponse(None, headers={'Retry-After':formatdate(time.time() + 30, usegmt=True)})) <= 30;
@@ -0,0 +1,75 @@
+import numpy as np;
+import pandas as pd;
+
+from uvatradier.schemas import records_to_frame, restore_categoricals, QUOTE_SCHEMA, HISTORY_SCHEMA, COMPACT_QUOTE_SCHEMA;
+
+
+def test_flat_records_are_typed_per_schema ():
+	df = records_to_frame([
+		{'symbol':'SPY', 'last':600.1, 'volume':100, 'exch':'Q'},
+		{'symbol':'QQQ', 'last':None, 'volume':None, 'exch':'Q', 'strike':500}
+	], QUOTE_SCHEMA);
+
+	assert list(df.columns) == ['symbol', 'last', 'volume', 'exch', 'strike'];
+	assert df['last'].dtype == np.float64 and np.isnan(df['last'].iloc[1]);
+	assert df['volume'].dtype == np.float64; 			# int64 with nulls falls back to float64
+	assert isinstance(df['exch'].dtype, pd.CategoricalDtype);
+	assert np.isnan(df['strike'].iloc[0]) and df['strike'].iloc[1] == 500.0;
+
+
+def test_single_record_and_empty ():
+	assert records_to_frame({'date':'2024-10-01', 'close':1.5, 'volume':10}, HISTORY_SCHEMA)['date'].dtype.kind == 'M';
+	assert records_to_frame([], HISTORY_SCHEMA).empty;
+	assert records_to_frame(None, HISTORY_SCHEMA).empty;
+
+
+def test_nested_object_in_a_later_record_is_flattened ():
+	records = [
+		{'symbol':'SPY241220C00600000', 'strike':600, 'greeks':None},
+		{'symbol':'SPY241220P00600000', 'strike':600, 'greeks':{'delta':-0.45, 'mid_iv':0.18}}
+	];
+
+	df = records_to_frame(records, QUOTE_SCHEMA);
+
+	assert 'greeks.delta' in df and 'greeks.mid_iv' in df;
+	assert np.isnan(df['greeks.delta'].iloc[0]) and df['greeks.delta'].iloc[1] == -0.45;
+	assert df['strike'].dtype == np.float64;
+	assert df.equals(records_to_frame(records[::-1], QUOTE_SCHEMA).iloc[::-1].reset_index(drop=True)[df.columns]);
+
+
+def test_compact_schema_dtypes ():
+	df = records_to_frame([
+		{'symbol':'SPY', 'exch':'Q', 'last':600.125, 'volume':120, 'bidsize':3, 'trade_date':1720726003419, 'expiration_date':'2024-12-20'},
+		{'symbol':'QQQ', 'exch':'Q', 'last':500.5, 'volume':70000, 'bidsize':None, 'trade_date':1720726004190, 'expiration_date':'2024-12-20'}
+	], COMPACT_QUOTE_SCHEMA);
+
+	assert df['last'].dtype == np.float32 and df['last'].tolist() == [600.125, 500.5];
+	assert df['volume'].dtype == np.int32; 				# smallest integer type holding 70000
+	assert df['bidsize'].dtype == pd.Int8Dtype() and df['bidsize'].isna().tolist() == [False, True];
+	assert df['trade_date'].iloc[0] == pd.Timestamp('2024-07-11 19:26:43.419');
+	assert df['expiration_date'].dtype.kind == 'M';
+	assert isinstance(df['exch'].dtype, pd.CategoricalDtype);
+	assert df['symbol'].tolist() == ['SPY', 'QQQ'];
+
+
+def test_compact_numeric_columns_are_smaller ():
+	records = [{'symbol':f"SPY2412{i:04d}", 'exch':'Q', 'type':'option', 'last':1.5 + i, 'volume':i, 'bid':1.4 + i, 'ask':1.6 + i} for i in range(1000)];
+	numeric = ['last', 'volume', 'bid', 'ask'];
+
+	compact = records_to_frame(records, COMPACT_QUOTE_SCHEMA)[numeric].memory_usage(index=False).sum();
+	full = records_to_frame(records, QUOTE_SCHEMA)[numeric].memory_usage(index=False).sum();
+
+	assert compact <= full / 2;
+
+
+def test_restore_categoricals_after_concat ():
+	spy = records_to_frame([{'symbol':'SPY', 'exch':'Q', 'type':'option'}], COMPACT_QUOTE_SCHEMA);
+	qqq = records_to_frame([{'symbol':'QQQ', 'exch':'N', 'type':'option'}], COMPACT_QUOTE_SCHEMA);
+	df = pd.concat([spy, qqq], ignore_index=True);
+
+	assert not isinstance(df['exch'].dtype, pd.CategoricalDtype);
+
+	df = restore_categoricals(df, COMPACT_QUOTE_SCHEMA);
+
+	assert isinstance(df['exch'].dtype, pd.CategoricalDtype) and isinstance(df['type'].dtype, pd.CategoricalDtype);
+	assert df['exch'].tolist() == ['Q', 'N'];
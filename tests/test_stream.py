@@ -0,0 +1,47 @@
+import asyncio;
+
+from uvatradier import Stream;
+
+
+class RecordingEvents:
+	'''
+	Stand-in for an event stream, recording whether it was built inside a running event loop.
+	'''
+
+	def __init__ (self):
+		try:
+			self.loop = asyncio.get_running_loop();
+		except RuntimeError:
+			self.loop = None;
+
+
+def recording_stream ():
+	stream = Stream('acct', 'token', live_trade=True);
+	built, ran = list(), list();
+
+	def events (*args, **kwargs):
+		built.append(RecordingEvents());
+		return built[-1];
+
+	async def run_events (events, callback=None):
+		ran.append(events.loop is asyncio.get_running_loop());
+
+	stream.market_events = stream.account_events = events;
+	stream.run_events = run_events;
+
+	return stream, built, ran;
+
+
+def test_stream_market_events_builds_stream_in_its_loop ():
+	for options in ({'reconnect':True}, {'protocol':'http'}):
+		stream, built, ran = recording_stream();
+		stream.stream_market_events(['SPY'], **options);
+
+		assert len(built) == 1 and ran == [True];
+
+
+def test_stream_account_events_builds_stream_in_its_loop ():
+	stream, built, ran = recording_stream();
+	stream.stream_account_events();
+
+	assert len(built) == 1 and ran == [True];
@@ -0,0 +1,105 @@
+import json;
+import random;
+
+import pytest;
+
+from uvatradier.stream_events import EventDecoder, MessageSplitter, TradeEvent, QuoteEvent, OrderEvent, ACCOUNT_EVENT_TYPES;
+
+
+TRADE = '{"type":"trade","symbol":"SPY","exch":"J","price":"281.8599","size":"100","cvol":"16209108","date":"1557757190000","last":"281.8599"}';
+QUOTE = '{"type":"quote","symbol":"SPY","bid":281.84,"bidsz":60,"bidexch":"M","biddate":"1557757189000","ask":281.85,"asksz":6,"askexch":"Z","askdate":"1557757190000"}';
+
+
+def test_decoder_types_and_converts_fields ():
+	trade, quote = EventDecoder('json').decode(TRADE + '\n' + QUOTE + '\n');
+
+	assert type(trade) is TradeEvent and type(quote) is QuoteEvent;
+	assert (trade.price, trade.size, trade.cumulative_volume, trade.date) == (281.8599, 100, 16209108, 1557757190000);
+	assert (quote.bid, quote.bid_size, quote.ask_exch) == (281.84, 60, 'Z');
+
+
+def test_decoder_handles_bytes_empty_fields_and_unknown_types ():
+	events = EventDecoder('json').decode(b'{"type":"trade","symbol":"SPY","price":"","size":null}\n{"type":"heartbeat"}');
+
+	assert events[0].price is None and events[0].size is None and events[0].exch is None;
+	assert events[1] == {'type':'heartbeat'};
+
+
+def test_decoder_account_events_ignore_heartbeats ():
+	decoder = EventDecoder('json', ACCOUNT_EVENT_TYPES, type_key='event', ignore=('heartbeat',));
+	message = '{"event":"order","id":123,"status":"filled","type":"limit","executed_quantity":"10"}\n{"event":"heartbeat"}';
+
+	[order] = decoder.decode(message);
+
+	assert type(order) is OrderEvent and order.filled and order.order_type == 'limit' and order.executed_quantity == 10.0;
+
+
+def test_events_are_comparable_and_hashable ():
+	decoder = EventDecoder('json');
+	first, second = decoder.decode(TRADE)[0], decoder.decode(TRADE)[0];
+
+	assert first == second and first is not second;
+	assert len({first, second}) == 1;
+	assert first != decoder.decode(QUOTE)[0];
+	assert TradeEvent.from_dict(first.to_dict() | {'cvol':first.cumulative_volume}) == first;
+
+
+#
+# MessageSplitter
+#
+
+MESSAGES = [
+	b'{"type":"trade","symbol":"SPY","price":"281.86"}',
+	b'{"type":"quote","symbol":"A{B}C","note":"braces } { in a string"}',
+	b'{"type":"quote","symbol":"Q","note":"escaped \\" quote and \\\\ backslash }"}',
+	b'{"type":"summary","symbol":"N","nested":{"a":{"b":"}"}},"after":1}',
+	b'{"type":"trade","symbol":"E","note":"\\\\"}'
+];
+
+
+def feed_chunks (splitter, stream, sizes):
+	messages, position = list(), 0;
+	for size in sizes:
+		messages.extend(splitter.feed(stream[position:position + size]));
+		position += size;
+	messages.extend(splitter.feed(stream[position:]));
+	return messages;
+
+
+def test_splitter_whole_stream ():
+	assert MessageSplitter(line_break=False).feed(b''.join(MESSAGES)) == MESSAGES;
+
+	for message in MESSAGES:
+		json.loads(message);
+
+
+def test_splitter_byte_by_byte ():
+	stream = b''.join(MESSAGES);
+	assert feed_chunks(MessageSplitter(line_break=False), stream, [1] * len(stream)) == MESSAGES;
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_splitter_random_chunks (seed):
+	rng = random.Random(seed);
+	stream = b' '.join(MESSAGES * 3);
+	sizes = [rng.randint(1, 40) for _ in range(len(stream) // 4)];
+
+	assert feed_chunks(MessageSplitter(line_break=False), stream, sizes) == MESSAGES * 3;
+
+
+def test_splitter_keeps_state_inside_split_string ():
+	splitter = MessageSplitter(line_break=False);
+
+	assert splitter.feed(b'{"symbol":"SPY","note":"a } and a \\') == [];
+	assert splitter.in_string and splitter.depth == 1;
+	assert splitter.feed(b'" still inside {"') == [];
+	assert splitter.feed(b'}{"symbol":"QQQ"}') == [b'{"symbol":"SPY","note":"a } and a \\" still inside {"}', b'{"symbol":"QQQ"}'];
+	assert splitter.buffer == b'' and splitter.depth == 0 and not splitter.in_string;
+
+
+def test_splitter_line_mode ():
+	splitter = MessageSplitter(line_break=True);
+
+	assert splitter.feed(b'{"a":1}\n{"b"') == [b'{"a":1}'];
+	assert splitter.feed(b':2}\n\n{"c":3}\n') == [b'{"b":2}', b'{"c":3}'];
+	assert splitter.buffer == b'';
@@ -0,0 +1,95 @@
+import json;
+
+import pytest;
+import requests;
+
+from uvatradier import Account, Quotes;
+from uvatradier.json_decoder import get_json_loads;
+from uvatradier.transport import Transport;
+
+
+def ok (method, path, body):
+	return 200, {'Content-Type':'application/json'}, '{"ok": true}';
+
+
+def test_same_credentials_share_a_transport ():
+	quotes = Quotes('acct', 'shared-token');
+	account = Account('acct', 'shared-token');
+
+	assert quotes.transport is account.transport;
+	assert Quotes('acct', 'other-token').transport is not quotes.transport;
+	assert Quotes('acct', 'shared-token', live_trade=True).transport is not quotes.transport;
+
+
+def test_keep_alive_reuses_one_connection (local_server):
+	server = local_server(ok);
+	transport = Transport(rate_limiter=False, retry=False);
+
+	for _ in range(5):
+		assert transport.get(server.url + '/v1/ping').json() == {'ok': True};
+
+	assert len({port for *_, port in server.requests}) == 1;
+
+
+def test_keep_alive_off_opens_a_connection_per_request (local_server):
+	server = local_server(ok);
+	transport = Transport(rate_limiter=False, retry=False, keep_alive=False);
+
+	for _ in range(3):
+		transport.get(server.url + '/v1/ping');
+
+	assert len({port for *_, port in server.requests}) == 3;
+
+
+def test_default_timeout_applied (monkeypatch):
+	transport = Transport(rate_limiter=False, retry=False, timeout=(1, 2));
+	seen = dict();
+
+	def fake_request (**kwargs):
+		seen.update(kwargs);
+		raise requests.exceptions.ConnectionError('offline');
+
+	monkeypatch.setattr(transport.session, 'request', fake_request);
+
+	with pytest.raises(requests.exceptions.ConnectionError):
+		transport.get('http://127.0.0.1/v1/ping');
+	assert seen['timeout'] == (1, 2);
+
+
+def test_json_decoded_once_with_configured_decoder (local_server):
+	server = local_server(ok);
+	decoded = list();
+
+	def loads (data):
+		decoded.append(data);
+		return json.loads(data);
+
+	r = Transport(rate_limiter=False, retry=False, json_decoder=loads).get(server.url + '/v1/ping');
+
+	assert r.json() == {'ok': True};
+	assert r.json() is r.json();
+	assert decoded == [b'{"ok": true}'];
+
+
+def test_invalid_json_raises_requests_error (local_server):
+	server = local_server(lambda method, path, body: (200, {'Content-Type':'application/json'}, '{"ok": tru'));
+
+	for decoder in ('auto', 'json'):
+		r = Transport(rate_limiter=False, retry=False, json_decoder=decoder).get(server.url + '/v1/ping');
+		with pytest.raises(requests.exceptions.JSONDecodeError):
+			r.json();
+
+
+def test_get_json_loads ():
+	assert get_json_loads('json') is json.loads;
+	assert get_json_loads(len) is len;
+
+	with pytest.raises(ValueError):
+		get_json_loads('simdjson');
+
+
+def test_get_json_loads_prefers_orjson ():
+	orjson = pytest.importorskip('orjson');
+
+	assert get_json_loads('auto') is orjson.loads;
+	assert get_json_loads('orjson') is orjson.loads;
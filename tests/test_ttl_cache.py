@@ -0,0 +1,83 @@
+import os;
+import threading;
+
+import pytest;
+
+from uvatradier.ttl_cache import TTLCache, freeze, thaw;
+
+
+def test_values_are_frozen_and_shared ():
+	cache = TTLCache();
+	cache.set(('expirations', 'SPY'), {'date': ['2024-10-18', '2024-10-25']});
+
+	value = cache.get(('expirations', 'SPY'));
+
+	assert value is cache.get(('expirations', 'SPY'));
+	assert value['date'] == ('2024-10-18', '2024-10-25');
+	with pytest.raises(TypeError):
+		value['date'] = [];
+	assert thaw(value) == {'date': ['2024-10-18', '2024-10-25']};
+
+
+def test_get_or_fetch_fetches_once ():
+	cache = TTLCache();
+	calls = [];
+	barrier = threading.Barrier(8);
+	results = [];
+
+	def fetch ():
+		calls.append(1);
+		return ['2024-10-18'];
+
+	def work ():
+		barrier.wait();
+		results.append(cache.get_or_fetch(('expirations', 'SPY'), fetch));
+
+	threads = [threading.Thread(target=work) for _ in range(8)];
+	for thread in threads:
+		thread.start();
+	for thread in threads:
+		thread.join();
+
+	assert len(calls) == 1;
+	assert all(result == ('2024-10-18',) for result in results);
+
+
+def test_persisted_entries_round_trip (tmp_path):
+	TTLCache(path=str(tmp_path)).set(('expirations', 'SPY', 'strikes'), {'expiration': [{'date': '2024-10-18'}]});
+
+	value = TTLCache(path=str(tmp_path)).get(('expirations', 'SPY', 'strikes'));
+
+	assert thaw(value) == {'expiration': [{'date': '2024-10-18'}]};
+	assert TTLCache(path=str(tmp_path)).get(('expirations', 'SPY')) is None;
+
+
+@pytest.mark.parametrize('persist', [False, True])
+def test_invalidate_matches_whole_symbols (tmp_path, persist):
+	path = str(tmp_path) if persist else None;
+	cache = TTLCache(path=path);
+
+	for key in [('expirations', 'BRK'), ('expirations', 'BRK-B'), ('expirations', 'BRK-B', 'strikes'), ('options_symbols', 'BRK-B')]:
+		cache.set(key, [key[1]]);
+
+	cache.invalidate('BRK');
+
+	fresh = TTLCache(path=path) if persist else cache;
+	assert fresh.get(('expirations', 'BRK')) is None;
+	assert fresh.get(('expirations', 'BRK-B')) == ('BRK-B',);
+	assert fresh.get(('expirations', 'BRK-B', 'strikes')) == ('BRK-B',);
+
+	cache.invalidate('brk-b', kind='expirations');
+
+	fresh = TTLCache(path=path) if persist else cache;
+	assert fresh.get(('expirations', 'BRK-B')) is None;
+	assert fresh.get(('expirations', 'BRK-B', 'strikes')) is None;
+	assert fresh.get(('options_symbols', 'BRK-B')) == ('BRK-B',);
+
+	if persist:
+		assert os.listdir(os.path.join(path, 'expirations')) == [];
+
+
+def test_freeze_leaves_scalars ():
+	assert freeze('SPY') == 'SPY';
+	assert freeze([1, [2, 3]]) == (1, (2, 3));
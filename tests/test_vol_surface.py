@@ -0,0 +1,100 @@
+import numpy as np;
+import pandas as pd;
+
+from uvatradier.greeks import bs_price;
+from uvatradier.occ import build_occ;
+from uvatradier.vol_surface import VolSurface;
+
+
+NOW = pd.Timestamp('2024-10-01 10:00');
+EXPIRIES = ['2024-11-15', '2024-12-20'];
+STRIKES = np.arange(80.0, 125.0, 5.0);
+SIGMA = 0.25;
+
+
+def chain (spot=100.0, sigma=SIGMA, expiries=EXPIRIES):
+	rows = [(expiry, strike, option_type) for expiry in expiries for strike in STRIKES for option_type in ('call', 'put')];
+	expiry, strike, option_type = (np.array(column) for column in zip(*rows));
+
+	T = (pd.to_datetime(expiry) + pd.Timedelta(hours=16) - NOW) / pd.Timedelta(days=365);
+	price = bs_price(spot, strike, T.to_numpy(), sigma, option_type);
+
+	return pd.DataFrame({
+		'symbol' 			: build_occ('XYZ', expiry, option_type, strike),
+		'strike' 			: strike,
+		'option_type' 		: option_type,
+		'expiration_date' 	: expiry,
+		'bid' 				: price,
+		'ask' 				: price
+	});
+
+
+def test_empty_surface_moves_underlying ():
+	surface = VolSurface(100);
+
+	assert surface.set_underlying_price(101) == {'contracts':0, 'expiries':0};
+	assert surface.underlying_price == 101.0;
+	assert surface.grid().empty;
+
+
+def test_update_fits_every_expiry ():
+	surface = VolSurface(100);
+
+	assert surface.update(chain(), valuation_time=NOW) == {'contracts':len(STRIKES) * 4, 'expiries':2};
+	assert list(surface.expiries()) == list(pd.to_datetime(EXPIRIES));
+	np.testing.assert_allclose(surface.iv(EXPIRIES[0], strike=[90, 100, 110]), SIGMA, atol=1e-4);
+
+
+def test_update_only_resolves_changed_contracts ():
+	surface = VolSurface(100);
+	surface.update(chain(), valuation_time=NOW);
+
+	assert surface.update(chain(), valuation_time=NOW) == {'contracts':0, 'expiries':0};
+
+	changed = chain(sigma=0.3).iloc[:2];
+	assert surface.update(changed, valuation_time=NOW) == {'contracts':2, 'expiries':1};
+	np.testing.assert_allclose(surface.points.loc[changed['symbol'], 'iv'].to_numpy(), 0.3, atol=1e-6);
+
+
+def test_update_quotes_parses_symbols ():
+	surface = VolSurface(100);
+	surface.update(chain(), valuation_time=NOW);
+
+	quote = chain(sigma=0.3).iloc[[5]];
+	quotes = [{'symbol':quote['symbol'].iloc[0], 'bid':quote['bid'].iloc[0], 'ask':quote['ask'].iloc[0]}];
+
+	assert surface.update_quotes(quotes, valuation_time=NOW) == {'contracts':1, 'expiries':1};
+	assert abs(surface.points.loc[quote['symbol'].iloc[0], 'iv'] - 0.3) < 1e-6;
+
+
+def test_underlying_moves_resolve_past_tolerance ():
+	surface = VolSurface(100, spot_tolerance=0.001);
+	surface.update(chain(), valuation_time=NOW);
+
+	assert surface.set_underlying_price(100.05, valuation_time=NOW) == {'contracts':0, 'expiries':0};
+	assert surface.set_underlying_price(102, valuation_time=NOW) == {'contracts':len(STRIKES) * 4, 'expiries':2};
+	assert surface.underlying_price == 102.0;
+
+
+def test_merge_with_underlying_move_resolves_everything ():
+	surface = VolSurface(100);
+	surface.update(chain(expiries=EXPIRIES[:1]), valuation_time=NOW);
+
+	result = surface.update(chain(spot=105, expiries=EXPIRIES[1:]), underlying_price=105, valuation_time=NOW);
+
+	assert result == {'contracts':len(STRIKES) * 4, 'expiries':2};
+	np.testing.assert_allclose(surface.iv(EXPIRIES[1], moneyness=0.0), SIGMA, atol=1e-4);
+
+
+def test_grid_and_smiles ():
+	surface = VolSurface(100);
+	surface.update(chain(), valuation_time=NOW);
+
+	moneyness = np.linspace(-0.1, 0.1, 5);
+	grid = surface.grid(moneyness);
+
+	assert grid.shape == (2, 5);
+	assert list(grid.index) == list(pd.to_datetime(EXPIRIES));
+	np.testing.assert_allclose(grid.to_numpy(), SIGMA, atol=1e-3);
+	assert list(surface.smiles().columns) == ['T', 'forward', 'c2', 'c1', 'c0'];
+	assert np.isnan(surface.iv('2025-01-17', moneyness=0.0));
@@ -1,9 +1,24 @@
 from .base import Tradier
+from .transport import Transport
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .bar_store import BarStore
+from .chain_store import ChainStore
+from .ttl_cache import TTLCache
+from .schemas import SCHEMAS, COMPACT_SCHEMAS
+from .occ import parse_occ, build_occ
+from .expiry_index import ExpiryIndex
+from .greeks import bs_price, bs_greeks, implied_volatility, chain_greeks
+from .vol_surface import VolSurface
+from .stream_events import EventDecoder, TradeEvent, TradexEvent, QuoteEvent, SummaryEvent, TimesaleEvent, OrderEvent
+from .event_queue import EventQueue, StreamClosed
+from .event_stream import EventStream, MarketEventStream, ShardedMarketStream, AccountEventStream, StaleStream
 from .account import Account
 from .quotes import Quotes
 from .equity_order import EquityOrder
 from .options_data import OptionsData
 from .options_order import OptionsOrder
 from .stream import Stream
+from .async_client import AsyncAccount, AsyncQuotes, AsyncOptionsData, AsyncEquityOrder, AsyncOptionsOrder
 
 print('wahoowa')
@@ -3,10 +3,11 @@ import pandas as pd
 from requests.exceptions import RequestException, JSONDecodeError;
 
 from .base import Tradier
+from .schemas import records_to_frame, GAINLOSS_SCHEMA, POSITIONS_SCHEMA
 
 class Account (Tradier):
-	def __init__ (self, account_number, auth_token, live_trade=False):
-		Tradier.__init__(self, account_number, auth_token, live_trade);
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None):
+		Tradier.__init__(self, account_number, auth_token, live_trade, transport);
 		
 		#
 		# Account endpoints
@@ -65,7 +66,7 @@ class Account (Tradier):
 		'''
 
 		try:
-			r = requests.get(
+			r = self.transport.get(
 				url 	= f"{self.BASE_URL}/{self.PROFILE_ENDPOINT}",
 				params 	= {},
 				headers = self.REQUESTS_HEADERS
@@ -74,10 +75,12 @@ class Account (Tradier):
 			# We good?
 			r.raise_for_status();
 
-			if 'profile' not in r.json():
+			data = r.json();
+
+			if 'profile' not in data:
 				raise KeyError("API response missing 'profile'");
 
-			return pd.json_normalize(r.json()['profile']) if not is_sole_account else pd.json_normalize(r.json()['profile']).iloc[0];
+			return pd.json_normalize(data['profile']) if not is_sole_account else pd.json_normalize(data['profile']).iloc[0];
 
 		except requests.exceptions.RequestException as e:
 			print(f"ERROR [garbage request, get_user_profile] -> {e}");
@@ -141,7 +144,7 @@ class Account (Tradier):
 		'''
 
 		try:
-			r = requests.get(
+			r = self.transport.get(
 				url = f"{self.BASE_URL}/{self.ACCOUNT_BALANCE_ENDPOINT}",
 				params = {},
 				headers = self.REQUESTS_HEADERS
@@ -150,10 +153,12 @@ class Account (Tradier):
 			# We good?
 			r.raise_for_status();
 
-			if 'balances' not in r.json():
+			data = r.json();
+
+			if 'balances' not in data:
 				raise KeyError("API response missing 'balances'");
 
-			return pd.json_normalize(r.json()['balances']) if not return_as_series else pd.Series(r.json()['balances']);
+			return pd.json_normalize(data['balances']) if not return_as_series else pd.Series(data['balances']);
 
 		except requests.exceptions.RequestException as e:
 			print(f"ERROR [bad request, f(x) = Account.get_account_balance] -> {e}");
@@ -187,17 +192,17 @@ class Account (Tradier):
 			# Retrieve the most recent 100 records sorted from most->least recent date on which position was closed.
 			acct.get_gainloss()
 			                  close_date     cost  gain_loss  gain_loss_percent  ... proceeds  quantity  symbol term
-			0   2024-09-27T00:00:00.000Z  1933.10     343.90              17.79  ...  2277.00      10.0    AAPL  116
-			1   2024-09-16T00:00:00.000Z    28.66      -0.53              -1.85  ...    28.13       1.0     HAL    7
-			2   2024-09-16T00:00:00.000Z    37.52      -1.16              -3.09  ...    36.36      -1.0       B    7
-			3   2024-09-09T00:00:00.000Z   172.80       0.00               0.00  ...   172.80      40.0     VVR   10
-			4   2024-09-09T00:00:00.000Z   121.25      15.52              12.80  ...   136.77      97.0     VLD   10
+			0   2024-09-27 00:00:00+00:00  1933.10     343.90              17.79  ...  2277.00      10.0    AAPL  116
+			1   2024-09-16 00:00:00+00:00    28.66      -0.53              -1.85  ...    28.13       1.0     HAL    7
+			2   2024-09-16 00:00:00+00:00    37.52      -1.16              -3.09  ...    36.36      -1.0       B    7
+			3   2024-09-09 00:00:00+00:00   172.80       0.00               0.00  ...   172.80      40.0     VVR   10
+			4   2024-09-09 00:00:00+00:00   121.25      15.52              12.80  ...   136.77      97.0     VLD   10
 			..                       ...      ...        ...                ...  ...      ...       ...     ...  ...
-			95  2024-08-30T00:00:00.000Z   170.03       0.48               0.28  ...   170.51       1.0      PG    1
-			96  2024-08-30T00:00:00.000Z     6.08      -0.42              -6.91  ...     5.66      32.0    OPTT    8
-			97  2024-08-30T00:00:00.000Z  1125.74       7.84               0.70  ...  1133.58       7.0   GOOGL    1
-			98  2024-08-30T00:00:00.000Z   530.70       6.10               1.15  ...   536.80     122.0    FTCO    1
-			99  2024-08-30T00:00:00.000Z     5.76       0.10               1.74  ...     5.86       2.0   CURLF    1
+			95  2024-08-30 00:00:00+00:00   170.03       0.48               0.28  ...   170.51       1.0      PG    1
+			96  2024-08-30 00:00:00+00:00     6.08      -0.42              -6.91  ...     5.66      32.0    OPTT    8
+			97  2024-08-30 00:00:00+00:00  1125.74       7.84               0.70  ...  1133.58       7.0   GOOGL    1
+			98  2024-08-30 00:00:00+00:00   530.70       6.10               1.15  ...   536.80     122.0    FTCO    1
+			99  2024-08-30 00:00:00+00:00     5.76       0.10               1.74  ...     5.86       2.0   CURLF    1
 
 			[100 rows x 9 columns]
 
@@ -205,17 +210,17 @@ class Account (Tradier):
 			# Retrieve the first 100 closed positions sorted by increasing `close_date`
 			acct.get_gainloss(sort_direction='asc')
 			                  close_date      cost  gain_loss  gain_loss_percent                 open_date  proceeds  quantity symbol  term
-			0   2023-08-31T00:00:00.000Z   3443.90    -140.90              -4.09  2023-07-24T00:00:00.000Z   3303.00      10.0   MSFT    38
-			1   2023-09-06T00:00:00.000Z  16967.00    -193.00              -1.14  2023-09-01T00:00:00.000Z  16774.00     100.0    TXN     5
-			2   2023-09-06T00:00:00.000Z   5101.20      -6.70              -0.13  2023-09-06T00:00:00.000Z   5094.50      10.0   KLAC     0
-			3   2023-09-06T00:00:00.000Z   5101.20       1.20               0.02  2023-09-06T00:00:00.000Z   5102.40      10.0   KLAC     0
-			4   2023-09-06T00:00:00.000Z   5100.80       2.40               0.05  2023-09-06T00:00:00.000Z   5103.20      10.0   KLAC     0
+			0   2023-08-31 00:00:00+00:00   3443.90    -140.90              -4.09  2023-07-24 00:00:00+00:00   3303.00      10.0   MSFT    38
+			1   2023-09-06 00:00:00+00:00  16967.00    -193.00              -1.14  2023-09-01 00:00:00+00:00  16774.00     100.0    TXN     5
+			2   2023-09-06 00:00:00+00:00   5101.20      -6.70              -0.13  2023-09-06 00:00:00+00:00   5094.50      10.0   KLAC     0
+			3   2023-09-06 00:00:00+00:00   5101.20       1.20               0.02  2023-09-06 00:00:00+00:00   5102.40      10.0   KLAC     0
+			4   2023-09-06 00:00:00+00:00   5100.80       2.40               0.05  2023-09-06 00:00:00+00:00   5103.20      10.0   KLAC     0
 			..                       ...       ...        ...                ...                       ...       ...       ...    ...   ...
-			95  2024-08-20T00:00:00.000Z    122.60      -0.14              -0.11  2024-08-20T00:00:00.000Z    122.46       2.0      C     0
-			96  2024-08-20T00:00:00.000Z   1886.70       4.30               0.23  2024-08-20T00:00:00.000Z   1891.00       2.0    LLY     0
-			97  2024-08-20T00:00:00.000Z     45.00      -0.15              -0.33  2024-08-20T00:00:00.000Z     44.85       1.0    WMB     0
-			98  2024-08-20T00:00:00.000Z    693.24      -4.24              -0.61  2024-08-20T00:00:00.000Z    689.00       2.0   SPOT     0
-			99  2024-08-20T00:00:00.000Z    948.00      -0.11              -0.01  2024-08-20T00:00:00.000Z    947.89       1.0    LLY     0
+			95  2024-08-20 00:00:00+00:00    122.60      -0.14              -0.11  2024-08-20 00:00:00+00:00    122.46       2.0      C     0
+			96  2024-08-20 00:00:00+00:00   1886.70       4.30               0.23  2024-08-20 00:00:00+00:00   1891.00       2.0    LLY     0
+			97  2024-08-20 00:00:00+00:00     45.00      -0.15              -0.33  2024-08-20 00:00:00+00:00     44.85       1.0    WMB     0
+			98  2024-08-20 00:00:00+00:00    693.24      -4.24              -0.61  2024-08-20 00:00:00+00:00    689.00       2.0   SPOT     0
+			99  2024-08-20 00:00:00+00:00    948.00      -0.11              -0.01  2024-08-20 00:00:00+00:00    947.89       1.0    LLY     0
 
 			[100 rows x 9 columns]
 
@@ -223,17 +228,17 @@ class Account (Tradier):
 			# Retrieve all closed positions whose ticker symbol begins with `V`
 			acct.get_gainloss(symbol_filter='V')
 			                  close_date    cost  gain_loss  gain_loss_percent                 open_date  proceeds  quantity symbol  term
-			0   2024-09-09T00:00:00.000Z  172.80       0.00               0.00  2024-08-30T00:00:00.000Z    172.80      40.0    VVR    10
-			1   2024-09-09T00:00:00.000Z  121.25      15.52              12.80  2024-08-30T00:00:00.000Z    136.77      97.0    VLD    10
-			2   2024-08-30T00:00:00.000Z   22.65       0.12               0.53  2024-08-29T00:00:00.000Z     22.77       3.0  VWDRY     1
-			3   2024-08-30T00:00:00.000Z   45.30       0.24               0.53  2024-08-29T00:00:00.000Z     45.54       6.0  VWDRY     1
-			4   2024-08-30T00:00:00.000Z   83.05       0.44               0.53  2024-08-29T00:00:00.000Z     83.49      11.0  VWDRY     1
+			0   2024-09-09 00:00:00+00:00  172.80       0.00               0.00  2024-08-30 00:00:00+00:00    172.80      40.0    VVR    10
+			1   2024-09-09 00:00:00+00:00  121.25      15.52              12.80  2024-08-30 00:00:00+00:00    136.77      97.0    VLD    10
+			2   2024-08-30 00:00:00+00:00   22.65       0.12               0.53  2024-08-29 00:00:00+00:00     22.77       3.0  VWDRY     1
+			3   2024-08-30 00:00:00+00:00   45.30       0.24               0.53  2024-08-29 00:00:00+00:00     45.54       6.0  VWDRY     1
+			4   2024-08-30 00:00:00+00:00   83.05       0.44               0.53  2024-08-29 00:00:00+00:00     83.49      11.0  VWDRY     1
 			..                       ...     ...        ...                ...                       ...       ...       ...    ...   ...
-			95  2024-08-21T00:00:00.000Z  551.76      -2.28              -0.41  2024-08-21T00:00:00.000Z    549.48     114.0    VOC     0
-			96  2024-08-21T00:00:00.000Z  140.36      -0.58              -0.41  2024-08-21T00:00:00.000Z    139.78      29.0    VOC     0
-			97  2024-08-21T00:00:00.000Z  121.00      -0.50              -0.41  2024-08-21T00:00:00.000Z    120.50      25.0    VOC     0
-			98  2024-08-21T00:00:00.000Z   24.20      -0.10              -0.41  2024-08-21T00:00:00.000Z     24.10       5.0    VOC     0
-			99  2024-08-21T00:00:00.000Z    4.84      -0.02              -0.41  2024-08-21T00:00:00.000Z      4.82       1.0    VOC     0
+			95  2024-08-21 00:00:00+00:00  551.76      -2.28              -0.41  2024-08-21 00:00:00+00:00    549.48     114.0    VOC     0
+			96  2024-08-21 00:00:00+00:00  140.36      -0.58              -0.41  2024-08-21 00:00:00+00:00    139.78      29.0    VOC     0
+			97  2024-08-21 00:00:00+00:00  121.00      -0.50              -0.41  2024-08-21 00:00:00+00:00    120.50      25.0    VOC     0
+			98  2024-08-21 00:00:00+00:00   24.20      -0.10              -0.41  2024-08-21 00:00:00+00:00     24.10       5.0    VOC     0
+			99  2024-08-21 00:00:00+00:00    4.84      -0.02              -0.41  2024-08-21 00:00:00+00:00      4.82       1.0    VOC     0
 
 			[100 rows x 9 columns]
 
@@ -241,17 +246,17 @@ class Account (Tradier):
 			# Retrieve all positions which were closed between August 30, 2024 and September 09, 2024 [inclusive]
 			acct.get_gainloss(start_date='2024-08-30', end_date='2024-09-09')
 			                  close_date     cost  gain_loss  gain_loss_percent                 open_date  proceeds  quantity symbol  term
-			0   2024-09-09T00:00:00.000Z   172.80       0.00               0.00  2024-08-30T00:00:00.000Z    172.80      40.0    VVR    10
-			1   2024-09-09T00:00:00.000Z   121.25      15.52              12.80  2024-08-30T00:00:00.000Z    136.77      97.0    VLD    10
-			2   2024-09-09T00:00:00.000Z    94.14      -4.23              -4.49  2024-08-30T00:00:00.000Z     89.91       9.0    TME    10
-			3   2024-09-09T00:00:00.000Z  6510.80     -39.70              -0.61  2024-08-30T00:00:00.000Z   6471.10    1985.0    SJT    10
-			4   2024-09-09T00:00:00.000Z     3.50      -0.11              -3.14  2024-08-30T00:00:00.000Z      3.39      14.0   LLAP    10
+			0   2024-09-09 00:00:00+00:00   172.80       0.00               0.00  2024-08-30 00:00:00+00:00    172.80      40.0    VVR    10
+			1   2024-09-09 00:00:00+00:00   121.25      15.52              12.80  2024-08-30 00:00:00+00:00    136.77      97.0    VLD    10
+			2   2024-09-09 00:00:00+00:00    94.14      -4.23              -4.49  2024-08-30 00:00:00+00:00     89.91       9.0    TME    10
+			3   2024-09-09 00:00:00+00:00  6510.80     -39.70              -0.61  2024-08-30 00:00:00+00:00   6471.10    1985.0    SJT    10
+			4   2024-09-09 00:00:00+00:00     3.50      -0.11              -3.14  2024-08-30 00:00:00+00:00      3.39      14.0   LLAP    10
 			..                       ...      ...        ...                ...                       ...       ...       ...    ...   ...
-			95  2024-08-30T00:00:00.000Z   530.70       6.10               1.15  2024-08-29T00:00:00.000Z    536.80     122.0   FTCO     1
-			96  2024-08-30T00:00:00.000Z     5.76       0.10               1.74  2024-08-29T00:00:00.000Z      5.86       2.0  CURLF     1
-			97  2024-08-30T00:00:00.000Z   315.37       2.44               0.77  2024-08-29T00:00:00.000Z    317.81      61.0    CGC     1
-			98  2024-08-30T00:00:00.000Z    48.00       0.64               1.33  2024-08-29T00:00:00.000Z     48.64       8.0    ACB     1
-			99  2024-08-30T00:00:00.000Z  1654.38     -13.16              -0.80  2024-08-29T00:00:00.000Z   1641.22      14.0    XOM     1
+			95  2024-08-30 00:00:00+00:00   530.70       6.10               1.15  2024-08-29 00:00:00+00:00    536.80     122.0   FTCO     1
+			96  2024-08-30 00:00:00+00:00     5.76       0.10               1.74  2024-08-29 00:00:00+00:00      5.86       2.0  CURLF     1
+			97  2024-08-30 00:00:00+00:00   315.37       2.44               0.77  2024-08-29 00:00:00+00:00    317.81      61.0    CGC     1
+			98  2024-08-30 00:00:00+00:00    48.00       0.64               1.33  2024-08-29 00:00:00+00:00     48.64       8.0    ACB     1
+			99  2024-08-30 00:00:00+00:00  1654.38     -13.16              -0.80  2024-08-29 00:00:00+00:00   1641.22      14.0    XOM     1
 
 			[100 rows x 9 columns]
 		'''
@@ -277,7 +282,7 @@ class Account (Tradier):
 			params['end'] = end_date;
 
 		try:
-			r = requests.get(
+			r = self.transport.get(
 				url 	= f"{self.BASE_URL}/{self.ACCOUNT_GAINLOSS_ENDPOINT}",
 				params 	= params,
 				headers = self.REQUESTS_HEADERS
@@ -296,12 +301,12 @@ class Account (Tradier):
 
 			if 'gainloss' not in data:
 				print("API response missing 'gainloss'");
-				print(f"Received: {r.json()}");
+				print(f"Received: {data}");
 				return pd.DataFrame();
 
 			if 'closed_position' not in data['gainloss']:
 				print("API response missing 'closed_position'");
-				print(f"Received: {r.json()}");
+				print(f"Received: {data}");
 				return pd.DataFrame();
 
 			closed_positions = data['gainloss']['closed_position'];
@@ -312,7 +317,7 @@ class Account (Tradier):
 			if isinstance(closed_positions, dict):
 				closed_positions = [closed_positions];
 
-			return pd.json_normalize(closed_positions);
+			return records_to_frame(closed_positions, GAINLOSS_SCHEMA);
 
 		except JSONDecodeError as e:
 			print(f"ERROR - JSON response decoding: {e}");
@@ -350,17 +355,19 @@ class Account (Tradier):
 			[2 rows x 18 columns]
 		'''
 
-		r = requests.get(
+		r = self.transport.get(
 			url 	= f"{self.BASE_URL}/{self.ORDER_ENDPOINT}",
 			params 	= {'includeTags':'true'},
 			headers = self.REQUESTS_HEADERS
 		);
 
-		if r.json()['orders'] == 'null':
+		data = r.json();
+
+		if data['orders'] == 'null':
 			print('You have no current orders.')
 			return pd.DataFrame();
 
-		return pd.json_normalize(r.json()['orders']['order'])
+		return pd.json_normalize(data['orders']['order'])
 
 	def get_positions(self, symbols=False, equities=False, options=False):
 		'''
@@ -395,7 +402,7 @@ class Account (Tradier):
 			options_positions = account.get_positions(options=True)
 		'''
 		try:
-			r = requests.get(
+			r = self.transport.get(
 				url 	= f"{self.BASE_URL}/{self.ACCOUNT_POSITIONS_ENDPOINT}",
 				params 	= {},
 				headers = self.REQUESTS_HEADERS
@@ -412,7 +419,7 @@ class Account (Tradier):
 		if data:
 			if 'positions' in data:
 				if 'position' in data['positions']:
-					positions_df = pd.DataFrame(pd.json_normalize(data['positions']['position']));
+					positions_df = records_to_frame(data['positions']['position'], POSITIONS_SCHEMA);
 					if symbols:
 						positions_df = positions_df.query('symbol in @symbols');
 					if equities:
@@ -0,0 +1,114 @@
+from .account import Account
+from .quotes import Quotes
+from .options_data import OptionsData
+from .equity_order import EquityOrder
+from .options_order import OptionsOrder
+
+import asyncio;
+import functools;
+import inspect;
+from concurrent.futures import ThreadPoolExecutor;
+
+
+DEFAULT_MAX_CONCURRENCY = 32;
+
+
+class ThreadedAsyncTradier:
+	'''
+	Awaitable wrapper around a synchronous Tradier class, running its blocking calls on a thread pool.
+
+	This is not a native asyncio HTTP client: each call occupies one worker thread for its whole duration, including any wait for the
+	rate limiter and any retry backoff. At most `max_concurrency` calls are in flight at once (32 by default); further calls queue until
+	a worker is free. What it provides is an awaitable API, so Tradier calls can be gathered and mixed with other coroutines on one event loop.
+
+	Each Async class wraps an instance of its synchronous twin (Quotes -> AsyncQuotes, etc.), so it shares the same endpoint definitions,
+	argument validation and DataFrame construction. Every public method of the synchronous class is exposed as a coroutine.
+
+	Args:
+		• account_number (str): Tradier account number.
+		• auth_token (str): Tradier API access token.
+		• live_trade (bool, optional): Use the live trading API instead of the sandbox. Default is False.
+		• transport (Transport, optional): Transport to send requests through. Defaults to the transport shared by objects with the same credentials.
+		• max_concurrency (int, optional): Number of worker threads, i.e. the maximum number of calls in flight at once. Default is 32.
+		  The transport's connection pool is grown to at least max_concurrency connections (Transport.ensure_pool_size), so every
+		  call in flight reuses a kept-alive connection.
+		• **client_kwargs: Further arguments of the synchronous class, e.g. bar_store for AsyncQuotes or cache for AsyncOptionsData.
+
+	Notes:
+		• Attributes that are not methods (e.g. endpoint constants such as QUOTES_ENDPOINT) are read straight from the wrapped object.
+		• Call close() (or use `async with`) to shut down the thread pool once you are done.
+
+	Example:
+		>>> async def main ():
+		... 	async with AsyncQuotes(tradier_acct, tradier_token, max_concurrency=16) as quotes:
+		... 		frames = await asyncio.gather(*[quotes.get_historical_quotes(s) for s in ['KO', 'PEP', 'MNST']])
+		>>> asyncio.run(main())
+	'''
+
+	SYNC_CLASS = None;
+
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None, max_concurrency=None, **client_kwargs):
+		self.client = self.SYNC_CLASS(account_number, auth_token, live_trade, transport, **client_kwargs);
+
+		if max_concurrency is None:
+			max_concurrency = DEFAULT_MAX_CONCURRENCY;
+
+		self.client.transport.ensure_pool_size(max_concurrency);
+
+		self.max_concurrency 	= max_concurrency;
+		self.executor 			= ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=type(self).__name__);
+
+	def __getattr__ (self, name):
+		#
+		# Only consulted for attributes not defined on the async object itself
+		#
+
+		if name in ('client', 'executor'):
+			raise AttributeError(name);
+
+		attr = getattr(self.client, name);
+
+		if name.startswith('_') or not inspect.ismethod(attr):
+			return attr;
+
+		@functools.wraps(attr)
+		async def method (*args, **kwargs):
+			return await self.run(attr, *args, **kwargs);
+
+		return method;
+
+	async def run (self, func, *args, **kwargs):
+		'''
+		Run a blocking callable on this object's thread pool and await its result.
+		'''
+		loop = asyncio.get_running_loop();
+		return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs));
+
+	def close (self):
+		self.executor.shutdown(wait=False);
+
+	async def __aenter__ (self):
+		return self;
+
+	async def __aexit__ (self, exc_type, exc, tb):
+		self.close();
+
+
+class AsyncAccount (ThreadedAsyncTradier):
+	SYNC_CLASS = Account;
+
+
+class AsyncQuotes (ThreadedAsyncTradier):
+	SYNC_CLASS = Quotes;
+
+
+class AsyncOptionsData (ThreadedAsyncTradier):
+	SYNC_CLASS = OptionsData;
+
+
+class AsyncEquityOrder (ThreadedAsyncTradier):
+	SYNC_CLASS = EquityOrder;
+
+
+class AsyncOptionsOrder (ThreadedAsyncTradier):
+	SYNC_CLASS = OptionsOrder;
@@ -0,0 +1,169 @@
+import os;
+import threading;
+from datetime import datetime, timedelta;
+
+import pandas as pd;
+
+from .storage import FILE_EXTENSIONS, default_format, write_frame, read_frame, write_json, read_json;
+
+
+def fingerprint (dates):
+	'''
+	Summary of a partition's bar dates stored alongside its coverage, to detect coverage that does not describe the bars on disk.
+	'''
+	if dates.empty:
+		return {'rows':0, 'first':None, 'last':None};
+
+	return {'rows':len(dates), 'first':dates.min().strftime('%Y-%m-%d'), 'last':dates.max().strftime('%Y-%m-%d')};
+
+
+class BarStore:
+	'''
+	Local on-disk store of historical OHLCV bars, partitioned by interval and symbol.
+
+	Quotes.get_historical_quotes consults the store first and only asks Tradier for the part of the requested date range the store
+	does not already cover (typically the tail since the last refresh). New bars are merged in and the partition is rewritten atomically.
+
+	Layout:
+		root/
+			daily/
+				MTB.parquet 		# bars (columns: date, open, high, low, close, volume)
+				MTB.json 			# date range already requested from Tradier, e.g. {"start": "2014-10-01", "end": "2024-10-15", "bars": {...}}
+			weekly/
+			monthly/
+
+	Crash safety: the bars are written before the coverage file, and the coverage file records the bars it describes (row count, first and
+	last date). If they disagree on load (a crash between the two writes, or bars removed by hand), the coverage is recomputed from the
+	stored bars, so it never claims bars that are not on disk.
+
+	Args:
+		• root (str): Directory holding the store. Created on first write.
+		• format (str, optional): 'parquet' or 'pickle'. Defaults to Parquet when pyarrow/fastparquet is installed, else pickle.
+
+	Example:
+		# Keep ten years of daily bars locally and only download what is new on each call
+		>>> quotes = Quotes(tradier_acct, tradier_token, bar_store=BarStore('~/tradier_bars'))
+		>>> quotes.get_historical_quotes('MTB', start_date='2014-10-01') 	# first call downloads the full range
+		>>> quotes.get_historical_quotes('MTB', start_date='2014-10-01') 	# later calls only fetch bars since the last stored date
+	'''
+
+	def __init__ (self, root, format=None):
+		self.root 	= os.path.expanduser(root);
+		self.format = format or default_format();
+
+		if self.format not in FILE_EXTENSIONS:
+			raise ValueError(f"Invalid format. One of: {', '.join(FILE_EXTENSIONS)}");
+
+		self._locks = dict();
+		self._locks_lock = threading.Lock();
+
+	def lock (self, symbol, interval):
+		'''
+		Per-partition lock serializing read-modify-write cycles on the same symbol/interval. Reentrant, so callers can hold it across
+		missing_ranges, the download and merge (as Quotes.get_historical_quotes does).
+		'''
+		with self._locks_lock:
+			return self._locks.setdefault((symbol.upper(), interval), threading.RLock());
+
+	def path (self, symbol, interval):
+		return os.path.join(self.root, interval, f"{symbol.upper()}{FILE_EXTENSIONS[self.format]}");
+
+	def meta_path (self, symbol, interval):
+		return os.path.splitext(self.path(symbol, interval))[0] + '.json';
+
+	def stored_dates (self, symbol, interval):
+		dates = read_frame(self.path(symbol, interval), columns=['date']);
+		return dates['date'] if not dates.empty else pd.Series(dtype='datetime64[ns]');
+
+	def coverage (self, symbol, interval, dates=None):
+		'''
+		Date range (start, end) as 'YYYY-MM-DD' strings already requested from Tradier for this partition, or None if empty.
+		Falls back to the range of the stored bars if the coverage file does not describe them (see the class notes on crash safety).
+		'''
+		dates = self.stored_dates(symbol, interval) if dates is None else dates;
+		meta = read_json(self.meta_path(symbol, interval));
+
+		if meta and meta.get('bars') == fingerprint(dates):
+			return meta['start'], meta['end'];
+
+		if dates.empty:
+			return None;
+
+		return dates.min().strftime('%Y-%m-%d'), dates.max().strftime('%Y-%m-%d');
+
+	def read (self, symbol, interval, start_date=None, end_date=None):
+		'''
+		Stored bars for a symbol/interval, optionally restricted to [start_date, end_date].
+		'''
+		df = read_frame(self.path(symbol, interval));
+
+		if df.empty:
+			return df;
+
+		if start_date is not None:
+			df = df[df['date'] >= pd.Timestamp(start_date)];
+		if end_date is not None:
+			df = df[df['date'] <= pd.Timestamp(end_date)];
+
+		return df.reset_index(drop=True);
+
+	def missing_ranges (self, symbol, interval, start_date, end_date):
+		'''
+		List of (start, end) 'YYYY-MM-DD' ranges that must be requested from Tradier to answer [start_date, end_date].
+
+		Notes:
+			• The last stored bar is always re-requested with the tail, since it may have been stored before its period closed.
+			• Ranges ending today (or later) are always refreshed from the last stored bar onward.
+			• Missing ranges always extend to the edge of the covered range, so the covered range stays contiguous.
+		'''
+		dates = self.stored_dates(symbol, interval);
+		covered = self.coverage(symbol, interval, dates);
+		if covered is None:
+			return [(start_date, end_date)];
+
+		covered_start, covered_end = covered;
+		ranges = list();
+
+		if start_date < covered_start:
+			head_end = (datetime.strptime(covered_start, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d');
+			ranges.append((start_date, head_end));
+
+		today = datetime.today().strftime('%Y-%m-%d');
+		if end_date > covered_end or end_date >= today:
+			last_bar = dates.max().strftime('%Y-%m-%d') if not dates.empty else covered_end;
+			ranges.append((min(last_bar, covered_end), end_date));
+
+		return ranges;
+
+	def merge (self, symbol, interval, bars, start_date, end_date):
+		'''
+		Merge newly downloaded bars (covering the requested range [start_date, end_date]) into the partition and record the covered range.
+		Bars already stored for the same date are replaced by the new ones. The bars are written first and the coverage second.
+		'''
+		path = self.path(symbol, interval);
+
+		with self.lock(symbol, interval):
+			stored = read_frame(path);
+			covered = self.coverage(symbol, interval, stored['date'] if not stored.empty else None);
+
+			if bars is not None and not bars.empty:
+				bars = bars.copy();
+				bars['date'] = pd.to_datetime(bars['date']);
+				stored = pd.concat([stored, bars], ignore_index=True) if not stored.empty else bars;
+				stored = stored.drop_duplicates(subset='date', keep='last').sort_values('date', ignore_index=True);
+				write_frame(stored, path);
+
+			if covered is not None:
+				start_date, end_date = min(start_date, covered[0]), max(end_date, covered[1]);
+
+			dates = stored['date'] if not stored.empty else pd.Series(dtype='datetime64[ns]');
+			write_json({'start':start_date, 'end':end_date, 'bars':fingerprint(dates)}, self.meta_path(symbol, interval));
+
+	def delete (self, symbol, interval):
+		'''
+		Remove a symbol/interval partition from the store.
+		'''
+		with self.lock(symbol, interval):
+			for p in (self.meta_path(symbol, interval), self.path(symbol, interval)):
+				if os.path.exists(p):
+					os.remove(p);
@@ -1,5 +1,8 @@
+from .transport import Transport;
+
+
 class Tradier:
-	def __init__ (self, account_number, auth_token, live_trade=False):
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None):
 
 		#
 		# Define account credentials
@@ -18,4 +21,11 @@ class Tradier:
 		self.SANDBOX_URL 		= 'https://sandbox.tradier.com';
 		self.WEBSOCKET_URL 		= 'wss://ws.tradier.com';
 
-		self.BASE_URL 		= self.LIVETRADE_URL if live_trade else self.SANDBOX_URL;
\ No newline at end of file
+		self.BASE_URL 		= self.LIVETRADE_URL if live_trade else self.SANDBOX_URL;
+
+
+		#
+		# Route every HTTP request through a pooled keep-alive transport shared by objects with the same credentials
+		#
+
+		self.transport = transport if transport is not None else Transport.shared(self.AUTH_TOKEN, self.BASE_URL);
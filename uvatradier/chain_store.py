@@ -0,0 +1,359 @@
+import os;
+import threading;
+
+import numpy as np;
+import pandas as pd;
+
+from .storage import FILE_EXTENSIONS, default_format, write_frame, read_frame, write_json, read_json;
+
+
+class ChainStore:
+	'''
+	Local on-disk store of option chain snapshots, partitioned by underlying and day, with delta compression.
+
+	The first snapshot of a day (and every `keyframe_every`-th one after it) is stored in full as a keyframe. Every other snapshot only
+	stores the cells that changed since the previous snapshot (bid, ask, last, volume, open interest, ...) in long format:
+	one row per changed cell with the contract's row number, the field number and the new value. A new keyframe is also written
+	whenever the set of contracts or columns changes (e.g. a strike is listed intraday).
+
+	Layout:
+		root/
+			SPY/
+				2024-10-18/
+					manifest.json 					# columns, dtypes and the list of snapshots with their kind and file
+					093000000000.parquet 			# keyframe: full chain
+					093100000000.parquet 			# delta: columns row, field, number, integer, text
+					...
+
+	Args:
+		• root (str): Directory holding the store. Created on first write.
+		• format (str, optional): 'parquet' or 'pickle'. Defaults to Parquet when pyarrow/fastparquet is installed, else pickle.
+		• keyframe_every (int, optional): Write a full keyframe every this many snapshots, which bounds the number of deltas
+		  applied to reconstruct any snapshot. Default is 60.
+
+	Notes:
+		• Chains must have a `symbol` column (the OCC symbol), which identifies contracts across snapshots.
+		• Reconstructed snapshots have the keyframe's row order and a fresh RangeIndex.
+
+	Example:
+		# Snapshot SPY chains every minute
+		>>> options_data = OptionsData(tradier_acct, tradier_token, chain_store=ChainStore('~/tradier_chains'))
+		>>> options_data.snapshot_chain('SPY')
+
+		# Read the chain as of 10:15, or replay the whole morning
+		>>> store = options_data.chain_store
+		>>> store.read('SPY', '2024-10-18 10:15')
+		>>> for time, chain in store.replay('SPY', '2024-10-18 09:30', '2024-10-18 12:00'):
+		... 	...
+	'''
+
+	def __init__ (self, root, format=None, keyframe_every=60):
+		self.root 			= os.path.expanduser(root);
+		self.format 		= format or default_format();
+		self.keyframe_every = keyframe_every;
+
+		if self.format not in FILE_EXTENSIONS:
+			raise ValueError(f"Invalid format. One of: {', '.join(FILE_EXTENSIONS)}");
+
+		self._last = dict(); 			# symbol -> (day, time, chain) of the last snapshot written by this process
+		self._locks = dict();
+		self._locks_lock = threading.Lock();
+
+	def lock (self, symbol):
+		with self._locks_lock:
+			return self._locks.setdefault(symbol.upper(), threading.RLock());
+
+	def directory (self, symbol, day):
+		return os.path.join(self.root, symbol.upper(), day);
+
+	def manifest (self, symbol, day):
+		'''
+		Manifest of a symbol/day partition: {'columns': [...], 'dtypes': {...}, 'snapshots': [{'time', 'kind', 'file'}, ...]}, or None.
+		'''
+		return read_json(os.path.join(self.directory(symbol, day), 'manifest.json'));
+
+	def days (self, symbol):
+		'''
+		Days ('YYYY-MM-DD') with snapshots for a symbol, in order.
+		'''
+		directory = os.path.join(self.root, symbol.upper());
+		return sorted(os.listdir(directory)) if os.path.isdir(directory) else list();
+
+	def snapshots (self, symbol, day=None):
+		'''
+		Times of the stored snapshots for a symbol (on one day, or on every day), as a DatetimeIndex.
+		'''
+		days = [day] if day is not None else self.days(symbol);
+		times = [s['time'] for d in days for s in (self.manifest(symbol, d) or {'snapshots':[]})['snapshots']];
+		return pd.DatetimeIndex(pd.to_datetime(times));
+
+	#
+	# Writing
+	#
+
+	def write (self, symbol, chain, time=None):
+		'''
+		Store a chain snapshot taken at `time` (default: now). Returns 'key' or 'delta', the kind of record written.
+		'''
+		if 'symbol' not in chain:
+			raise ValueError("Chain snapshots need a symbol column to identify contracts.");
+
+		time = pd.Timestamp(time) if time is not None else pd.Timestamp.now();
+		day = time.strftime('%Y-%m-%d');
+		chain = chain.reset_index(drop=True);
+
+		with self.lock(symbol):
+			manifest = self.manifest(symbol, day) or {'columns':list(), 'dtypes':dict(), 'snapshots':list()};
+			snapshots = manifest['snapshots'];
+
+			if snapshots and pd.Timestamp(snapshots[-1]['time']) >= time:
+				raise ValueError(f"Snapshot times must increase: {time} is not after {snapshots[-1]['time']}.");
+
+			previous = self.previous_snapshot(symbol, day, manifest);
+			since_keyframe = next((i for i, s in enumerate(reversed(snapshots)) if s['kind'] == 'key'), None);
+
+			is_keyframe = (
+				previous is None or
+				since_keyframe is None or since_keyframe + 1 >= self.keyframe_every or
+				list(previous.columns) != list(chain.columns) or
+				any(previous[c].dtype != chain[c].dtype for c in chain.columns) or
+				not previous['symbol'].equals(chain['symbol'])
+			);
+
+			if not is_keyframe and not chain['symbol'].is_unique:
+				is_keyframe = True;
+
+			file_name = time.strftime('%H%M%S%f') + FILE_EXTENSIONS[self.format];
+			path = os.path.join(self.directory(symbol, day), file_name);
+
+			if is_keyframe:
+				write_frame(chain, path);
+				manifest['columns'] = list(chain.columns);
+				manifest['dtypes'] = {c:str(chain[c].dtype) for c in chain.columns};
+			else:
+				write_frame(diff_chains(previous, chain), path);
+
+			snapshots.append({'time':time.isoformat(), 'kind':'key' if is_keyframe else 'delta', 'file':file_name});
+			write_json(manifest, os.path.join(self.directory(symbol, day), 'manifest.json'));
+
+			self._last[symbol.upper()] = (day, time, chain);
+
+		return 'key' if is_keyframe else 'delta';
+
+	def previous_snapshot (self, symbol, day, manifest):
+		'''
+		Last snapshot of the day, from memory when this process wrote it, otherwise reconstructed from disk.
+		'''
+		if not manifest['snapshots']:
+			return None;
+
+		last = self._last.get(symbol.upper());
+		last_time = pd.Timestamp(manifest['snapshots'][-1]['time']);
+
+		if last is not None and last[0] == day and last[1] == last_time:
+			return last[2];
+
+		return self.read(symbol, last_time);
+
+	#
+	# Reading
+	#
+
+	def read (self, symbol, time):
+		'''
+		Chain as of `time`: the last snapshot taken at or before `time` on that day. Returns an empty DataFrame if there is none.
+		'''
+		time = pd.Timestamp(time);
+		day = time.strftime('%Y-%m-%d');
+
+		manifest = self.manifest(symbol, day);
+		if manifest is None:
+			return pd.DataFrame();
+
+		position = np.searchsorted(pd.to_datetime([s['time'] for s in manifest['snapshots']]), time, side='right') - 1;
+		if position < 0:
+			return pd.DataFrame();
+
+		keyframe = max(i for i in range(position + 1) if manifest['snapshots'][i]['kind'] == 'key');
+
+		for _, chain in self.iter_partition(symbol, day, manifest, keyframe, position, emit_from=position):
+			return chain;
+
+	def replay (self, symbol, start=None, end=None):
+		'''
+		Generator of (time, chain) for every stored snapshot in [start, end]. Deltas are applied incrementally,
+		so replaying a day costs one keyframe read per keyframe plus one small delta read per snapshot.
+		'''
+		start = pd.Timestamp(start) if start is not None else None;
+		end = pd.Timestamp(end) if end is not None else None;
+
+		for day in self.days(symbol):
+			if (start is not None and day < start.strftime('%Y-%m-%d')) or (end is not None and day > end.strftime('%Y-%m-%d')):
+				continue;
+
+			manifest = self.manifest(symbol, day);
+			times = pd.to_datetime([s['time'] for s in manifest['snapshots']]);
+
+			first = np.searchsorted(times, start, side='left') if start is not None else 0;
+			last = np.searchsorted(times, end, side='right') - 1 if end is not None else len(times) - 1;
+			if last < first:
+				continue;
+
+			keyframe = max(i for i in range(first + 1) if manifest['snapshots'][i]['kind'] == 'key');
+
+			for i, chain in self.iter_partition(symbol, day, manifest, keyframe, last, emit_from=first):
+				yield times[i], chain;
+
+	def iter_partition (self, symbol, day, manifest, first, last, emit_from=None):
+		'''
+		Generator of (position, chain) reconstructing snapshots first..last of a day. Snapshot `first` must be a keyframe.
+		DataFrames are only built for positions from `emit_from` (default: first) onward; earlier snapshots are just applied.
+		'''
+		emit_from = first if emit_from is None else emit_from;
+
+		directory = self.directory(symbol, day);
+		snapshots = manifest['snapshots'];
+		columns = arrays = None;
+
+		for i in range(first, last + 1):
+			record = read_frame(os.path.join(directory, snapshots[i]['file']));
+
+			if snapshots[i]['kind'] == 'key':
+				columns = list(record.columns);
+				arrays = {c:record[c].to_numpy(copy=True) for c in columns};
+				dtypes = {c:record[c].dtype for c in columns};
+			else:
+				apply_delta(arrays, dtypes, columns, record);
+
+			if i < emit_from:
+				continue;
+
+			yield i, pd.DataFrame({c:pd.array(arrays[c], dtype=dtypes[c]) if isinstance(dtypes[c], pd.api.extensions.ExtensionDtype) else arrays[c].copy() for c in columns});
+
+	def delete (self, symbol, day=None):
+		'''
+		Remove a symbol's snapshots for one day, or for every day.
+		'''
+		with self.lock(symbol):
+			for d in ([day] if day is not None else self.days(symbol)):
+				directory = self.directory(symbol, d);
+				if os.path.isdir(directory):
+					for file_name in os.listdir(directory):
+						os.remove(os.path.join(directory, file_name));
+					os.rmdir(directory);
+
+			self._last.pop(symbol.upper(), None);
+
+
+#
+# Delta encoding: one row per changed cell -> (row, field, number | integer | text)
+#
+
+def value_kind (dtype):
+	'''
+	'number' for floats, 'integer' for integers/booleans/datetimes (exact as int64), 'text' for everything else.
+	'''
+	if pd.api.types.is_float_dtype(dtype):
+		return 'number';
+	if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_datetime64_dtype(dtype):
+		return 'integer';
+	return 'text';
+
+
+def diff_chains (previous, current):
+	'''
+	Long-format delta of the cells that differ between two chains with identical contracts, columns and dtypes.
+	'''
+	rows, fields, numbers, integers, integer_nulls, texts = list(), list(), list(), list(), list(), list();
+
+	for field, column in enumerate(current.columns):
+		if column == 'symbol':
+			continue;
+
+		before = previous[column].to_numpy();
+		after = current[column].to_numpy();
+
+		#
+		# Only compare cells present in both snapshots: nullable columns hold pd.NA, which has no truth value
+		#
+
+		missing_before, missing_after = pd.isna(before), pd.isna(after);
+		present = ~missing_before & ~missing_after;
+
+		equal = missing_before & missing_after;
+		equal[present] = before[present] == after[present];
+		changed = np.flatnonzero(~equal);
+
+		if not len(changed):
+			continue;
+
+		dtype = current[column].dtype;
+		kind = value_kind(dtype);
+		values = after[changed];
+		missing = missing_after[changed];
+		n = len(changed);
+
+		rows.append(changed.astype(np.int32));
+		fields.append(np.full(n, field, dtype=np.int16));
+		numbers.append(values.astype(np.float64) if kind == 'number' else np.full(n, np.nan));
+		texts.append(np.where(missing, None, values.astype(str)).astype(object) if kind == 'text' else np.full(n, None, dtype=object));
+
+		if kind != 'integer':
+			integers.append(np.zeros(n, dtype=np.int64));
+			integer_nulls.append(np.ones(n, dtype=bool));
+		elif values.dtype.kind == 'M':
+			integers.append(values.view(np.int64));
+			integer_nulls.append(np.zeros(n, dtype=bool));
+		else:
+			integers.append(np.where(missing, 0, values).astype(np.int64));
+			integer_nulls.append(missing);
+
+	if not rows:
+		rows, fields, numbers, integers, integer_nulls, texts = [np.zeros(0, dtype=np.int32)], [np.zeros(0, dtype=np.int16)], [np.zeros(0)], [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=bool)], [np.zeros(0, dtype=object)];
+
+	delta = pd.DataFrame({
+		'row' 		: np.concatenate(rows),
+		'field' 	: np.concatenate(fields),
+		'number' 	: np.concatenate(numbers),
+		'integer' 	: pd.arrays.IntegerArray(np.concatenate(integers), np.concatenate(integer_nulls)),
+		'text' 		: pd.array(np.concatenate(texts), dtype=object)
+	});
+
+	#
+	# Value columns no changed field uses are left out of the record
+	#
+
+	kinds = {value_kind(current[current.columns[field]].dtype) for field in np.unique(delta['field'])};
+
+	return delta[['row', 'field'] + [kind for kind in ('number', 'integer', 'text') if kind in kinds]];
+
+
+def apply_delta (arrays, dtypes, columns, delta):
+	'''
+	Apply a delta written by diff_chains in place to the column arrays of the previous snapshot.
+	'''
+	if delta.empty:
+		return;
+
+	fields = delta['field'].to_numpy();
+	rows = delta['row'].to_numpy();
+
+	for field in np.unique(fields):
+		selected = fields == field;
+		column = columns[field];
+		target = arrays[column];
+		kind = value_kind(dtypes[column]);
+
+		if kind == 'number':
+			target[rows[selected]] = delta['number'].to_numpy()[selected];
+		elif kind == 'integer':
+			values = delta['integer'].to_numpy(dtype=np.int64, na_value=0)[selected];
+			nulls = delta['integer'].isna().to_numpy()[selected];
+			if target.dtype.kind == 'M':
+				target[rows[selected]] = values.view(target.dtype);
+			elif target.dtype == object:
+				target[rows[selected]] = np.where(nulls, None, values.astype(object));
+			else:
+				target[rows[selected]] = values.astype(target.dtype);
+		else:
+			target[rows[selected]] = delta['text'].to_numpy()[selected];
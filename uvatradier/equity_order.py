@@ -5,8 +5,8 @@ import pandas as pd
 
 
 class EquityOrder (Tradier):
-	def __init__ (self, account_number, auth_token, live_trade=False):
-		Tradier.__init__(self, account_number, auth_token, live_trade);
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None):
+		Tradier.__init__(self, account_number, auth_token, live_trade, transport);
 
 		#
 		# Order endpoint
@@ -50,7 +50,7 @@ class EquityOrder (Tradier):
 		if order_type.lower() in ['stop', 'stop_limit']:
 			r_params['stop'] = stop_price
 
-		r = requests.post(
+		r = self.transport.post(
 			url = '{}/{}'.format(self.BASE_URL, self.ORDER_ENDPOINT),
 			params = r_params,
 			headers=self.REQUESTS_HEADERS
@@ -66,7 +66,7 @@ class EquityOrder (Tradier):
 			Returns:
 				requests.delete.json() response from Tradier API.
 		'''
-		r = requests.delete(
+		r = self.transport.delete(
 			url = f"{self.BASE_URL}/{self.ORDER_ENDPOINT}/{order_id}",
 			headers = self.REQUESTS_HEADERS
 		)
@@ -0,0 +1,201 @@
+import time;
+import asyncio;
+
+from collections import deque;
+
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'coalesce');
+
+
+class StreamClosed (Exception):
+	'''
+	Raised by EventQueue.get once the queue is closed and drained.
+	'''
+
+
+def event_key (event):
+	'''
+	Coalescing key of an event: (type, symbol) for typed events, None (never coalesced) for raw messages and unknown event types.
+	'''
+	symbol = getattr(event, 'symbol', None);
+	return (event.TYPE, symbol) if symbol is not None else None;
+
+
+class EventQueue:
+	'''
+	Bounded asyncio queue between a stream's socket reader and its consumer, with a configurable overflow policy and backpressure metrics.
+
+	Overflow policies (what put does when the queue holds `maxsize` events):
+		• 'block': wait for the consumer to make room. The socket reader stops reading, which pushes back on the server (TCP flow control).
+		• 'drop_oldest': discard the oldest queued event to make room. The reader never waits.
+		• 'coalesce': keep only the latest pending event per key (default: event type and symbol). A new event replaces the queued one for
+		  its key in place, so the queue holds at most one quote per symbol and the consumer always sees the latest values. Events without
+		  a key, or with a new key while the queue is full, wait for room as with 'block'.
+
+	Args:
+		• maxsize (int, optional): Maximum number of queued events. Default is 10000.
+		• overflow (str, optional): One of 'block', 'drop_oldest' or 'coalesce'. Default is 'block'.
+		• key (callable, optional): Coalescing key of an event, or None for events that must not be coalesced. Default is event_key.
+
+	Example:
+		>>> queue = EventQueue(maxsize=1000, overflow='coalesce')
+		>>> await queue.put(event) 		# in the reader
+		>>> event = await queue.get() 	# in the consumer
+		>>> queue.stats()
+		{'depth': 12, 'max_depth': 1000, 'maxsize': 1000, 'overflow': 'coalesce', 'received': 5120, 'delivered': 3408, 'dropped': 0, 'coalesced': 1700, 'blocked': 3, 'blocked_seconds': 0.021}
+	'''
+
+	def __init__ (self, maxsize=10000, overflow='block', key=event_key):
+		if overflow not in OVERFLOW_POLICIES:
+			raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, not {overflow!r}.");
+		if maxsize < 1:
+			raise ValueError("maxsize must be at least 1.");
+
+		self.maxsize 	= maxsize;
+		self.overflow 	= overflow;
+		self.key 		= key;
+
+		#
+		# Queued items are events, or [key, event] cells when coalescing (so a newer event can replace a queued one in place)
+		#
+
+		self._items 	= deque();
+		self._pending 	= dict(); 	# key -> cell, coalesce only
+
+		self._not_empty = asyncio.Event();
+		self._not_full 	= asyncio.Event();
+
+		self.closed 	= False;
+		self.exception 	= None;
+
+		self.max_depth 			= 0;
+		self.received 			= 0;
+		self.delivered 			= 0;
+		self.dropped 			= 0;
+		self.coalesced 			= 0;
+		self.blocked 			= 0;
+		self.blocked_seconds 	= 0.0;
+
+	def __len__ (self):
+		return len(self._items);
+
+	def full (self):
+		return len(self._items) >= self.maxsize;
+
+	async def put (self, event):
+		'''
+		Queue an event, applying the overflow policy if the queue is full. Events put after close() are ignored.
+		'''
+		if self.closed:
+			return;
+
+		self.received += 1;
+
+		if self.overflow == 'coalesce':
+			key = self.key(event);
+			if key is not None and self._coalesce(key, event):
+				return;
+
+			if self.full():
+				await self._wait_for_room();
+				if self.closed or (key is not None and self._coalesce(key, event)):
+					return;
+
+			self._append([key, event] if key is None else self._pending.setdefault(key, [key, event]));
+			return;
+
+		if self.full():
+			if self.overflow == 'drop_oldest':
+				self._items.popleft();
+				self.dropped += 1;
+			else:
+				await self._wait_for_room();
+				if self.closed:
+					return;
+
+		self._append(event);
+
+	def _coalesce (self, key, event):
+		cell = self._pending.get(key);
+		if cell is None:
+			return False;
+
+		cell[1] = event;
+		self.coalesced += 1;
+		return True;
+
+	def _append (self, item):
+		self._items.append(item);
+		self.max_depth = max(self.max_depth, len(self._items));
+		self._not_empty.set();
+
+	async def _wait_for_room (self):
+		self.blocked += 1;
+		start = time.monotonic();
+
+		while self.full() and not self.closed:
+			self._not_full.clear();
+			await self._not_full.wait();
+
+		self.blocked_seconds += time.monotonic() - start;
+
+	async def get (self):
+		'''
+		Next event, waiting for one if the queue is empty.
+
+		Raises:
+			• StreamClosed: The queue was closed and every queued event has been delivered.
+			• Exception: The exception the queue was closed with (e.g. the connection error that ended the stream), once drained.
+		'''
+		while not self._items:
+			if self.closed:
+				if self.exception is not None:
+					raise self.exception;
+				raise StreamClosed();
+			self._not_empty.clear();
+			await self._not_empty.wait();
+
+		item = self._items.popleft();
+
+		if self.overflow == 'coalesce':
+			key, item = item;
+			if key is not None:
+				del self._pending[key];
+
+		self.delivered += 1;
+		self._not_full.set();
+
+		return item;
+
+	def close (self, exception=None):
+		'''
+		Stop accepting events. Queued events are still delivered; after them, get raises `exception` if given, else StreamClosed.
+		'''
+		if not self.closed:
+			self.closed = True;
+			self.exception = exception;
+
+		self._not_empty.set();
+		self._not_full.set();
+
+	def stats (self):
+		'''
+		Backpressure metrics:
+			• depth, max_depth: events queued now, and the most ever queued.
+			• received, delivered: events put, and events handed to the consumer.
+			• dropped: events discarded by 'drop_oldest'.
+			• coalesced: events that replaced a queued event for the same key ('coalesce').
+			• blocked, blocked_seconds: puts that had to wait for room, and the total time the reader spent waiting.
+		'''
+		return {
+			'depth' 			: len(self._items),
+			'max_depth' 		: self.max_depth,
+			'maxsize' 			: self.maxsize,
+			'overflow' 			: self.overflow,
+			'received' 			: self.received,
+			'delivered' 		: self.delivered,
+			'dropped' 			: self.dropped,
+			'coalesced' 		: self.coalesced,
+			'blocked' 			: self.blocked,
+			'blocked_seconds' 	: self.blocked_seconds
+		};
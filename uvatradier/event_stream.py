@@ -0,0 +1,721 @@
+import json;
+import time;
+import asyncio;
+import websockets;
+
+from collections import deque;
+from datetime import datetime, timezone;
+
+from .retry import RetryPolicy;
+from .event_queue import EventQueue, StreamClosed;
+from .stream_events import EventDecoder, MessageSplitter, EVENT_TYPES, ACCOUNT_EVENT_TYPES;
+
+
+class StaleStream (Exception):
+	'''
+	Raised by the reader when no message arrived for `stale_after` seconds, so the supervisor reconnects.
+	'''
+
+
+class EventStream:
+	'''
+	Async iterator over the events of a streaming connection, running the connection in a background task of the caller's event loop.
+
+	The reader task decodes messages and puts them on a bounded EventQueue; the consumer takes them with `async for`. A slow consumer
+	therefore never stalls the socket reader beyond what the overflow policy allows, and the stream composes with other tasks in one loop.
+
+	Subclasses implement session(), which returns a new stream session id, and connect(session_id), which connects, subscribes, calls
+	connected() and then publish(message) for every message received until the connection ends.
+
+	Supervision (reconnect=True):
+		• A dropped connection (network error, server close, failed ping, or no message for `stale_after` seconds) is retried with capped
+		  exponential backoff from the RetryPolicy. Every attempt obtains a new session id, since Tradier's session ids are single-use and
+		  expire a few minutes after creation, then resubscribes with the stream's current subscription.
+		• Each outage is recorded as a gap: {'disconnected', 'reconnected' (UTC datetimes), 'seconds', 'attempts', 'reason'}, kept in
+		  `gaps` (most recent 100) and passed to `on_gap` if given. Events sent by Tradier during a gap are not recovered.
+		• With reconnect=False, the stream ends when the connection does; a connection error is raised to the consumer after the queued events.
+
+	Args:
+		• maxsize (int, optional): Maximum number of queued events. Default is 10000.
+		• overflow (str, optional): Queue overflow policy - 'block', 'drop_oldest' or 'coalesce' (see EventQueue). Default is 'block'.
+		• decode (bool, optional): Yield typed events (see stream_events) rather than raw messages. Default is True.
+		• json_decoder (str or callable, optional): JSON decoder used when decoding. Default is 'auto'.
+		• reconnect (bool, optional): Reconnect automatically when the connection drops. Default is True.
+		• retry (RetryPolicy, optional): Backoff between reconnection attempts. Default is RetryPolicy(backoff_factor=0.5, backoff_max=30).
+		• max_reconnects (int, optional): Give up after this many consecutive reconnections without a message, whether the connection failed
+		  or the server closed it cleanly. The last error (or a ConnectionError) is raised to the consumer. Default is None (never).
+		• stale_after (float, optional): Reconnect if no message arrives for this many seconds. Default is None (rely on websocket pings only).
+		• on_gap (callable, optional): Called with each gap record once the stream has reconnected.
+	'''
+
+	EVENT_TYPES 	= EVENT_TYPES; 	# how messages are decoded (see EventDecoder)
+	TYPE_KEY 		= 'type';
+	IGNORE 			= ();
+
+	def __init__ (self, maxsize=10000, overflow='block', decode=True, json_decoder='auto', reconnect=True, retry=None, max_reconnects=None, stale_after=None, on_gap=None):
+		self.queue 		= EventQueue(maxsize, overflow);
+		self.decoder 	= EventDecoder(json_decoder, self.EVENT_TYPES, self.TYPE_KEY, self.IGNORE) if decode else None;
+
+		self.reconnect 		= reconnect;
+		self.retry 			= retry if retry is not None else RetryPolicy(backoff_factor=0.5, backoff_max=30.0);
+		self.max_reconnects = max_reconnects;
+		self.stale_after 	= stale_after;
+		self.on_gap 		= on_gap;
+
+		self.is_connected 	= False;
+		self.reconnects 	= 0;
+		self.gaps 			= deque(maxlen=100);
+
+		self._attempt 		= 0; 		# consecutive reconnection cycles without a message, reset by the first message after connecting
+		self._disconnected 	= None; 	# (monotonic time, UTC datetime, reason) of the current outage
+		self._task 			= None;
+
+	#
+	# Producer side
+	#
+
+	async def session (self):
+		raise NotImplementedError;
+
+	async def connect (self, session_id):
+		raise NotImplementedError;
+
+	async def run (self):
+		'''
+		Connect, and reconnect with backoff whenever the connection ends, until closed or out of attempts.
+		'''
+		while True:
+			try:
+				await self.connect(await self.session());
+				error, reason = None, 'connection closed by server';
+			except Exception as e:
+				if not self.reconnect:
+					raise;
+				error, reason = e, f"{type(e).__name__}: {e}";
+			else:
+				if not self.reconnect:
+					return;
+
+			#
+			# _attempt counts reconnection cycles since the last message, whether the connection failed or was closed cleanly
+			#
+
+			self.mark_disconnected(reason);
+			if self.max_reconnects is not None and self._attempt >= self.max_reconnects:
+				if error is not None:
+					raise error;
+				raise ConnectionError(f"Gave up after {self._attempt} reconnections without a message ({reason}).");
+
+			await asyncio.sleep(self.retry.backoff(self._attempt));
+			self._attempt += 1;
+
+	def mark_disconnected (self, reason):
+		self.is_connected = False;
+		if self._disconnected is None:
+			self._disconnected = (time.monotonic(), datetime.now(timezone.utc), reason);
+
+	def connected (self):
+		'''
+		Called by connect() once subscribed. Closes the current outage, if any, into a gap record.
+		'''
+		self.is_connected = True;
+
+		if self._disconnected is None:
+			return;
+
+		started, disconnected, reason = self._disconnected;
+		self._disconnected = None;
+		self.reconnects += 1;
+
+		gap = {
+			'disconnected' 	: disconnected,
+			'reconnected' 	: datetime.now(timezone.utc),
+			'seconds' 		: time.monotonic() - started,
+			'attempts' 		: self._attempt,
+			'reason' 		: reason
+		};
+		self.gaps.append(gap);
+
+		if self.on_gap is not None:
+			self.on_gap(gap);
+
+	async def read_websocket (self, websocket):
+		'''
+		Publish every message of an open websocket until it closes, raising StaleStream if it goes quiet for `stale_after` seconds.
+		'''
+		if self.stale_after is None:
+			async for message in websocket:
+				await self.publish(message);
+			return;
+
+		while True:
+			try:
+				message = await asyncio.wait_for(websocket.recv(), self.stale_after);
+			except asyncio.TimeoutError:
+				raise StaleStream(f"No message for {self.stale_after} seconds.");
+			except websockets.ConnectionClosedOK:
+				return;
+
+			await self.publish(message);
+
+	async def publish (self, message):
+		'''
+		Decode a raw message (if decoding) and queue its events.
+		'''
+		if self._attempt:
+			self._attempt = 0;
+
+		if self.decoder is None:
+			await self.queue.put(message);
+			return;
+
+		for event in self.decoder.decode(message):
+			await self.queue.put(event);
+
+	async def _run (self):
+		try:
+			await self.run();
+		except asyncio.CancelledError:
+			self.queue.close();
+			raise;
+		except Exception as e:
+			self.queue.close(e);
+		else:
+			self.queue.close();
+		finally:
+			self.is_connected = False;
+
+	#
+	# Lifecycle
+	#
+
+	def start (self):
+		'''
+		Start the reader task on the running event loop. Called implicitly by `async with` and on the first iteration.
+		'''
+		if self._task is None:
+			self._task = asyncio.get_running_loop().create_task(self._run());
+		return self;
+
+	@property
+	def running (self):
+		return self._task is not None and not self._task.done();
+
+	async def close (self):
+		'''
+		Stop the reader task and end iteration. Events still queued are delivered first.
+		'''
+		self.queue.close();
+
+		if self._task is not None and not self._task.done():
+			self._task.cancel();
+			try:
+				await self._task;
+			except asyncio.CancelledError:
+				pass;
+
+	async def __aenter__ (self):
+		return self.start();
+
+	async def __aexit__ (self, *exc_info):
+		await self.close();
+
+	#
+	# Consumer side
+	#
+
+	def __aiter__ (self):
+		return self;
+
+	async def __anext__ (self):
+		self.start();
+		try:
+			return await self.queue.get();
+		except StreamClosed:
+			raise StopAsyncIteration;
+
+	def stats (self):
+		'''
+		Queue backpressure metrics (see EventQueue.stats), plus connection state: whether the reader task is running and connected,
+		the number of reconnections, and the duration of the last and of all gaps in seconds.
+		'''
+		return {
+			**self.queue.stats(),
+			'running' 				: self.running,
+			'connected' 			: self.is_connected,
+			'reconnects' 			: self.reconnects,
+			'last_gap_seconds' 		: self.gaps[-1]['seconds'] if self.gaps else None,
+			'total_gap_seconds' 	: sum(gap['seconds'] for gap in self.gaps)
+		};
+
+
+class WebsocketEventStream (EventStream):
+	'''
+	Event stream over one of Tradier's streaming websockets: get a session id, connect, send the subscription payload, read messages.
+
+	Subclasses define ENDPOINT (attribute of the client holding the websocket path), payload(session_id) and session().
+	'''
+
+	ENDPOINT = None;
+
+	def __init__ (self, client, **kwargs):
+		kwargs.setdefault('json_decoder', client.transport.json_loads);
+		EventStream.__init__(self, **kwargs);
+
+		self.client 	= client;
+		self.websocket 	= None;
+		self.session_id = None;
+
+	def payload (self, session_id):
+		raise NotImplementedError;
+
+	async def connect (self, session_id):
+		async with websockets.connect(uri=f"{self.client.WEBSOCKET_URL}/{getattr(self.client, self.ENDPOINT)}", compression=None) as websocket:
+			self.websocket, self.session_id = websocket, session_id;
+			try:
+				await websocket.send(json.dumps(self.payload(session_id)));
+				self.connected();
+
+				await self.read_websocket(websocket);
+			finally:
+				self.websocket, self.session_id = None, None;
+
+	async def resubscribe (self):
+		'''
+		Send the current subscription on the open websocket, replacing the previous one. When not connected, the next connection uses it.
+		'''
+		if self.websocket is None:
+			return;
+
+		try:
+			await self.websocket.send(json.dumps(self.payload(self.session_id)));
+		except websockets.ConnectionClosed:
+			pass; 	# the supervisor reconnects with the current subscription
+
+
+class MarketEventStream (WebsocketEventStream):
+	'''
+	Market events of a list of symbols over Tradier's websocket, as an async iterator. Created by Stream.market_events.
+
+	The subscription can be changed while connected with add_symbols, remove_symbols and set_filter: the new subscription is sent on the
+	open websocket under the same session, so no session request or handshake is needed and no events are missed for unchanged symbols.
+	Events of a removed symbol that were already queued (or in flight) are still delivered.
+
+	With protocol='http', events are read from Tradier's HTTP streaming endpoint instead, for hosts that cannot open websockets. The chunked
+	response is read incrementally in a worker thread and split into messages by a MessageSplitter, so it is never buffered whole; the events,
+	queue, reconnection and stale detection are the same. Over HTTP the subscription is part of the request, so subscription changes reconnect.
+	'''
+
+	ENDPOINT = 'MARKET_EVENTS_STREAM_ENDPOINT';
+	PROTOCOLS = ('websocket', 'http');
+
+	def __init__ (self, client, symbol_list, filter_list=None, line_break=False, valid_ticks_only=True, advanced_details=True, protocol='websocket', **kwargs):
+		if protocol not in self.PROTOCOLS:
+			raise ValueError(f"protocol must be one of {self.PROTOCOLS}, not {protocol!r}.");
+
+		WebsocketEventStream.__init__(self, client, **kwargs);
+
+		self.protocol = protocol;
+		self.response = None; 		# open HTTP stream response (protocol='http')
+
+		self.symbol_list 		= list(symbol_list);
+		self.filter_list 		= list(filter_list) if filter_list is not None else None;
+		self.line_break 		= line_break;
+		self.valid_ticks_only 	= valid_ticks_only;
+		self.advanced_details 	= advanced_details;
+
+	def payload (self, session_id):
+		payload = {
+			'symbols' 			: self.symbol_list,
+			'sessionid' 		: session_id,
+			'linebreak' 		: self.line_break,
+			'validOnly' 		: self.valid_ticks_only,
+			'advancedDetails' 	: self.advanced_details
+		};
+		if self.filter_list is not None:
+			payload['filter'] = self.filter_list;
+
+		return payload;
+
+	async def session (self):
+		'''
+		New stream session id. The session request is blocking, so it runs in a worker thread to keep the event loop responsive.
+		'''
+		return await asyncio.to_thread(self.client.http_market_stream_connect, 1);
+
+	async def connect (self, session_id):
+		if self.protocol == 'websocket':
+			return await WebsocketEventStream.connect(self, session_id);
+
+		loop = asyncio.get_running_loop();
+		response = await asyncio.to_thread(self.open_http_stream, session_id);
+
+		self.response = response;
+		try:
+			self.connected();
+			await asyncio.to_thread(self.read_http_stream, response, loop);
+		finally:
+			self.response = None;
+			self.close_http_stream(response); 		# also unblocks the reader thread if the stream was closed or cancelled
+
+	async def resubscribe (self):
+		if self.protocol == 'websocket':
+			return await WebsocketEventStream.resubscribe(self);
+
+		if self.response is not None:
+			self.close_http_stream(self.response); 	# the supervisor reconnects with the new subscription
+
+	#
+	# HTTP streaming
+	#
+
+	def open_http_stream (self, session_id):
+		'''
+		POST the subscription to the HTTP streaming endpoint and return the open (unread) response.
+		The read timeout is stale_after, so a silent stream raises and is reconnected like a stale websocket.
+		'''
+		payload = self.payload(session_id);
+		data = {
+			'sessionid' 		: session_id,
+			'symbols' 			: ','.join(payload['symbols']),
+			'linebreak' 		: str(payload['linebreak']).lower(),
+			'validOnly' 		: str(payload['validOnly']).lower(),
+			'advancedDetails' 	: str(payload['advancedDetails']).lower()
+		};
+		if self.filter_list is not None:
+			data['filter'] = ','.join(self.filter_list);
+
+		timeout = self.client.transport.timeout;
+		connect_timeout = timeout[0] if isinstance(timeout, tuple) else timeout;
+
+		response = self.client.transport.post(
+			url 	= f"{self.client.STREAM_URL}/{self.client.MARKET_EVENTS_STREAM_ENDPOINT}",
+			data 	= data,
+			headers = self.client.REQUESTS_HEADERS,
+			stream 	= True,
+			timeout = (connect_timeout, self.stale_after),
+			retry 	= False
+		);
+		response.raise_for_status();
+
+		return response;
+
+	def read_http_stream (self, response, loop):
+		'''
+		Read the chunked response as it arrives (worker thread), publishing each chunk's complete messages on the event loop. Waiting for
+		each publish carries the queue's backpressure ('block') back to the socket, as with the websocket.
+		'''
+		splitter = MessageSplitter(self.line_break);
+
+		for chunk in response.iter_content(chunk_size=None):
+			messages = splitter.feed(chunk);
+			if messages:
+				asyncio.run_coroutine_threadsafe(self.publish_all(messages), loop).result();
+
+	def close_http_stream (self, response):
+		'''
+		Close the HTTP stream response. Closing alone does not wake a reader thread blocked waiting for the next chunk, so the socket is
+		shut down for reading first (urllib3 >= 2.3), which ends that read at once.
+		'''
+		shutdown = getattr(response.raw, 'shutdown', None);
+		if shutdown is not None:
+			try:
+				shutdown();
+			except (ValueError, RuntimeError, OSError):
+				pass; 				# connection already released or closed
+
+		response.close();
+
+	async def publish_all (self, messages):
+		for message in messages:
+			await self.publish(message);
+
+	#
+	# Subscription changes
+	#
+
+	async def update_subscription (self, symbol_list=None, filter_list=False):
+		'''
+		Replace the symbols and/or the event filter (None for all events; False leaves it unchanged), resubscribing only if either changed.
+
+		Returns:
+			• dict: {'added': symbols added, 'removed': symbols removed, 'filter_changed': bool}.
+		'''
+		symbol_list = list(dict.fromkeys(symbol_list)) if symbol_list is not None else self.symbol_list;
+		filter_list = (list(filter_list) if filter_list is not None else None) if filter_list is not False else self.filter_list;
+
+		if not symbol_list:
+			raise ValueError("A market stream needs at least one symbol; close() it instead.");
+
+		current, new = set(self.symbol_list), set(symbol_list);
+		change = {
+			'added' 			: [symbol for symbol in symbol_list if symbol not in current],
+			'removed' 			: [symbol for symbol in self.symbol_list if symbol not in new],
+			'filter_changed' 	: filter_list != self.filter_list
+		};
+
+		if change['added'] or change['removed'] or change['filter_changed']:
+			self.symbol_list, self.filter_list = symbol_list, filter_list;
+			await self.resubscribe();
+
+		return change;
+
+	async def add_symbols (self, symbols):
+		'''
+		Subscribe to more symbols on the live connection. Symbols already subscribed are ignored.
+		'''
+		return await self.update_subscription(self.symbol_list + list(symbols));
+
+	async def remove_symbols (self, symbols):
+		'''
+		Unsubscribe from symbols on the live connection.
+		'''
+		removed = set(symbols);
+		return await self.update_subscription([symbol for symbol in self.symbol_list if symbol not in removed]);
+
+	async def set_filter (self, filter_list):
+		'''
+		Change the event types streamed ('trade', 'quote', 'summary', 'timesale', 'tradex'), or None for all, on the live connection.
+		'''
+		return await self.update_subscription(filter_list=filter_list);
+
+
+class ShardedMarketStream (EventStream):
+	'''
+	Market events of many symbols spread over several websocket connections (shards), merged into one async iterator. Created by
+	Stream.market_events(..., shards=N).
+
+	Each shard is a MarketEventStream with its own session and its own reconnection supervision, subscribed to a subset of the symbols.
+	All shards publish into one shared queue, so the overflow policy and stats() apply to the merged stream.
+
+	Notes:
+		• A symbol is assigned to exactly one shard and never moves, so its events arrive in the order its connection received them.
+		  Events of different symbols may interleave in any order.
+		• add_symbols assigns new symbols to the least-loaded shards, keeping the shards balanced as the universe grows. Only the shards
+		  that gained symbols resubscribe, on their open connections. remove_symbols and set_filter change the affected shards the same
+		  way; a shard left without symbols disconnects until it is given new ones.
+		• Shards run in the caller's event loop: separate connections relieve the per-connection reader and server-side limits, while
+		  decoding shares one thread.
+
+	Args:
+		• client (Stream): Stream client providing credentials and endpoints.
+		• symbol_list (list): Symbols to subscribe to.
+		• shards (int, optional): Number of websocket connections. Default is 4.
+		• filter_list, line_break, valid_ticks_only, advanced_details, protocol: As for Stream.market_events, applied to every shard.
+		• reconnect, retry, max_reconnects, stale_after: Supervision of each shard (see EventStream). A shard that gives up ends the stream with its error.
+		• on_gap (callable, optional): Called with each shard's gap records, which carry an extra 'shard' index.
+		• maxsize, overflow, decode, json_decoder: Shared queue and decoding (see EventStream).
+
+	Example:
+		>>> async with stream.market_events(option_symbols, filter_list=['quote'], overflow='coalesce', shards=8) as events:
+		...     async for quote in events:
+		...         book[quote.symbol] = (quote.bid, quote.ask)
+	'''
+
+	def __init__ (self, client, symbol_list, shards=4, filter_list=None, line_break=False, valid_ticks_only=True, advanced_details=True, **kwargs):
+		if shards < 1:
+			raise ValueError("shards must be at least 1.");
+
+		protocol = kwargs.pop('protocol', 'websocket');
+
+		kwargs.setdefault('json_decoder', client.transport.json_loads);
+		EventStream.__init__(self, **kwargs);
+
+		supervision = {name:kwargs[name] for name in ('reconnect', 'retry', 'max_reconnects', 'stale_after') if name in kwargs};
+
+		self.shards = [MarketEventStream(client, [], filter_list, line_break, valid_ticks_only, advanced_details, protocol, **supervision) for _ in range(shards)];
+
+		for index, shard in enumerate(self.shards):
+			shard.queue 	= self.queue;
+			shard.decoder 	= self.decoder;
+			shard.on_gap 	= lambda gap, index=index: self.record_gap({**gap, 'shard':index});
+
+		self.assign(symbol_list);
+
+		self._shard_tasks 	= dict(); 	# shard index -> task running its supervised connection
+		self._finished 		= None;
+
+	@property
+	def symbol_list (self):
+		return [symbol for shard in self.shards for symbol in shard.symbol_list];
+
+	def shard_of (self, symbol):
+		'''
+		Index of the shard subscribed to `symbol`, or None.
+		'''
+		return next((index for index, shard in enumerate(self.shards) if symbol in shard.symbol_list), None);
+
+	def assign (self, symbols):
+		'''
+		Assign symbols not yet subscribed to the least-loaded shards. Returns the indexes of the shards that changed.
+		'''
+		subscribed = set(self.symbol_list);
+		changed = set();
+
+		for symbol in symbols:
+			if symbol in subscribed:
+				continue;
+
+			index = min(range(len(self.shards)), key=lambda i: len(self.shards[i].symbol_list));
+			self.shards[index].symbol_list.append(symbol);
+			subscribed.add(symbol);
+			changed.add(index);
+
+		return sorted(changed);
+
+	async def add_symbols (self, symbols):
+		'''
+		Subscribe to more symbols, rebalancing them onto the least-loaded shards. Shards that gained symbols resubscribe; idle shards connect.
+
+		Returns:
+			• dict: The change across all shards, as for MarketEventStream.add_symbols: {'added': [...], 'removed': [], 'filter_changed': False}.
+		'''
+		subscribed = set(self.symbol_list);
+		added = [symbol for symbol in dict.fromkeys(symbols) if symbol not in subscribed];
+
+		for index in self.assign(added):
+			if index in self._shard_tasks:
+				await self.shards[index].resubscribe();
+			elif self._finished is not None:
+				self.start_shard(index);
+
+		return {'added':added, 'removed':list(), 'filter_changed':False};
+
+	async def remove_symbols (self, symbols):
+		'''
+		Unsubscribe from symbols. Shards that lost symbols resubscribe; a shard left without symbols is disconnected.
+
+		Returns:
+			• dict: The change across all shards, as for MarketEventStream.remove_symbols: {'added': [], 'removed': [...], 'filter_changed': False}.
+		'''
+		removing = set(symbols);
+		change = {'added':list(), 'removed':list(), 'filter_changed':False};
+
+		for index, shard in enumerate(self.shards):
+			remaining = [symbol for symbol in shard.symbol_list if symbol not in removing];
+			if len(remaining) == len(shard.symbol_list):
+				continue;
+
+			if remaining:
+				change['removed'].extend((await shard.update_subscription(remaining))['removed']);
+			else:
+				change['removed'].extend(shard.symbol_list);
+				shard.symbol_list = [];
+				await self.stop_shard(index);
+
+		return change;
+
+	async def set_filter (self, filter_list):
+		'''
+		Change the event types streamed by every shard, on their open connections.
+
+		Returns:
+			• dict: {'added': [], 'removed': [], 'filter_changed': bool}, with filter_changed True if any shard's filter changed.
+		'''
+		filter_list = list(filter_list) if filter_list is not None else None;
+		change = {'added':list(), 'removed':list(), 'filter_changed':False};
+
+		for shard in self.shards:
+			if shard.symbol_list:
+				changed = (await shard.set_filter(filter_list))['filter_changed'];
+			else:
+				changed, shard.filter_list = shard.filter_list != filter_list, filter_list;
+
+			change['filter_changed'] = change['filter_changed'] or changed;
+
+		return change;
+
+	def record_gap (self, gap):
+		self.gaps.append(gap);
+		self.reconnects += 1;
+
+		if self.on_gap is not None:
+			self.on_gap(gap);
+
+	def start_shard (self, index):
+		task = asyncio.get_running_loop().create_task(self.shards[index].run());
+		task.add_done_callback(self.shard_done);
+		self._shard_tasks[index] = task;
+
+	async def stop_shard (self, index):
+		task = self._shard_tasks.pop(index, None);
+		if task is None:
+			return;
+
+		task.cancel();
+		await asyncio.gather(task, return_exceptions=True);
+		self.shards[index].is_connected = False;
+
+	def shard_done (self, task):
+		if task.cancelled() or self._finished is None or self._finished.done():
+			return;
+
+		if task.exception() is not None:
+			self._finished.set_exception(task.exception());
+		elif all(task.done() for task in self._shard_tasks.values()):
+			self._finished.set_result(None);
+
+	async def run (self):
+		'''
+		Run every shard that has symbols until the stream is closed, all shards end (reconnect=False), or one shard fails.
+		'''
+		self._finished = asyncio.get_running_loop().create_future();
+
+		for index, shard in enumerate(self.shards):
+			if shard.symbol_list:
+				self.start_shard(index);
+
+		try:
+			await self._finished;
+		finally:
+			for task in self._shard_tasks.values():
+				task.cancel();
+			await asyncio.gather(*self._shard_tasks.values(), return_exceptions=True);
+
+	def stats (self):
+		'''
+		Merged queue and connection metrics (see EventStream.stats), plus per-shard symbol counts and connection state under 'shards'.
+		'''
+		return {
+			**EventStream.stats(self),
+			'connected' 	: any(shard.is_connected for shard in self.shards),
+			'shards' 		: [{
+				'symbols' 			: len(shard.symbol_list),
+				'connected' 		: shard.is_connected,
+				'reconnects' 		: shard.reconnects,
+				'last_gap_seconds' 	: shard.gaps[-1]['seconds'] if shard.gaps else None
+			} for shard in self.shards]
+		};
+
+
+class AccountEventStream (WebsocketEventStream):
+	'''
+	Order status events of the accounts tied to the access token over Tradier's account websocket, as an async iterator. Created by
+	Stream.account_events.
+
+	Events are decoded into OrderEvent objects (their type is under 'event'); heartbeats are discarded after resetting the stale timer.
+	'''
+
+	ENDPOINT = 'ACCOUNT_EVENTS_STREAM_ENDPOINT';
+
+	EVENT_TYPES 	= ACCOUNT_EVENT_TYPES;
+	TYPE_KEY 		= 'event';
+	IGNORE 			= ('heartbeat',);
+
+	def __init__ (self, client, exclude_accounts=None, **kwargs):
+		WebsocketEventStream.__init__(self, client, **kwargs);
+
+		self.exclude_accounts = list(exclude_accounts) if exclude_accounts is not None else [];
+
+	def payload (self, session_id):
+		return {
+			'events' 			: ['order'],
+			'sessionid' 		: session_id,
+			'excludeAccounts' 	: self.exclude_accounts
+		};
+
+	async def session (self):
+		'''
+		New account stream session id, requested in a worker thread.
+		'''
+		return await asyncio.to_thread(self.client.http_account_stream_connect, 1);
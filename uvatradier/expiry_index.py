@@ -0,0 +1,92 @@
+from datetime import datetime;
+
+import numpy as np;
+
+
+def to_datetime64 (dates, unit='D'):
+	'''
+	Convert a date or collection of dates ('YYYY-MM-DD' strings, date/datetime objects or datetime64) into datetime64[unit].
+	With unit='D' the time of day of datetimes is dropped; with a finer unit (e.g. 's') it is kept.
+	'''
+	if unit == 'D' and isinstance(dates, datetime):
+		dates = dates.date();
+
+	return np.asarray(dates, dtype=f"datetime64[{unit}]");
+
+
+class ExpiryIndex:
+	'''
+	Sorted datetime64 index of an underlying's option expiries, answering expiry queries by binary search.
+
+	Args:
+		• expiry_dates (list of str): Expiry dates as returned by OptionsData.get_expiry_dates, e.g. ['2024-10-18', '2024-10-25'].
+
+	Example:
+		>>> index = ExpiryIndex(['2024-10-18', '2024-10-25', '2024-11-15'])
+		>>> index.nearest('2024-10-23')
+		'2024-10-25'
+		>>> index.bracket('2024-10-23')
+		('2024-10-18', '2024-10-25')
+		>>> index.within('2024-10-20', '2024-12-31')
+		['2024-10-25', '2024-11-15']
+	'''
+
+	def __init__ (self, expiry_dates):
+		self.dates = np.unique(to_datetime64(list(expiry_dates)));
+
+	def __len__ (self):
+		return len(self.dates);
+
+	@staticmethod
+	def format (dates):
+		return np.datetime_as_string(dates, unit='D');
+
+	def nearest_many (self, targets):
+		'''
+		Expiry nearest to each target, as an array of 'YYYY-MM-DD' strings. Targets may be dates or datetimes: the time of day counts,
+		with expiries taken at midnight, so a target in the afternoon halfway between two expiries is nearer the later one. Exact ties
+		go to the earlier expiry.
+		'''
+		targets = to_datetime64(targets, 's');
+
+		if not len(self.dates):
+			return np.full(targets.shape, None, dtype=object);
+
+		dates = self.dates.astype('datetime64[s]');
+
+		right = np.clip(np.searchsorted(dates, targets, side='left'), 1, len(dates) - 1) if len(dates) > 1 else np.zeros(targets.shape, dtype=np.intp);
+		left = np.maximum(right - 1, 0);
+
+		use_left = np.abs(targets - dates[left]) <= np.abs(dates[right] - targets);
+
+		return self.format(self.dates[np.where(use_left, left, right)]);
+
+	def nearest (self, target):
+		'''
+		Expiry nearest to `target` (a date or datetime, see nearest_many) as 'YYYY-MM-DD', or None if there are no expiries.
+		'''
+		nearest = self.nearest_many([target])[0];
+		return str(nearest) if nearest is not None else None;
+
+	def bracket (self, target):
+		'''
+		(last expiry on or before `target`, first expiry on or after `target`). Either is None past the ends of the index.
+		'''
+		target = to_datetime64(target);
+
+		before = np.searchsorted(self.dates, target, side='right') - 1;
+		after = np.searchsorted(self.dates, target, side='left');
+
+		return (
+			str(self.format(self.dates[before])) if before >= 0 else None,
+			str(self.format(self.dates[after])) if after < len(self.dates) else None
+		);
+
+	def within (self, start, end):
+		'''
+		Expiries in the window [start, end], inclusive, as a list of 'YYYY-MM-DD' strings.
+		'''
+		lo = np.searchsorted(self.dates, to_datetime64(start), side='left');
+		hi = np.searchsorted(self.dates, to_datetime64(end), side='right');
+
+		return self.format(self.dates[lo:hi]).tolist();
@@ -0,0 +1,321 @@
+import math;
+import importlib.util;
+
+import numpy as np;
+import pandas as pd;
+
+from .occ import parse_occ;
+
+
+#
+# Standard normal CDF.
+# scipy.special.ndtr is used when scipy is installed. Otherwise fall back to Hart's double-precision rational approximation
+# (as given by West, "Better approximations to cumulative normal functions", 2005), accurate to about 1e-14.
+#
+
+if importlib.util.find_spec('scipy') is not None:
+	from scipy.special import ndtr as norm_cdf;
+else:
+	def norm_cdf (x):
+		x = np.asarray(x, dtype=np.float64);
+		z = np.abs(x);
+
+		with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+			e = np.exp(-0.5 * z * z);
+
+			numerator = ((((((0.0352624965998911 * z + 0.700383064443688) * z + 6.37396220353165) * z + 33.912866078383) * z + 112.079291497871) * z + 221.213596169931) * z + 220.206867912376);
+			denominator = (((((((0.0883883476483184 * z + 1.75566716318264) * z + 16.064177579207) * z + 86.7807322029461) * z + 296.564248779674) * z + 637.333633378831) * z + 793.826512519948) * z + 440.413735824752);
+			tail = e * numerator / denominator;
+
+			continued_fraction = z + 1 / (z + 2 / (z + 3 / (z + 4 / (z + 0.65))));
+			far_tail = e / continued_fraction / 2.506628274631;
+
+		c = np.where(z < 7.07106781186547, tail, far_tail);
+		c = np.where(z > 37, 0.0, c);
+
+		return np.where(x > 0, 1 - c, c);
+
+
+def norm_pdf (x):
+	return np.exp(-0.5 * np.square(x)) / math.sqrt(2 * math.pi);
+
+
+#
+# Conventions (matching the greeks Tradier returns with greeks=true):
+# 	• time to expiry in years (365-day year)
+# 	• theta per calendar day
+# 	• vega and rho per 1 percentage point change in volatility / rate
+#
+
+DAYS_PER_YEAR = 365.0;
+
+MIN_TIME_TO_EXPIRY = 1 / (DAYS_PER_YEAR * 24 * 60); 			# one minute
+
+
+def call_mask (option_type):
+	'''
+	Boolean array that is True for calls. Accepts 'call'/'put', 'C'/'P' (any case) or booleans (True = call).
+	'''
+	option_type = np.asarray(option_type);
+
+	if option_type.dtype == bool:
+		return option_type;
+
+	return np.char.startswith(np.char.upper(option_type.astype(str)), 'C');
+
+
+def broadcast_inputs (option_type, *values):
+	'''
+	Broadcast the call/put mask and the numeric inputs against each other.
+	'''
+	return np.broadcast_arrays(call_mask(option_type), *[np.asarray(x, dtype=np.float64) for x in values]);
+
+
+def bs_price (S, K, T, sigma, option_type, r=0.0, q=0.0):
+	'''
+	Black-Scholes-Merton value of European options. All arguments broadcast against each other.
+
+	Args:
+		• S (float or array): Underlying price.
+		• K (float or array): Strike.
+		• T (float or array): Time to expiry in years.
+		• sigma (float or array): Volatility (annualized, e.g. 0.2 for 20%).
+		• option_type (str or array): 'call'/'put' or 'C'/'P'.
+		• r (float or array, optional): Continuously compounded risk-free rate. Default is 0.
+		• q (float or array, optional): Continuous dividend yield. Default is 0.
+
+	Returns:
+		• numpy.ndarray: Option values.
+	'''
+	is_call, S, K, T, sigma, r, q = broadcast_inputs(option_type, S, K, T, sigma, r, q);
+
+	T = np.maximum(T, MIN_TIME_TO_EXPIRY);
+	sqrt_T = np.sqrt(T);
+
+	with np.errstate(divide='ignore', invalid='ignore'):
+		d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T);
+	d2 = d1 - sigma * sqrt_T;
+
+	discounted_S = S * np.exp(-q * T);
+	discounted_K = K * np.exp(-r * T);
+
+	return np.where(
+		is_call,
+		discounted_S * norm_cdf(d1) - discounted_K * norm_cdf(d2),
+		discounted_K * norm_cdf(-d2) - discounted_S * norm_cdf(-d1)
+	);
+
+
+def bs_greeks (S, K, T, sigma, option_type, r=0.0, q=0.0):
+	'''
+	Black-Scholes-Merton value and greeks of European options. Arguments are as in bs_price and broadcast against each other.
+
+	Returns:
+		• dict of numpy.ndarray: value, delta, gamma, theta (per calendar day), vega and rho (per 1 percentage point).
+	'''
+	is_call, S, K, T, sigma, r, q = broadcast_inputs(option_type, S, K, T, sigma, r, q);
+
+	T = np.maximum(T, MIN_TIME_TO_EXPIRY);
+	sqrt_T = np.sqrt(T);
+	sigma_sqrt_T = sigma * sqrt_T;
+
+	with np.errstate(divide='ignore', invalid='ignore'):
+		d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sigma_sqrt_T;
+	d2 = d1 - sigma_sqrt_T;
+
+	sign = np.where(is_call, 1.0, -1.0);
+	dividend_discount = np.exp(-q * T);
+	discounted_S = S * dividend_discount;
+	discounted_K = K * np.exp(-r * T);
+
+	N_d1 = norm_cdf(sign * d1);
+	N_d2 = norm_cdf(sign * d2);
+	n_d1 = norm_pdf(d1);
+
+	with np.errstate(divide='ignore', invalid='ignore'):
+		gamma = dividend_discount * n_d1 / (S * sigma_sqrt_T);
+		theta = -discounted_S * n_d1 * sigma / (2 * sqrt_T) - sign * r * discounted_K * N_d2 + sign * q * discounted_S * N_d1;
+
+	return {
+		'value' : sign * (discounted_S * N_d1 - discounted_K * N_d2),
+		'delta' : sign * dividend_discount * N_d1,
+		'gamma' : gamma,
+		'theta' : theta / DAYS_PER_YEAR,
+		'vega' 	: discounted_S * n_d1 * sqrt_T / 100,
+		'rho' 	: sign * discounted_K * T * N_d2 / 100
+	};
+
+
+def implied_volatility (price, S, K, T, option_type, r=0.0, q=0.0, tol=1e-8, max_iter=100, sigma_low=1e-4, sigma_high=10.0):
+	'''
+	Implied volatility of European options, solved for every contract at once.
+
+	Each contract is solved with a safeguarded Newton iteration: Newton steps are taken while they stay inside the current
+	bracket [sigma_low, sigma_high], which shrinks every iteration, and a bisection step is taken otherwise. Contracts drop
+	out of the batch as they converge, so the cost of each iteration shrinks with it.
+
+	Args:
+		• price (float or array): Option prices (e.g. bid/ask midpoints).
+		• S, K, T, option_type, r, q: As in bs_price.
+		• tol (float, optional): Absolute price tolerance. Default is 1e-8.
+		• max_iter (int, optional): Maximum number of iterations. Default is 100.
+		• sigma_low, sigma_high (float, optional): Initial bracket for the solution. Default is [0.0001, 10].
+
+	Returns:
+		• numpy.ndarray: Implied volatilities. NaN where the price violates no-arbitrage bounds (below intrinsic value or above
+		  the discounted underlying/strike), where the solution lies outside the bracket, or where an input is NaN.
+
+	Example:
+		>>> implied_volatility(price=[2.50, 1.10], S=100, K=[100, 95], T=30/365, option_type=['call', 'put'], r=0.05)
+	'''
+	is_call, price, S, K, T, r, q = broadcast_inputs(option_type, price, S, K, T, r, q);
+	shape = price.shape;
+
+	price, S, K, r, q, is_call = (np.ravel(x) for x in (price, S, K, r, q, is_call));
+	T = np.maximum(np.ravel(T), MIN_TIME_TO_EXPIRY);
+
+	discounted_S = S * np.exp(-q * T);
+	discounted_K = K * np.exp(-r * T);
+
+	lower_bound = np.maximum(np.where(is_call, discounted_S - discounted_K, discounted_K - discounted_S), 0.0);
+	upper_bound = np.where(is_call, discounted_S, discounted_K);
+
+	iv = np.full(price.shape, np.nan);
+	active = np.flatnonzero((price > lower_bound) & (price < upper_bound));
+
+	#
+	# Start from the Brenner-Subrahmanyam at-the-money approximation
+	#
+
+	sigma = np.clip(math.sqrt(2 * math.pi) * price[active] / (S[active] * np.sqrt(T[active])), 0.05, 3.0);
+	low = np.full(active.shape, sigma_low);
+	high = np.full(active.shape, sigma_high);
+
+	for _ in range(max_iter):
+		if active.size == 0:
+			break;
+
+		greeks = bs_greeks(S[active], K[active], T[active], sigma, is_call[active], r[active], q[active]);
+		diff = greeks['value'] - price[active];
+		vega = greeks['vega'] * 100;
+
+		converged = np.abs(diff) < tol;
+		iv[active[converged]] = sigma[converged];
+
+		high = np.where(diff > 0, sigma, high);
+		low = np.where(diff < 0, sigma, low);
+
+		with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+			newton = sigma - diff / vega;
+
+		sigma = np.where((newton > low) & (newton < high), newton, 0.5 * (low + high));
+
+		keep = ~converged & (high - low > tol * 1e-3);
+		active, sigma, low, high = active[keep], sigma[keep], low[keep], high[keep];
+
+	if active.size:
+		iv[active] = np.where((sigma > sigma_low) & (sigma < sigma_high), sigma, np.nan);
+
+	return iv.reshape(shape);
+
+
+def time_to_expiry (expiration_date, valuation_time=None):
+	'''
+	Years from `valuation_time` (default: now, US/Eastern) to 4:00pm US/Eastern on each expiration date.
+	'''
+	expiration_date = pd.to_datetime(expiration_date);
+	expiration_date = getattr(expiration_date, 'dt', expiration_date);
+
+	if expiration_date.tz is not None:
+		expiration_date = expiration_date.tz_convert('America/New_York').tz_localize(None);
+
+	expiry = expiration_date.normalize() + pd.Timedelta(hours=16);
+
+	if valuation_time is None:
+		valuation_time = pd.Timestamp.now(tz='America/New_York').tz_localize(None);
+	else:
+		valuation_time = pd.Timestamp(valuation_time);
+		if valuation_time.tz is not None:
+			valuation_time = valuation_time.tz_convert('America/New_York').tz_localize(None);
+
+	seconds = np.asarray((expiry - valuation_time) / pd.Timedelta(seconds=1), dtype=np.float64);
+
+	return seconds / (DAYS_PER_YEAR * 24 * 60 * 60);
+
+
+def chain_contracts (chain):
+	'''
+	(strike, option_type, expiration_date) arrays of a chain DataFrame. They are taken from the strike, option_type and
+	expiration_date columns when present, and parsed from the OCC symbol otherwise (get_chain_day drops constant columns).
+	'''
+	parsed = None;
+	if not {'strike', 'option_type', 'expiration_date'}.issubset(chain.columns):
+		parsed = parse_occ(chain['symbol'], errors='coerce');
+
+	strike 		= (chain['strike'] if 'strike' in chain else parsed['strike']).to_numpy(dtype=np.float64);
+	option_type = (chain['option_type'] if 'option_type' in chain else parsed['option_type']).astype(str).to_numpy();
+	expiry 		= pd.to_datetime(chain['expiration_date'] if 'expiration_date' in chain else parsed['expiration_date']).to_numpy().astype('datetime64[D]');
+
+	return strike, option_type, expiry;
+
+
+def chain_prices (chain, price='mid'):
+	'''
+	Option prices of a chain DataFrame: the bid/ask midpoint (falling back to last when there is no two-sided market) for
+	price='mid', otherwise the named price column.
+	'''
+	if price != 'mid':
+		return chain[price].to_numpy(dtype=np.float64);
+
+	bid = chain['bid'].to_numpy(dtype=np.float64);
+	ask = chain['ask'].to_numpy(dtype=np.float64);
+	last = chain['last'].to_numpy(dtype=np.float64) if 'last' in chain else np.full(len(chain), np.nan);
+
+	return np.where((bid >= 0) & (ask > 0) & (ask >= bid), 0.5 * (bid + ask), last);
+
+
+def chain_greeks (chain, underlying_price, rate=0.0, dividend_yield=0.0, price='mid', volatility=None, valuation_time=None):
+	'''
+	Compute implied volatility, theoretical value and greeks locally for an option chain DataFrame, as returned by
+	OptionsData.get_chain_day or OptionsData.get_chain_all.
+
+	Args:
+		• chain (pandas.DataFrame): Option chain. Strike, option type and expiry are taken from the strike, option_type and
+		  expiration_date columns when present, and parsed from the OCC symbol otherwise (get_chain_day drops constant columns).
+		• underlying_price (float or array): Price of the underlying, e.g. from Quotes.get_quote_day(symbol, last_price=True).
+		• rate (float, optional): Continuously compounded risk-free rate. Default is 0.
+		• dividend_yield (float, optional): Continuous dividend yield of the underlying. Default is 0.
+		• price (str, optional): Which option price to solve implied volatility from: 'mid' (bid/ask midpoint, falling back to
+		  last when there is no two-sided market), or any price column such as 'bid', 'ask' or 'last'. Default is 'mid'.
+		• volatility (float or array, optional): If given, value the chain at this volatility instead of its implied volatility.
+		• valuation_time (datetime-like, optional): Valuation time (naive times are US/Eastern). Default is now.
+
+	Returns:
+		• pandas.DataFrame: Copy of `chain` with added columns iv, theo, delta, gamma, theta (per day), vega and rho
+		  (per percentage point). Contracts whose price has no implied volatility get NaN greeks.
+
+	Example:
+		>>> chain = options_data.get_chain_all('SPY')
+		>>> spot = quotes.get_quote_day('SPY', last_price=True)
+		>>> chain_greeks(chain, spot, rate=0.045)[['symbol', 'iv', 'delta', 'gamma', 'theta', 'vega']]
+	'''
+	df = chain.copy();
+
+	if df.empty:
+		return df;
+
+	strike, option_type, expiry = chain_contracts(df);
+	T = time_to_expiry(expiry, valuation_time);
+	option_price = chain_prices(df, price);
+
+	S = np.asarray(underlying_price, dtype=np.float64);
+
+	df['iv'] = implied_volatility(option_price, S, strike, T, option_type, rate, dividend_yield);
+
+	greeks = bs_greeks(S, strike, T, df['iv'].to_numpy() if volatility is None else volatility, option_type, rate, dividend_yield);
+
+	df['theo'] = greeks.pop('value');
+	for name, values in greeks.items():
+		df[name] = values;
+
+	return df;
@@ -0,0 +1,48 @@
+import json;
+import importlib.util;
+
+
+#
+# Optional fast JSON decoders, in order of preference for json_decoder='auto'
+#
+
+FAST_DECODERS = ('orjson', 'msgspec');
+
+
+def get_json_loads (decoder='auto'):
+	'''
+	Resolve a JSON decoder name into a loads(bytes_or_str) callable.
+
+	Args:
+		• decoder (str or callable, optional): One of 'auto', 'orjson', 'msgspec', 'json', or any callable taking bytes/str. Default is 'auto',
+		  which picks the first of orjson/msgspec that is installed and falls back to the standard library.
+
+	Returns:
+		• callable: A loads function. Every decoder raises a ValueError subclass on malformed input.
+	'''
+	if callable(decoder):
+		return decoder;
+
+	if decoder == 'auto':
+		decoder = next((name for name in FAST_DECODERS if importlib.util.find_spec(name) is not None), 'json');
+
+	if decoder == 'orjson':
+		import orjson;
+		return orjson.loads;
+
+	if decoder == 'msgspec':
+		import msgspec;
+		decode = msgspec.json.decode;
+
+		def loads (data):
+			try:
+				return decode(data);
+			except msgspec.DecodeError as e:
+				raise ValueError(str(e)) from e;
+
+		return loads;
+
+	if decoder == 'json':
+		return json.loads;
+
+	raise ValueError(f"Invalid JSON decoder. One of: auto, {', '.join(FAST_DECODERS)}, json");
@@ -0,0 +1,162 @@
+import numpy as np;
+import pandas as pd;
+
+
+#
+# Custon Exception Class - Indicate Issues Extracting Underlying Ticker Symbol from OCC Symbol
+#
+
+class InvalidOCCSymbolError (Exception):
+	pass;
+
+
+#
+# OCC symbol layout: root (1-6 chars, optionally space-padded) + YYMMDD + C/P + strike * 1000 (8 digits)
+# 	e.g. LMT240119C00300000 -> LMT, 2024-01-19, call, 300.0
+#
+
+OCC_SUFFIX_LENGTH = 15;
+
+OPTION_TYPES = pd.Index(['call', 'put']);
+
+
+def parse_occ (symbols, errors='raise'):
+	'''
+	Parse OCC option symbols into their components in one vectorized pass. A symbol is malformed unless its root is 1-6 characters
+	of [A-Z0-9], its YYMMDD is a real calendar date, its type is C or P and its strike is 8 digits.
+
+	The symbols are laid out as a 2-D array of character codes (one row per symbol, right-aligned) so every component
+	is decoded with array arithmetic on fixed columns instead of a regex match per symbol.
+
+	Args:
+		• symbols (str, list, numpy.ndarray or pandas.Series): OCC symbols. Both compact (LMT240119C00300000) and
+		  space-padded (LMT   240119C00300000) forms are accepted.
+		• errors (str, optional): 'raise' to raise InvalidOCCSymbolError on the first malformed symbol, or 'coerce' to return
+		  null components for malformed symbols. Default is 'raise'.
+
+	Returns:
+		• pandas.DataFrame: One row per symbol with columns
+			symbol (str), root_symbol (str), expiration_date (datetime64), option_type (category: call/put), strike (float64).
+		  The index of a pandas.Series input is preserved.
+
+	Example:
+		>>> parse_occ(['LMT240119C00300000', 'SPXW241220P05850000'])
+		               symbol root_symbol expiration_date option_type  strike
+		0  LMT240119C00300000         LMT      2024-01-19        call   300.0
+		1 SPXW241220P05850000        SPXW      2024-12-20         put  5850.0
+	'''
+	if errors not in ('raise', 'coerce'):
+		raise ValueError("Invalid errors. One of: raise, coerce");
+
+	index = symbols.index if isinstance(symbols, pd.Series) else None;
+
+	if isinstance(symbols, str):
+		symbols = [symbols];
+
+	symbols = np.asarray(symbols, dtype=str).ravel();
+	n = len(symbols);
+	width = max(symbols.dtype.itemsize // 4, OCC_SUFFIX_LENGTH + 1);
+
+	#
+	# Right-align every symbol so the 15-character suffix occupies the same columns in every row
+	#
+
+	if n:
+		chars = np.char.rjust(symbols, width).astype(f"<U{width}").view(np.uint32).reshape(n, width);
+	else:
+		chars = np.zeros((0, width), dtype=np.uint32);
+	digits = chars[:, -OCC_SUFFIX_LENGTH:].astype(np.int64) - ord('0');
+
+	date_digits = digits[:, :6];
+	type_codes = chars[:, -9];
+	strike_digits = digits[:, -8:];
+
+	year 	= 2000 + date_digits[:, 0] * 10 + date_digits[:, 1];
+	month 	= date_digits[:, 2] * 10 + date_digits[:, 3];
+	day 	= date_digits[:, 4] * 10 + date_digits[:, 5];
+
+	root_chars = chars[:, :-OCC_SUFFIX_LENGTH];
+	root = np.char.strip(np.ascontiguousarray(root_chars).view(f"<U{width - OCC_SUFFIX_LENGTH}").ravel());
+
+	#
+	# Build the expiry from its parts; a day past the end of the month (e.g. 240231) rolls into the next month and fails the round-trip check
+	#
+
+	month_start = (year - 1970).astype('datetime64[Y]') + (month.clip(1, 12) - 1).astype('timedelta64[M]');
+	expiry = month_start.astype('datetime64[D]') + (day.clip(1, 31) - 1).astype('timedelta64[D]');
+
+	valid = (
+		((date_digits >= 0) & (date_digits <= 9)).all(axis=1) &
+		((strike_digits >= 0) & (strike_digits <= 9)).all(axis=1) &
+		((type_codes == ord('C')) | (type_codes == ord('P'))) &
+		(month >= 1) & (month <= 12) & (day >= 1) & (day <= 31) &
+		(expiry.astype('datetime64[M]') == month_start) &
+		(np.char.str_len(root) > 0) & (np.char.str_len(root) <= 6) & np.char.isalnum(root) &
+		((root_chars == ord(' ')) | ((root_chars >= ord('0')) & (root_chars <= ord('9'))) | ((root_chars >= ord('A')) & (root_chars <= ord('Z')))).all(axis=1)
+	);
+
+	if errors == 'raise' and not valid.all():
+		raise InvalidOCCSymbolError(f"Malformed OCC symbol: {str(symbols[~valid][0])!r}");
+
+	expiry[~valid] = np.datetime64('NaT');
+
+	strike = (strike_digits * 10 ** np.arange(7, -1, -1)).sum(axis=1) / 1000;
+	strike[~valid] = np.nan;
+
+	type_codes = np.where(valid, (type_codes == ord('P')).astype(np.int8), -1);
+
+	return pd.DataFrame({
+		'symbol' 			: symbols.astype(object),
+		'root_symbol' 		: np.where(valid, root.astype(object), None),
+		'expiration_date' 	: expiry,
+		'option_type' 		: pd.Categorical.from_codes(type_codes, categories=OPTION_TYPES),
+		'strike' 			: strike
+	}, index=index);
+
+
+def build_occ (root_symbol, expiration_date, option_type, strike):
+	'''
+	Build OCC option symbols from their components. Every argument may be a scalar or an array of the same length.
+
+	Args:
+		• root_symbol (str or array-like): Option root, e.g. 'SPXW'.
+		• expiration_date (str, date or array-like): Expiry date(s), anything pandas.to_datetime accepts.
+		• option_type (str or array-like): 'call'/'put' or 'C'/'P' (case-insensitive).
+		• strike (float or array-like): Strike price(s), in dollars.
+
+	Returns:
+		• str if every argument is a scalar, otherwise numpy.ndarray of str.
+
+	Example:
+		>>> build_occ('LMT', '2024-01-19', 'call', 300)
+		'LMT240119C00300000'
+		>>> build_occ('SPY', '2024-12-20', ['call', 'put'], [600, 605.5])
+		array(['SPY241220C00600000', 'SPY241220P00605500'], dtype='<U18')
+	'''
+	scalar = all(np.ndim(arg) == 0 for arg in (root_symbol, expiration_date, option_type, strike));
+
+	expiry = np.atleast_1d(pd.to_datetime(expiration_date)).astype('datetime64[D]');
+	year 	= expiry.astype('datetime64[Y]').astype(np.int64) + 1970;
+	month 	= expiry.astype('datetime64[M]').astype(np.int64) % 12 + 1;
+	day 	= (expiry - expiry.astype('datetime64[M]')).astype(np.int64) + 1;
+	yymmdd 	= (year % 100) * 10000 + month * 100 + day;
+
+	option_type = np.char.upper(np.atleast_1d(np.asarray(option_type, dtype=str)));
+	type_letter = np.char.ljust(option_type, 1).astype('<U1');
+
+	if not np.isin(type_letter, ['C', 'P']).all():
+		raise InvalidOCCSymbolError("Invalid option_type. One of: call, put, C, P");
+
+	strike_code = np.rint(np.atleast_1d(np.asarray(strike, dtype=np.float64)) * 1000).astype(np.int64);
+
+	if (strike_code < 0).any() or (strike_code > 99999999).any():
+		raise InvalidOCCSymbolError("Strike out of range for an OCC symbol");
+
+	occ = np.char.add(np.char.add(np.char.add(
+		np.char.upper(np.atleast_1d(np.asarray(root_symbol, dtype=str))),
+		np.char.zfill(yymmdd.astype(str), 6)),
+		type_letter),
+		np.char.zfill(strike_code.astype(str), 8)
+	);
+
+	return str(occ[0]) if scalar else occ;
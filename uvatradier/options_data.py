@@ -1,14 +1,42 @@
 from .base import Tradier
+from .occ import parse_occ
+from .ttl_cache import TTLCache, thaw
+from .expiry_index import ExpiryIndex
+from .chain_store import ChainStore
+from .schemas import records_to_frame, restore_categoricals, COMPACT_CHAIN_SCHEMA
 
 import requests
 import pandas as pd
+import numpy as np
 import re
 from datetime import datetime, timedelta;
+from collections.abc import Mapping;
+import time;
+import threading;
+from concurrent.futures import ThreadPoolExecutor;
 
 
 class OptionsData (Tradier):
-	def __init__ (self, account_number, auth_token, live_trade=False):
-		Tradier.__init__(self, account_number, auth_token, live_trade);
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None, cache=None, chain_store=None):
+		Tradier.__init__(self, account_number, auth_token, live_trade, transport);
+
+		#
+		# Cache of expirations/strikes/option symbols, which change at most daily.
+		# None -> in-memory cache with the default TTL, a str -> cache persisted in that directory, False -> no caching
+		#
+
+		if cache is None or isinstance(cache, str):
+			cache = TTLCache(path=cache);
+
+		self.cache = cache or None;
+		self.expiry_indexes = dict(); 			# symbol -> (expires, ExpiryIndex), refreshed with the cache's TTL
+		self.expiry_index_lock = threading.Lock();
+
+		#
+		# Optional local store of chain snapshots written by snapshot_chain
+		#
+
+		self.chain_store = ChainStore(chain_store) if isinstance(chain_store, str) else chain_store;
 
 		#
 		# Option data endpoints
@@ -23,26 +51,100 @@ class OptionsData (Tradier):
 	# Fetch all option chain data across all available expiries
 	#
 
-	def get_chain_all (self, symbol):
+	def get_chain_all (self, symbol, max_workers=8, compact=False, drop_constant=True):
+		'''
+			This function returns option chain data for every available expiry of a given symbol.
+
+			Arguments:
+				• symbol: string ticker symbol of underlying
+				• max_workers: number of expiries fetched concurrently. Set to 1 to fetch one expiry at a time.
+				• compact: if True, return a memory-compact frame (see get_chain_day).
+				• drop_constant: if True, drop columns that are constant within each expiry's chain (see get_chain_day).
+			Returns:
+				• pandas.DataFrame whose rows are individual contracts, ordered by expiry as returned by get_expiry_dates.
+		'''
 		expiry_dates = self.get_expiry_dates(symbol)
 
-		df = pd.DataFrame()
+		if not expiry_dates:
+			return pd.DataFrame()
+
+		#
+		# Fetch each expiry's chain (concurrently if permitted) and concatenate once at the end
+		#
 
-		for expiry in expiry_dates:
-			df = pd.concat([df, self.get_chain_day(symbol=symbol, expiry=expiry)])
+		fetch_chain = lambda expiry: self.get_chain_day(symbol=symbol, expiry=expiry, compact=compact, drop_constant=drop_constant)
 
-		return df
+		if max_workers > 1 and len(expiry_dates) > 1:
+			with ThreadPoolExecutor(max_workers=min(max_workers, len(expiry_dates))) as executor:
+				chains = list(executor.map(fetch_chain, expiry_dates))
+		else:
+			chains = [fetch_chain(expiry) for expiry in expiry_dates]
+
+		df = pd.concat(chains)
+
+		return restore_categoricals(df, COMPACT_CHAIN_SCHEMA) if compact else df
 
 
 
+	#
+	# Snapshot every expiry's chain into the chain store
+	#
+
+	def snapshot_chain (self, symbol, time=None, max_workers=8):
+		'''
+			This function fetches the full option chain of a symbol (every expiry, all columns) and writes it to the chain store,
+			which keeps only the fields that changed since the previous snapshot.
+
+			Arguments:
+				• symbol: string ticker symbol of underlying
+				• time: snapshot time. Defaults to now.
+				• max_workers: number of expiries fetched concurrently.
+			Returns:
+				• [string] 'key' if a full keyframe was written, 'delta' if only changed fields were written.
+
+			Example:
+				>>> options_data = OptionsData(tradier_acct, tradier_token, chain_store='~/tradier_chains')
+				>>> options_data.snapshot_chain('SPY')
+				'key'
+				>>> options_data.snapshot_chain('SPY') 			# one minute later
+				'delta'
+		'''
+		if self.chain_store is None:
+			raise ValueError("No chain store. Pass chain_store=ChainStore(path) (or a path) to OptionsData.");
+
+		time = pd.Timestamp(time) if time is not None else pd.Timestamp.now();
+		chain = self.get_chain_all(symbol, max_workers=max_workers, drop_constant=False);
+
+		return self.chain_store.write(symbol, chain, time);
+
+
 	#
 	# Fetch all option chain data for a single day of contract expirations
 	#
 
-	def get_chain_day (self, symbol, expiry='', strike=False, strike_low=False, strike_high=False, option_type=False):
+	def get_chain_day (self, symbol, expiry='', strike=False, strike_low=False, strike_high=False, option_type=False, compact=False, drop_constant=True, strike_window=None, center=None):
 		'''
 			This function returns option chain data for a given symbol.
 			All contract expirations occur on the same expiry date
+
+			If compact=True, the frame is typed per schemas.COMPACT_CHAIN_SCHEMA to cut its memory footprint:
+			categorical exchange codes/types/roots, float32 prices and strikes, downcast counts,
+			and datetime64 bid_date/ask_date/trade_date/expiration_date columns.
+
+			Arguments:
+				• strike, strike_low, strike_high, option_type: row filters, applied together as a single mask.
+				  With strike_window, `strike` only centers the window (when center is not given) and does not filter rows.
+				• drop_constant: if True (default), drop columns that hold the same value (or no value) in every row of the expiry's chain.
+				  The columns identifying contracts (symbol, strike, option_type) are always kept, even in a one-strike window.
+				• strike_window: if given, only keep the strike_window strikes on each side of `center` (taken from the cached
+				  strike list for the expiry). Contracts outside the window are discarded before the DataFrame is built,
+				  so constant columns are detected on the contracts inside the window.
+				• center: price to center the strike window on, e.g. the underlying's last price. Defaults to `strike`.
+
+			Example:
+				# The 10 strikes either side of the underlying's price, calls only
+				>>> spot = quotes.get_quote_day('SPX', last_price=True)
+				>>> options_data.get_chain_day('SPX', expiry='2024-12-20', option_type='call', strike_window=10, center=spot)
 		'''
 
 		#
@@ -52,11 +154,25 @@ class OptionsData (Tradier):
 		if not expiry:
 			expiry = self.get_expiry_dates(symbol)[0];
 
+		#
+		# Resolve the strike window from the (cached) strike list before requesting the chain
+		#
+
+		if strike_window is not None:
+			if center is None:
+				center = strike;
+			if center is False or center is None:
+				raise ValueError("strike_window requires center (or strike) to center the window on.");
+
+			window = self.get_strike_window(symbol, expiry, center, strike_window);
+			if window is None:
+				return pd.DataFrame();
+
 		#
 		# Define request object for given symbol and expiration
 		#
 
-		r = requests.get(
+		r = self.transport.get(
 			url 	= f"{self.BASE_URL}/{self.OPTIONS_CHAIN_ENDPOINT}",
 			params 	= {'symbol':symbol, 'expiration':expiry, 'greeks':'false'},
 			headers = self.REQUESTS_HEADERS
@@ -66,62 +182,109 @@ class OptionsData (Tradier):
 		if not response_json.get("options") or "option" not in response_json["options"]:
 			return pd.DataFrame()
 
+		option_records = response_json['options']['option']
+
+		if isinstance(option_records, dict):
+			option_records = [option_records];
+
 		#
-		# Convert returned json -> pandas dataframe
+		# Strike window: discard contracts outside the window before building the dataframe
 		#
 
-		option_df = pd.DataFrame(r.json()['options']['option'])
+		if strike_window is not None:
+			keep_type = option_type if option_type in ['call', 'put'] else None;
+			option_records = [
+				record for record in option_records
+				if window[0] <= record['strike'] <= window[1] and (keep_type is None or record['option_type'] == keep_type)
+			];
 
+			if not option_records:
+				return pd.DataFrame();
 
 		#
-		# Remove columns which have the same value for every row
+		# Convert returned json -> pandas dataframe
 		#
 
-		cols_to_drop = option_df.nunique()[option_df.nunique() == 1].index
-		option_df = option_df.drop(cols_to_drop, axis=1)
+		option_df = records_to_frame(option_records, COMPACT_CHAIN_SCHEMA) if compact else pd.DataFrame(option_records)
+
 
 		#
-		# Remove columns which have NaN in every row
+		# Filter rows per strike_low, strike_high, strike and option_type with a single boolean mask.
+		# The mask is built before constant columns are dropped, so the filter columns are always present.
 		#
 
-		cols_to_drop = option_df.nunique()[option_df.nunique() == 0].index;
-		option_df = option_df.drop(cols_to_drop, axis=1);
+		mask = np.ones(len(option_df), dtype=bool);
+
+		if strike_low or strike_high or strike:
+			strikes = option_df['strike'].to_numpy();
+			as_strike = lambda value: np.asarray(value, dtype=strikes.dtype);
 
+			if strike_low:
+				mask &= strikes >= as_strike(strike_low);
+
+			if strike_high:
+				mask &= strikes <= as_strike(strike_high);
+
+			if strike and strike_window is None:
+				mask &= strikes == as_strike(strike);
+
+		if option_type in ['call', 'put']:
+			mask &= (option_df['option_type'] == option_type).to_numpy();
 
 		#
-		# Remove description column because its information is redundant
+		# Remove columns which have the same value for every row (or NaN in every row) of the chain, and the redundant description column.
+		# Contract identifiers are kept: a narrow strike window can leave them constant.
 		#
 
 		cols_to_drop = ['description'];
-		option_df = option_df.drop(cols_to_drop, axis=1);
 
+		if drop_constant:
+			distinct = option_df.nunique();
+			cols_to_drop += [column for column in distinct.index[distinct <= 1] if column not in ('symbol', 'strike', 'option_type')];
+
+		if not mask.all():
+			option_df = option_df[mask];
+
+		option_df = option_df.drop(cols_to_drop, axis=1, errors='ignore');
 
 		#
-		# Filter rows per strike_low and strike_high
+		# Return the resulting dataframe whose rows are individual contracts with expiration `expiry`
 		#
 
-		if strike_low:
-			option_df = option_df.query('strike >= @strike_low');
+		return option_df;
 
-		if strike_high:
-			option_df = option_df.query('strike <= @strike_high');
 
-		if strike:
-			option_df = option_df.query('strike == @strike');
+	#
+	# Strike bounds of a window of strikes around a price, from the cached strike list
+	#
 
-		if option_type in ['call', 'put']:
-			option_df = option_df.query('option_type == @option_type');
+	def get_strike_window (self, symbol, expiry, center, width):
+		'''
+			This function returns the (lowest, highest) strike of the `width` listed strikes on each side of `center` for one expiry,
+			using the cached strike list from get_expiry_dates(symbol, strikes=True). Returns None if the expiry has no strikes.
 
+			Example:
+				>>> options_data.get_strike_window('SPY', '2024-12-20', center=601.3, width=2)
+				(599.0, 603.0)
+		'''
+		expirations = (self.get_expiry_dates(symbol, strikes=True) or dict()).get('expiration') or list();
 
-		if option_type:
-			if option_type in ['call', 'put']:
-				option_df = option_df.query('option_type == @option_type');
+		if isinstance(expirations, Mapping):
+			expirations = [expirations];
 
-		#
-		# Return the resulting dataframe whose rows are individual contracts with expiration `expiry`
-		#
+		listed = next((e.get('strikes') for e in expirations if e.get('date') == expiry), None);
+		if not listed:
+			return None;
 
-		return option_df;
+		strikes = np.sort(np.atleast_1d(np.asarray(listed['strike'], dtype=np.float64)));
+		if not len(strikes):
+			return None;
+
+		nearest = np.clip(np.searchsorted(strikes, center), 0, len(strikes) - 1);
+		if nearest > 0 and abs(strikes[nearest - 1] - center) <= abs(strikes[nearest] - center):
+			nearest -= 1;
+
+		return float(strikes[max(nearest - width, 0)]), float(strikes[min(nearest + width, len(strikes) - 1)]);
 
 
 	#
@@ -147,13 +310,75 @@ class OptionsData (Tradier):
 				>>> options_data.get_closest_expiry(symbol='XOM', num_days=30)
 				'2024-08-02'
 		'''
-		expiry_dates = self.get_expiry_dates(symbol);
-		todays_date = datetime.now();
-		future_date = todays_date + timedelta(days=num_days);
-		expiries_dt = [datetime.strptime(d, "%Y-%m-%d") for d in expiry_dates];
-		closest_expiry = min(expiries_dt, key=lambda date: abs(date-future_date));
+		future_date = datetime.now() + timedelta(days=num_days);
+
+		return self.get_expiry_index(symbol).nearest(future_date);
+
+
+	#
+	# Helper function to retrieve the nearest maturity dates for many (symbol, num_days) pairs at once
+	#
+
+	def get_closest_expiries (self, pairs):
+		'''
+			Batch form of get_closest_expiry.
 
-		return closest_expiry.strftime("%Y-%m-%d");
+			Arguments:
+				• pairs: iterable of (symbol, num_days) tuples.
+			Returns:
+				• [list] 'YYYY-mm-dd' maturity dates, in the same order as pairs. Each symbol's expiries are fetched (or read from the cache) once.
+
+			Example:
+				>>> options_data.get_closest_expiries([('XOM', 30), ('XOM', 60), ('CVX', 30)])
+				['2024-08-02', '2024-08-30', '2024-08-02']
+		'''
+		pairs = list(pairs);
+		now = datetime.now();
+		closest = [None] * len(pairs);
+
+		positions = dict();
+		for i, (symbol, num_days) in enumerate(pairs):
+			positions.setdefault(symbol, list()).append(i);
+
+		for symbol, indices in positions.items():
+			targets = [now + timedelta(days=pairs[i][1]) for i in indices];
+			for i, expiry in zip(indices, self.get_expiry_index(symbol).nearest_many(targets)):
+				closest[i] = str(expiry) if expiry is not None else None;
+
+		return closest;
+
+
+	#
+	# Sorted index of a symbol's expiries for binary-search lookups
+	#
+
+	def get_expiry_index (self, symbol):
+		'''
+			This function returns an ExpiryIndex of the symbol's expiries, which answers nearest/bracketing/within-window queries by binary search.
+			The index is rebuilt only when the cached expirations expire (see OptionsData(cache=...)).
+
+			Example:
+				>>> index = options_data.get_expiry_index('XOM')
+				>>> index.bracket('2024-08-01')
+				('2024-07-26', '2024-08-02')
+				>>> index.within('2024-08-01', '2024-09-30')
+				['2024-08-02', '2024-08-09', '2024-08-16', '2024-08-23', '2024-08-30', '2024-09-20']
+		'''
+		key = symbol.upper();
+
+		with self.expiry_index_lock:
+			cached = self.expiry_indexes.get(key);
+
+		if cached is not None and cached[0] > time.monotonic():
+			return cached[1];
+
+		index = ExpiryIndex(self.get_expiry_dates(symbol));
+
+		if self.cache is not None:
+			with self.expiry_index_lock:
+				self.expiry_indexes[key] = (time.monotonic() + self.cache.ttl, index);
+
+		return index;
 
 
 
@@ -169,6 +394,10 @@ class OptionsData (Tradier):
 			If strikes=False 	-> returns limst or list of dict: A list of expiry dates in the format 'YYYY-MM-DD'.
 			If strikes=True 	-> returns a dict, the value of whose only key, `expiration`, is a list whose elements are dictionaries with dates and strike prices.
 
+		Notes:
+			• Results are cached per symbol for the cache's TTL (see OptionsData(cache=...)). Use invalidate_cache to force a refresh.
+			  Every call returns its own plain list/dict copy, so callers may modify it.
+
 		Example:
 			# Instantiate with account number and authorization token
 			>>> options_data = OptionsData(tradier_acct, tradier_token)
@@ -192,20 +421,28 @@ class OptionsData (Tradier):
 			]}
 		'''
 
-		try:
-			r = requests.get(
-				url 	= f"{self.BASE_URL}/{self.OPTIONS_EXPIRY_ENDPOINT}",
-				params 	= {'symbol':symbol, 'includeAllRoots':True, 'strikes':str(strikes)},
-				headers = self.REQUESTS_HEADERS
-			);
-			r.raise_for_status();
-		except requests.exceptions.RequestException as e:
-			raise RuntimeError(f"No expiries for {symbol}: {str(e)}.");
-
-		try:
-			response_data = r.json()['expirations'];
-		except KeyError:
-			raise ValueError(f"API Response Error. No expirations: {r.json()}");
+		def fetch_expirations ():
+			try:
+				r = self.transport.get(
+					url 	= f"{self.BASE_URL}/{self.OPTIONS_EXPIRY_ENDPOINT}",
+					params 	= {'symbol':symbol, 'includeAllRoots':True, 'strikes':str(strikes)},
+					headers = self.REQUESTS_HEADERS
+				);
+				r.raise_for_status();
+			except requests.exceptions.RequestException as e:
+				raise RuntimeError(f"No expiries for {symbol}: {str(e)}.");
+
+			data = r.json();
+
+			try:
+				return data['expirations'];
+			except KeyError:
+				raise ValueError(f"API Response Error. No expirations: {data}");
+
+		if self.cache is not None:
+			response_data = thaw(self.cache.get_or_fetch(('expirations', symbol.upper(), 'strikes') if strikes else ('expirations', symbol.upper()), fetch_expirations));
+		else:
+			response_data = fetch_expirations();
 
 		if not response_data:
 			print(f"No expiries: {symbol}");
@@ -257,57 +494,50 @@ class OptionsData (Tradier):
 			If df=True, then a pandas.DataFrame object is returned.
 			Each row of the dataframe represents a single put or call contract.
 			The first column is the OCC symbol. The subsequent columns are the parsed values of the OCC symbol.
+			Symbols are parsed in one vectorized pass (see occ.parse_occ, which also returns typed expiries and strikes).
 		'''
 
-		#
-		# Helper function to convert the get_option_symbols list into a dataframe
-		#
-
-		def symbol_list_to_df (option_list):
-			'''
-				This is a helper function called from get_option_symbols.
-				It will parse a list of option symbols into their constituent components
-				For example:
-					option_symbol
-						= [underlying_symbol, expiry_date, option_type, option_id]
-						= [LMT, 240119, C, 00300000]
-			'''
-			parsed_options = []
-
-			for option in option_list:
-				match = re.match(r'([A-Z]+)(\d{6})([CP])(\d+)', option)
-				if match:
-					root_symbol, expiration_date, option_type, strike_price = match.groups()
-					parsed_options.append({'symbol':option,'root_symbol':root_symbol, 'expiration_date':expiration_date, 'option_type':option_type, 'strike_price':strike_price})
-			return pd.DataFrame(parsed_options);
-		
-		
-		#
-		# Helper function to turn the option dates into standard date format
-		#
-		def parse_option_expiries (expiry_list):
-			'''
-				Helper function to turn the option dates into standard date format
-			'''
+		def fetch_options_symbols ():
+			r = self.transport.get(
+				url 		= f"{self.BASE_URL}/{self.OPTIONS_SYMBOL_ENDPOINT}",
+				params 		= {'underlying':symbol},
+				headers 	= self.REQUESTS_HEADERS
+			);
 
-			formatted_expiries = [];
-			for x in expiry_list:
-				formatted_expiries.append(datetime.strptime(x, '%y%m%d').strftime('%Y-%m-%d'));
+			return r.json()['symbols'][0]['options'];
 
-			return formatted_expiries;
+		if self.cache is not None:
+			option_list = thaw(self.cache.get_or_fetch(('options_symbols', symbol.upper()), fetch_options_symbols));
+		else:
+			option_list = fetch_options_symbols();
 
+		if df:
+			option_df = parse_occ(option_list, errors='coerce').dropna(subset=['root_symbol']).reset_index(drop=True);
+			return pd.DataFrame({
+				'symbol' 			: option_df['symbol'],
+				'root_symbol' 		: option_df['root_symbol'],
+				'expiration_date' 	: np.datetime_as_string(option_df['expiration_date'].to_numpy(), unit='D'),
+				'option_type' 		: option_df['option_type'].map({'call':'C', 'put':'P'}).astype(str),
+				'strike_price' 		: option_df['symbol'].str[-8:]
+			});
 
-		r = requests.get(
-			url 		= f"{self.BASE_URL}/{self.OPTIONS_SYMBOL_ENDPOINT}",
-			params 		= {'underlying':symbol},
-			headers 	= self.REQUESTS_HEADERS
-		);
+		return option_list;
 
-		option_list = r.json()['symbols'][0]['options'];
 
-		if df:
-			option_df = symbol_list_to_df(option_list);
-			option_df['expiration_date'] = parse_option_expiries(option_df['expiration_date']);
-			return option_df;
+	#
+	# Drop cached expirations/strikes/option symbols
+	#
 
-		return option_list;
+	def invalidate_cache (self, symbol=None):
+		'''
+			Drop cached expirations, strikes and option symbols for a symbol (or for every symbol if symbol=None),
+			so the next call requests fresh data from Tradier.
+		'''
+		if self.cache is not None:
+			self.cache.invalidate(symbol);
+
+		with self.expiry_index_lock:
+			if symbol is None:
+				self.expiry_indexes.clear();
+			else:
+				self.expiry_indexes.pop(symbol.upper(), None);
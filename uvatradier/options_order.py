@@ -1,4 +1,5 @@
 from .base import Tradier
+from .occ import parse_occ, InvalidOCCSymbolError
 
 from typing import Optional, Dict, Any
 import requests
@@ -14,14 +15,6 @@ class InvalidOrderParameterError (Exception):
 	pass;
 
 
-#
-# Custon Exception Class - Indicate Issues Extracting Underlying Ticker Symbol from OCC Symbol
-#
-
-class InvalidOCCSymbolError (Exception):
-	pass;
-
-
 #
 # Custom Exception Class - Indicate Issues with API Requests
 #
@@ -36,8 +29,8 @@ class APIRequestError (Exception):
 #
 
 class OptionsOrder (Tradier):
-	def __init__ (self, account_number, auth_token, live_trade=False):
-		Tradier.__init__(self, account_number, auth_token, live_trade);
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None):
+		Tradier.__init__(self, account_number, auth_token, live_trade, transport);
 
 		#
 		# Order endpoint
@@ -56,7 +49,7 @@ class OptionsOrder (Tradier):
 				underlying: asset symbol (e.g. 'SPY')
 				option0: OCC symbol of
 		'''
-		r = requests.post(
+		r = self.transport.post(
 			url 	= '{}/{}'.format(self.BASE_URL, self.ORDER_ENDPOINT),
 			data 	= {
 				'class' 			: 'multileg',
@@ -99,7 +92,7 @@ class OptionsOrder (Tradier):
 						• long call exercised and can buy XYZ at K2 = $60
 						• payoff = (K1-K2) + (premium differential) < 0
 		'''
-		r = requests.post(
+		r = self.transport.post(
 			url 	= '{}/{}'.format(self.BASE_URL, self.ORDER_ENDPOINT),
 			data 	= {
 				'class' 			: 'multileg',
@@ -124,7 +117,7 @@ class OptionsOrder (Tradier):
 	#
 
 	def bull_put_spread (self, underlying_symbol, option_symbol_0, quantity_0, option_symbol_1, quantity_1, duration='day'):
-		r = requests.post(
+		r = self.transport.post(
 			url 	= '{}/{}'.format(self.BASE_URL, self.ORDER_ENDPOINT),
 			data 	= {
 				'class' 			: 'multileg',
@@ -148,7 +141,7 @@ class OptionsOrder (Tradier):
 	#
 
 	def bull_call_spread (self, underlying_symbol, option_symbol_0, quantity_0, option_symbol_1, quantity_1, duration='day'):
-		r = requests.post(
+		r = self.transport.post(
 			url 	= '{}/{}'.format(self.BASE_URL, self.ORDER_ENDPOINT),
 			data 	= {
 				'class' 			: 'multileg',
@@ -169,17 +162,14 @@ class OptionsOrder (Tradier):
 
 
 	def extract_occ_underlying (self, occ_symbol):
-		try:
-			pattern = r'^([A-Z]+(?:[A-Z])?)(?=[0-9]{6}[CP])';
-			match = re.match(pattern, occ_symbol);
-			if match:
-				underlying = match.group(1);
-				if underlying:
-					return underlying;
-				else:
-					return None;
-		except Exception as e:
-			raise InvalidOCCSymbolError(f"No underlying extracted for OCC: {occ_symbol}. Error: {str(e)}");
+		'''
+		Root symbol of an OCC symbol (e.g. 'TER' for 'TER230915C00110000'), or None if it is not a valid OCC symbol.
+		To parse many symbols at once, use occ.parse_occ.
+		'''
+		if not isinstance(occ_symbol, str):
+			raise InvalidOCCSymbolError(f"No underlying extracted for OCC: {occ_symbol}. Error: OCC symbols must be strings");
+
+		return parse_occ(occ_symbol, errors='coerce')['root_symbol'].iloc[0];
 
 
 	def options_order (self, occ_symbol, order_type, side, quantity, underlying=None, limit_price=None, stop_price=None, duration='day'):
@@ -258,7 +248,7 @@ class OptionsOrder (Tradier):
 			r_data['stop'] = stop_price;
 
 		try:
-			r = requests.post(
+			r = self.transport.post(
 				url = f"{self.BASE_URL}/{self.ORDER_ENDPOINT}",
 				data = r_data,
 				headers = self.REQUESTS_HEADERS
@@ -277,7 +267,7 @@ class OptionsOrder (Tradier):
 
 	def cancel_order (self, order_id):
 		try:
-			r = requests.delete(url=f"{self.BASE_URL}/{self.ORDER_ENDPOINT}/{order_id}", headers=self.REQUESTS_HEADERS)
+			r = self.transport.delete(url=f"{self.BASE_URL}/{self.ORDER_ENDPOINT}/{order_id}", headers=self.REQUESTS_HEADERS)
 			r.raise_for_status()
 			return r.json()
 		except requests.RequestException as e:
@@ -402,7 +392,7 @@ class OptionsOrder (Tradier):
 		#
 
 		try:
-			r = requests.post(
+			r = self.transport.post(
 				url = f"{self.BASE_URL}/{self.ORDER_ENDPOINT}",
 				data = r_data,
 				headers = self.REQUESTS_HEADERS
@@ -1,4 +1,6 @@
 from .base import Tradier
+from .bar_store import BarStore
+from .schemas import records_to_frame, HISTORY_SCHEMA, QUOTE_SCHEMA, TIMESALES_SCHEMA, COMPACT_QUOTE_SCHEMA
 import pandas as pd
 import requests
 import datetime
@@ -6,10 +8,17 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import warnings;
 from requests.exceptions import RequestException
+from concurrent.futures import ThreadPoolExecutor;
 
 class Quotes (Tradier):
-	def __init__ (self, account_number, auth_token, live_trade=False):
-		Tradier.__init__(self, account_number, auth_token, live_trade);
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None, bar_store=None):
+		Tradier.__init__(self, account_number, auth_token, live_trade, transport);
+
+		#
+		# Optional local store of historical bars consulted by get_historical_quotes
+		#
+
+		self.bar_store = BarStore(bar_store) if isinstance(bar_store, str) else bar_store;
 
 		#
 		# Quotes endpoints for market data about equities
@@ -20,7 +29,7 @@ class Quotes (Tradier):
 		self.QUOTES_SEARCH_ENDPOINT 		= "v1/markets/search"; 											# GET
 		self.QUOTES_TIMESALES_ENDPOINT 		= "v1/markets/timesales"; 										# GET
 
-	def get_historical_quotes (self, symbol, interval='daily', start_date=None, end_date=None, verbose=False):
+	def get_historical_quotes (self, symbol, interval='daily', start_date=None, end_date=None, verbose=False, use_store=True):
 		'''
 		Fetch historical OHLCV bar data for a given security's symbol from the Tradier Account API.
 
@@ -30,6 +39,7 @@ class Quotes (Tradier):
 			• start_date (str 'YYYY-MM-DD', optional): The start date for historical data. Default contingent on interval argument (see Notes below).
 			• end_date (str 'YYYY-MM-DD', optional): The end date for historical data. Default is current date.
 			• verbose (bool, optional): Print (possibly) helpful debugging info about request parameters, api response, etc.
+			• use_store (bool, optional): If the Quotes object has a bar_store, answer from it and only request missing bars from Tradier. Default is True.
 
 		Returns:
 			• pandas.DataFrame: A DataFrame containing historical stock data for the specified symbol.
@@ -40,6 +50,7 @@ class Quotes (Tradier):
 				• interval='weekly' 	-> start_date = 12 weeks before end_date
 				• interval='monthly' 	-> start_date = 1 year before end_date
 			• Tradier does not maintain historical data for expired options.
+			• With a bar_store (see BarStore), previously downloaded bars are read from disk and only the missing tail (or head) of the range is requested.
 
 		Example 1: Minimal Arguments.
 			# Create a Quotes instance.
@@ -202,68 +213,179 @@ class Quotes (Tradier):
 
 			start_date = tmp_dt.strftime('%Y-%m-%d');
 
-		try:
-			if verbose:
-				print("Sending HTTP GET Request...");
-				print(f"HTTP Request Params: (symbol={symbol}, interval={interval}, start={start_date}, end={end_date})\n");
+		#
+		# Helper function to request bars for [start, end] from Tradier
+		#
 
-			#
-			# HTTP GET Request
-			#
+		def fetch_bars (start, end, allow_empty=False):
+			try:
+				if verbose:
+					print("Sending HTTP GET Request...");
+					print(f"HTTP Request Params: (symbol={symbol}, interval={interval}, start={start}, end={end})\n");
 
-			r = requests.get(
-				url  	= f"{self.BASE_URL}/{self.QUOTES_HISTORICAL_ENDPOINT}",
-				params 	= {'symbol':symbol, 'interval':interval, 'start':start_date, 'end':end_date},
-				headers = self.REQUESTS_HEADERS
-			);
-			r.raise_for_status();
+				#
+				# HTTP GET Request
+				#
 
-			data = r.json();
+				r = self.transport.get(
+					url  	= f"{self.BASE_URL}/{self.QUOTES_HISTORICAL_ENDPOINT}",
+					params 	= {'symbol':symbol, 'interval':interval, 'start':start, 'end':end},
+					headers = self.REQUESTS_HEADERS
+				);
+				r.raise_for_status();
+
+				data = r.json();
+
+				if verbose:
+					print(f"DATA:\n{data}\n");
+
+				#
+				# Validate the structure of the API Response from Tradier
+				#
+
+				if not data:
+					raise ValueError(f"Empty API Response. Status Code: {r.status_code}");
+				if 'history' not in data:
+					raise KeyError(f"API response missing 'history'. Received: {data}");
+				if data['history'] is None:
+					if allow_empty:
+						return pd.DataFrame();
+					raise ValueError(f"No historical data for (symbol={symbol}, start_date={start}, end_date={end})");
+				if 'day' not in data['history']:
+					raise KeyError(f"API Response history data missing 'day': {data}");
+
+
+				#
+				# Extract the sought information from the API response and prepare returned dataframe
+				#
+
+				df = records_to_frame(data['history']['day'], HISTORY_SCHEMA);
+
+				if verbose:
+					print(f"Returning Structure:\n{df.info()}\n");
+
+				#
+				# Off you go!
+				#
+
+				return df;
+
+			except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+				raise RuntimeError(f"[Historical Quotes] ... {e}");
+
+		#
+		# Without a bar store, request the whole range from Tradier
+		#
+
+		if self.bar_store is None or not use_store:
+			return fetch_bars(start_date, end_date);
+
+		#
+		# Otherwise only request the ranges missing from the store, merge them in, and answer from the store.
+		# The partition stays locked from computing the gaps to merging them, so concurrent callers do not fetch the same gap twice.
+		#
+
+		start_date 	= pd.Timestamp(start_date).strftime('%Y-%m-%d');
+		end_date 	= pd.Timestamp(end_date).strftime('%Y-%m-%d');
+
+		with self.bar_store.lock(symbol, interval):
+			for missing_start, missing_end in self.bar_store.missing_ranges(symbol, interval, start_date, end_date):
+				if verbose:
+					print(f"Bar store missing (symbol={symbol}, interval={interval}, start={missing_start}, end={missing_end})");
+				self.bar_store.merge(symbol, interval, fetch_bars(missing_start, missing_end, allow_empty=True), missing_start, missing_end);
+
+			df = self.bar_store.read(symbol, interval, start_date, end_date);
+
+		if df.empty:
+			raise RuntimeError(f"[Historical Quotes] ... No historical data for (symbol={symbol}, start_date={start_date}, end_date={end_date})");
+
+		return df;
+
+
+	def get_historical_quotes_bulk (self, symbol_list, interval='daily', start_date=None, end_date=None, max_workers=8, multi_index=False):
+		'''
+		Fetch historical OHLCV bar data for many symbols at once and return it in a single DataFrame.
+
+		Args:
+			• symbol_list (list): Trading symbols (tickers or OCC) of the securities (e.g., ['AAPL', 'MSFT', 'NKE241018P00075000']).
+			• interval (str, optional): The time interval for historical data. Default is 'daily'. One of: daily, weekly, monthly.
+			• start_date (str 'YYYY-MM-DD', optional): The start date for historical data. Same default as get_historical_quotes.
+			• end_date (str 'YYYY-MM-DD', optional): The end date for historical data. Default is current date.
+			• max_workers (int, optional): Maximum number of symbols fetched concurrently. Default is 8.
+			• multi_index (bool, optional): If True, index the result by (symbol, date). Otherwise return long format with a symbol column. Default is False.
+
+		Returns:
+			• pandas.DataFrame: Bar data for every symbol that was fetched successfully, in the order the symbols were given.
+
+		Notes:
+			• Requests go through the shared transport, so they are paced by its rate limiter and retried per its retry policy.
+			• A symbol that fails (bad symbol, no data, request error) does not abort the batch. Failures are printed and recorded
+			  in the returned DataFrame's attrs['failures'] as a {symbol: error message} dict.
+
+		Example:
+			# Create a Quotes instance.
+			>>> quotes = Quotes(tradier_acct, tradier_token)
+
+			# Retrieve daily bars for three banks during the first week of October 2024.
+			>>> bars = quotes.get_historical_quotes_bulk(['MTB', 'C', 'XYZXYZ'], start_date='2024-10-01', end_date='2024-10-04')
+			>>> bars.head(3)
+			  symbol       date    open    high     low   close   volume
+			0    MTB 2024-10-01  175.48  178.97  174.44  176.90   959434
+			1    MTB 2024-10-02  176.20  176.89  173.93  175.23   833210
+			2    MTB 2024-10-03  174.11  175.06  171.90  172.77   781553
+			>>> bars.attrs['failures']
+			{'XYZXYZ': '[Historical Quotes] ... No historical data for (symbol=XYZXYZ, start_date=2024-10-01, end_date=2024-10-04)'}
+		'''
+
+		if isinstance(symbol_list, str):
+			symbol_list = [symbol_list];
+
+		#
+		# Helper function to fetch one symbol's bars without letting its failure abort the batch
+		#
 
-			if verbose:
-				print(f"DATA:\n{data}\n");
+		def fetch_bars (symbol):
+			try:
+				bars = self.get_historical_quotes(symbol, interval=interval, start_date=start_date, end_date=end_date);
+			except Exception as e:
+				return symbol, None, str(e);
 
-			#
-			# Validate the structure of the API Response from Tradier
-			#
+			if bars is None or bars.empty:
+				return symbol, None, f"No historical data returned for {symbol}";
 
-			if not data:
-				raise ValueError(f"Empty API Response. Status Code: {r.status_code}");
-			if 'history' not in data:
-				raise KeyError(f"API response missing 'history'. Received: {data}");
-			if data['history'] is None:
-				raise ValueError(f"No historical data for (symbol={symbol}, start_date={start_date}, end_date={end_date})");
-			if 'day' not in data['history']:
-				raise KeyError(f"API Response history data missing 'day': {data}");
+			bars.insert(0, 'symbol', symbol.upper() if isinstance(symbol, str) else symbol);
+			return symbol, bars, None;
 
+		if max_workers > 1 and len(symbol_list) > 1:
+			with ThreadPoolExecutor(max_workers=min(max_workers, len(symbol_list))) as executor:
+				results = list(executor.map(fetch_bars, symbol_list));
+		else:
+			results = [fetch_bars(symbol) for symbol in symbol_list];
 
-			#
-			# Extract the sought information from the API response and prepare returned dataframe
-			#
+		frames 		= [bars for _, bars, _ in results if bars is not None];
+		failures 	= {symbol:error for symbol, _, error in results if error is not None};
 
-			df = pd.json_normalize(data['history']['day']);
-			df['date'] = pd.to_datetime(df['date']);
+		if failures:
+			print(f"Historical Quotes Bulk: {len(failures)} of {len(symbol_list)} symbols failed: {', '.join(map(str, failures))}");
 
-			if verbose:
-				print(f"Returning Structure:\n{df.info()}\n");
+		df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['symbol', 'date', 'open', 'high', 'low', 'close', 'volume']);
 
-			#
-			# Off you go!
-			#
+		if multi_index:
+			df = df.set_index(['symbol', 'date']);
 
-			return df;
+		df.attrs['failures'] = failures;
 
-		except (requests.exceptions.RequestException, ValueError, KeyError) as e:
-			raise RuntimeError(f"[Historical Quotes] ... {e}");
+		return df;
 
 
-	def get_quote_day (self, symbol, last_price=False):
+	def get_quote_day (self, symbol, last_price=False, compact=False):
 		'''
 		Fetch the current quote data for a given symbol from the Tradier Account API.
 
 		Args:
 			• symbol (str): The trading symbol of the stock (e.g., 'AAPL', 'MSFT') for which you want to retrieve the current quote data.
 			• last_price (bool, optional): If True, only fetch the last price of the symbol. Default is False.
+			• compact (bool, optional): If True, return a memory-compact frame typed per schemas.COMPACT_QUOTE_SCHEMA (categoricals, float32 prices, downcast counts, datetime64 timestamps). Default is False.
 
 		Returns:
 			• pandas.DataFrame or float: A DataFrame containing the current quote data for the specified symbol or just the last price as a float if last_price is set to True.
@@ -318,7 +440,7 @@ class Quotes (Tradier):
 
 		try:
 
-			r = requests.get(
+			r = self.transport.get(
 				url 	= f"{self.BASE_URL}/{self.QUOTES_ENDPOINT}",
 				params 	= {'symbols':symbol, 'greeks':'false'},
 				headers = self.REQUESTS_HEADERS
@@ -337,7 +459,7 @@ class Quotes (Tradier):
 
 			quote_data = quote_dict['quote'];
 
-			df_quote = pd.json_normalize(quote_data);
+			df_quote = records_to_frame(quote_data, COMPACT_QUOTE_SCHEMA) if compact else pd.json_normalize(quote_data);
 
 			if last_price:
 				if not isinstance(last_price, bool):
@@ -357,7 +479,7 @@ class Quotes (Tradier):
 		except Exception as e:
 			return f"Something has gone terribly wrong: {str(e)}";
 
-	def get_quote_data (self, symbol_list):
+	def get_quote_data (self, symbol_list, chunk_size=500, max_workers=8, compact=False):
 		'''
 		Retrieve a dataframe with current quote data for a specified list of stock symbols.
 		The returned DataFrame can be used to quickly compare properties of different stocks side-by-side.
@@ -365,11 +487,18 @@ class Quotes (Tradier):
 		Args:
 			• symbol (list):
 				• List whose elements are strings that denote the desired symbol ['ONE', 'TWO', 'ETC']
+			• chunk_size (int, optional): Maximum number of symbols sent in a single request. Default is 500.
+			• max_workers (int, optional): Maximum number of chunk requests in flight at once. Default is 8.
+			• compact (bool, optional): If True, return a memory-compact frame typed per schemas.COMPACT_QUOTE_SCHEMA (categoricals, float32 prices, downcast counts, datetime64 timestamps). Default is False.
 
 		Returns:
 			• pandas.DataFrame:
 				• (DF) A DataFrame containing the current quote data for the specified symbol list.
 
+		Notes:
+			• Symbols are sent in POST bodies rather than the query string, so large universes (an index's constituents, thousands of OCC symbols) do not run into URL length limits.
+			• Lists longer than chunk_size are split into chunks that are requested concurrently and merged into one DataFrame in the order the symbols were given.
+
 		Example:
 			# Create a Quotes instance
 			quotes = Quotes(tradier_acct, tradier_token)
@@ -434,17 +563,20 @@ class Quotes (Tradier):
 			else:
 				valid_symbols.append(s.upper());
 
-		str_symbols = ",".join(valid_symbols);
-
-		if not str_symbols:
+		if not valid_symbols:
 			print("No ticker symbols?");
 			return pd.DataFrame();
 
-		try:
-			r = requests.get(
+		#
+		# Helper function to fetch the quote records for one chunk of symbols
+		#
+
+		def fetch_quote_records (chunk):
+			r = self.transport.post(
 				url = f"{self.BASE_URL}/{self.QUOTES_ENDPOINT}",
-				params = {"symbols":str_symbols, "greeks":"false"},
-				headers = self.REQUESTS_HEADERS
+				data = {"symbols":",".join(chunk), "greeks":"false"},
+				headers = self.REQUESTS_HEADERS,
+				retry = True
 			);
 			r.raise_for_status();
 
@@ -453,22 +585,38 @@ class Quotes (Tradier):
 			if quotes_json is None or 'quotes' not in quotes_json:
 				print("API Response Error [1]: No 'quotes' key");
 				print(quotes_json);
-				return pd.DataFrame();
+				return list();
 
 			quotes_dict = quotes_json['quotes'];
 
 			if quotes_dict is None or 'quote' not in quotes_dict:
 				print("API Response Error [2]: No 'quote' key");
 				print(quotes_dict);
-				return pd.DataFrame();
+				return list();
 
 			quotes_data = quotes_dict['quote'];
 
+			if isinstance(quotes_data, dict):
+				quotes_data = [quotes_data];
+
+			return quotes_data or list();
+
+		chunks = [valid_symbols[i:i+chunk_size] for i in range(0, len(valid_symbols), chunk_size)];
+
+		try:
+			if len(chunks) > 1 and max_workers > 1:
+				with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+					chunk_records = list(executor.map(fetch_quote_records, chunks));
+			else:
+				chunk_records = [fetch_quote_records(chunk) for chunk in chunks];
+
+			quotes_data = [record for records in chunk_records for record in records];
+
 			if not quotes_data:
 				print('No quotes data.');
 				quotes_df = pd.DataFrame();
 			else:
-				quotes_df = pd.json_normalize(quotes_data);
+				quotes_df = records_to_frame(quotes_data, COMPACT_QUOTE_SCHEMA if compact else QUOTE_SCHEMA);
 
 			return quotes_df;
 
@@ -483,7 +631,7 @@ class Quotes (Tradier):
 			return pd.DataFrame();
 		except Exception as e:
 			print(f"Something terrible as happened: {str(e)}.");
-			pd.DataFrame();
+			return pd.DataFrame();
 
 	def get_timesales (self, symbol, interval='1min', start_time=None, end_time=None):
 		'''
@@ -510,27 +658,27 @@ class Quotes (Tradier):
 			# Retrieve intraday stock data for symbol Citi (C)
 			>>> quotes.get_timesales("C")
 			                   time   timestamp     price     open     high      low    close   volume       vwap
-			0   2024-10-04T16:00:00  1728072000  62.64000  62.6400  62.6400  62.6400  62.6400  1618854  62.640000
-			1   2024-10-04T16:06:00  1728072360  62.64000  62.6400  62.6400  62.6400  62.6400     2651  62.640000
-			2   2024-10-04T16:08:00  1728072480  62.64000  62.6400  62.6400  62.6400  62.6400      565  62.640000
-			3   2024-10-04T16:24:00  1728073440  62.51000  62.5100  62.5100  62.5100  62.5100      400  62.510000
-			4   2024-10-04T16:26:00  1728073560  62.51010  62.5101  62.5101  62.5101  62.5101      116  62.527989
-			5   2024-10-04T16:31:00  1728073860  62.52500  62.5200  62.5400  62.5100  62.5100     2880  62.515042
-			6   2024-10-04T16:36:00  1728074160  62.64000  62.6400  62.6400  62.6400  62.6400   123816  62.640000
-			7   2024-10-04T16:58:00  1728075480  62.64000  62.6400  62.6400  62.6400  62.6400    96911  62.640000
-			8   2024-10-04T16:59:00  1728075540  62.52000  62.5200  62.5200  62.5200  62.5200      300  62.520000
-			9   2024-10-04T17:07:00  1728076020  62.58000  62.5800  62.5800  62.5800  62.5800      150  62.580000
-			10  2024-10-04T17:17:00  1728076620  62.57500  62.5700  62.5800  62.5700  62.5800      479  62.573027
-			11  2024-10-04T17:27:00  1728077220  62.57000  62.5700  62.5700  62.5700  62.5700      700  62.570000
-			12  2024-10-04T17:41:00  1728078060  62.57000  62.5700  62.5700  62.5700  62.5700      400  62.570000
-			13  2024-10-04T17:42:00  1728078120  62.56000  62.5600  62.5600  62.5600  62.5600     1000  62.559600
-			14  2024-10-04T18:36:00  1728081360  62.57000  62.5700  62.5700  62.5700  62.5700      200  62.570000
-			15  2024-10-04T18:42:00  1728081720  62.57925  62.5700  62.5885  62.5700  62.5885      600  62.579025
-			16  2024-10-04T18:43:00  1728081780  62.58500  62.5900  62.5900  62.5800  62.5800      200  62.585000
-			17  2024-10-04T18:53:00  1728082380  62.57500  62.5800  62.5800  62.5700  62.5700      241  62.575851
-			18  2024-10-04T18:59:00  1728082740  62.59000  62.5900  62.5900  62.5900  62.5900      100  62.590000
-			19  2024-10-04T19:33:00  1728084780  62.50110  62.5011  62.5011  62.5011  62.5011      352  62.503462
-			20  2024-10-04T19:56:00  1728086160  62.53000  62.5300  62.5300  62.5300  62.5300      500  62.530000
+			0   2024-10-04 16:00:00  1728072000  62.64000  62.6400  62.6400  62.6400  62.6400  1618854  62.640000
+			1   2024-10-04 16:06:00  1728072360  62.64000  62.6400  62.6400  62.6400  62.6400     2651  62.640000
+			2   2024-10-04 16:08:00  1728072480  62.64000  62.6400  62.6400  62.6400  62.6400      565  62.640000
+			3   2024-10-04 16:24:00  1728073440  62.51000  62.5100  62.5100  62.5100  62.5100      400  62.510000
+			4   2024-10-04 16:26:00  1728073560  62.51010  62.5101  62.5101  62.5101  62.5101      116  62.527989
+			5   2024-10-04 16:31:00  1728073860  62.52500  62.5200  62.5400  62.5100  62.5100     2880  62.515042
+			6   2024-10-04 16:36:00  1728074160  62.64000  62.6400  62.6400  62.6400  62.6400   123816  62.640000
+			7   2024-10-04 16:58:00  1728075480  62.64000  62.6400  62.6400  62.6400  62.6400    96911  62.640000
+			8   2024-10-04 16:59:00  1728075540  62.52000  62.5200  62.5200  62.5200  62.5200      300  62.520000
+			9   2024-10-04 17:07:00  1728076020  62.58000  62.5800  62.5800  62.5800  62.5800      150  62.580000
+			10  2024-10-04 17:17:00  1728076620  62.57500  62.5700  62.5800  62.5700  62.5800      479  62.573027
+			11  2024-10-04 17:27:00  1728077220  62.57000  62.5700  62.5700  62.5700  62.5700      700  62.570000
+			12  2024-10-04 17:41:00  1728078060  62.57000  62.5700  62.5700  62.5700  62.5700      400  62.570000
+			13  2024-10-04 17:42:00  1728078120  62.56000  62.5600  62.5600  62.5600  62.5600     1000  62.559600
+			14  2024-10-04 18:36:00  1728081360  62.57000  62.5700  62.5700  62.5700  62.5700      200  62.570000
+			15  2024-10-04 18:42:00  1728081720  62.57925  62.5700  62.5885  62.5700  62.5885      600  62.579025
+			16  2024-10-04 18:43:00  1728081780  62.58500  62.5900  62.5900  62.5800  62.5800      200  62.585000
+			17  2024-10-04 18:53:00  1728082380  62.57500  62.5800  62.5800  62.5700  62.5700      241  62.575851
+			18  2024-10-04 18:59:00  1728082740  62.59000  62.5900  62.5900  62.5900  62.5900      100  62.590000
+			19  2024-10-04 19:33:00  1728084780  62.50110  62.5011  62.5011  62.5011  62.5011      352  62.503462
+			20  2024-10-04 19:56:00  1728086160  62.53000  62.5300  62.5300  62.5300  62.5300      500  62.530000
 
 		Example 2: Weyerhauser 15-minute interval intraday data for afternoon of October 4, 2024.
 			# Create a Quotes instance
@@ -539,23 +687,23 @@ class Quotes (Tradier):
 			# Retrieve intraday Weyerhauser data.
 			>>> quotes.get_timesales(symbol='WY', interval='15min', start_time='2024-10-04 12:00', end_time='2024-10-04 16:00')
 			                   time   timestamp     price    open     high     low   close  volume       vwap
-			0   2024-10-04T12:00:00  1728057600  32.82250  32.805  32.8850  32.760  32.800  112648  32.831508
-			1   2024-10-04T12:15:00  1728058500  32.78750  32.808  32.8350  32.740  32.765   38523  32.783795
-			2   2024-10-04T12:30:00  1728059400  32.84000  32.770  32.9150  32.765  32.900   37764  32.837720
-			3   2024-10-04T12:45:00  1728060300  32.94250  32.900  32.9950  32.890  32.965   80334  32.954177
-			4   2024-10-04T13:00:00  1728061200  33.00250  32.965  33.0500  32.955  33.005   60547  33.008234
-			5   2024-10-04T13:15:00  1728062100  32.98250  33.010  33.0150  32.950  32.955   37137  32.996037
-			6   2024-10-04T13:30:00  1728063000  32.96250  32.950  33.0150  32.910  33.000   41859  32.969801
-			7   2024-10-04T13:45:00  1728063900  32.94945  33.000  33.0089  32.890  32.910   30530  32.942807
-			8   2024-10-04T14:00:00  1728064800  32.89000  32.910  32.9150  32.865  32.900   86852  32.889426
-			9   2024-10-04T14:15:00  1728065700  32.91750  32.900  32.9600  32.875  32.930   31357  32.918224
-			10  2024-10-04T14:30:00  1728066600  32.93750  32.930  32.9650  32.910  32.940   24714  32.942706
-			11  2024-10-04T14:45:00  1728067500  32.95500  32.945  32.9750  32.935  32.955   43628  32.957438
-			12  2024-10-04T15:00:00  1728068400  32.95250  32.950  33.0000  32.905  32.985   65831  32.957778
-			13  2024-10-04T15:15:00  1728069300  32.99000  32.990  33.0250  32.955  32.965   78064  32.998393
-			14  2024-10-04T15:30:00  1728070200  32.98000  32.965  33.0100  32.950  33.005   79725  32.983402
-			15  2024-10-04T15:45:00  1728071100  32.93750  33.005  33.0050  32.870  32.880  589946  32.935760
-			16  2024-10-04T16:00:00  1728072000  32.88000  32.880  32.8800  32.880  32.880  928888  32.880000
+			0   2024-10-04 12:00:00  1728057600  32.82250  32.805  32.8850  32.760  32.800  112648  32.831508
+			1   2024-10-04 12:15:00  1728058500  32.78750  32.808  32.8350  32.740  32.765   38523  32.783795
+			2   2024-10-04 12:30:00  1728059400  32.84000  32.770  32.9150  32.765  32.900   37764  32.837720
+			3   2024-10-04 12:45:00  1728060300  32.94250  32.900  32.9950  32.890  32.965   80334  32.954177
+			4   2024-10-04 13:00:00  1728061200  33.00250  32.965  33.0500  32.955  33.005   60547  33.008234
+			5   2024-10-04 13:15:00  1728062100  32.98250  33.010  33.0150  32.950  32.955   37137  32.996037
+			6   2024-10-04 13:30:00  1728063000  32.96250  32.950  33.0150  32.910  33.000   41859  32.969801
+			7   2024-10-04 13:45:00  1728063900  32.94945  33.000  33.0089  32.890  32.910   30530  32.942807
+			8   2024-10-04 14:00:00  1728064800  32.89000  32.910  32.9150  32.865  32.900   86852  32.889426
+			9   2024-10-04 14:15:00  1728065700  32.91750  32.900  32.9600  32.875  32.930   31357  32.918224
+			10  2024-10-04 14:30:00  1728066600  32.93750  32.930  32.9650  32.910  32.940   24714  32.942706
+			11  2024-10-04 14:45:00  1728067500  32.95500  32.945  32.9750  32.935  32.955   43628  32.957438
+			12  2024-10-04 15:00:00  1728068400  32.95250  32.950  33.0000  32.905  32.985   65831  32.957778
+			13  2024-10-04 15:15:00  1728069300  32.99000  32.990  33.0250  32.955  32.965   78064  32.998393
+			14  2024-10-04 15:30:00  1728070200  32.98000  32.965  33.0100  32.950  33.005   79725  32.983402
+			15  2024-10-04 15:45:00  1728071100  32.93750  33.005  33.0050  32.870  32.880  589946  32.935760
+			16  2024-10-04 16:00:00  1728072000  32.88000  32.880  32.8800  32.880  32.880  928888  32.880000
 		'''
 
 		#
@@ -584,7 +732,7 @@ class Quotes (Tradier):
 			r_params['end'] = end_time;
 
 		try:
-			r = requests.get(
+			r = self.transport.get(
 				url = f"{self.BASE_URL}/{self.QUOTES_TIMESALES_ENDPOINT}",
 				params = r_params,
 				headers = self.REQUESTS_HEADERS
@@ -597,7 +745,7 @@ class Quotes (Tradier):
 				raise KeyError('ERROR - API Response Missing Data.');
 				return pd.DataFrame();
 
-			return pd.json_normalize(r.json()['series']['data']);
+			return records_to_frame(data['series']['data'], TIMESALES_SCHEMA);
 
 		except RequestException as e:
 			raise RequestException(f"ERROR - API Request: {str(e)}");
@@ -615,7 +763,7 @@ class Quotes (Tradier):
 
 			See help(Quotes.get_historical_quotes) for information about remaining parameters.
 		'''
-		bar_data = self.get_historical_quotes(symbol, interval, start_date, end_date);
+		bar_data = self.get_historical_quotes(symbol, interval, start_date or None, end_date or None);
 		bar_data['date'] = pd.to_datetime(bar_data['date']);
 		bar_data.set_index('date', inplace=True);
 		plot_str = "{} {} Price".format(symbol.upper(), plot_var[0].upper() + plot_var[1:]);
@@ -628,13 +776,15 @@ class Quotes (Tradier):
 		if not query:
 			return "Need that search term yo";
 
-		r = requests.get(
+		r = self.transport.get(
 			url = '{}/{}'.format(self.BASE_URL, self.QUOTES_SEARCH_ENDPOINT),
 			params = {'q': query, 'indexes':'false'},
 			headers = self.REQUESTS_HEADERS
 		);
 
-		if not r.json()['securities']:
+		data = r.json();
+
+		if not data['securities']:
 			return "Nothing found";
 
-		return pd.DataFrame(r.json()['securities']['security']);
+		return pd.DataFrame(data['securities']['security']);
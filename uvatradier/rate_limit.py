@@ -0,0 +1,223 @@
+import re;
+import time;
+import threading;
+from datetime import datetime;
+
+from .retry import parse_retry_after;
+
+
+#
+# Tradier enforces separate per-minute request limits for each group of endpoints.
+# These defaults match the production API and are recalibrated from the X-Ratelimit-* response headers.
+#
+
+DEFAULT_GROUP_LIMITS = {
+	'market_data' 	: 120, 	# v1/markets/...
+	'trading' 		: 60, 	# POST/PUT/DELETE v1/accounts/{account}/orders
+	'standard' 		: 120 	# everything else (user, accounts, balances, positions, order status, ...)
+};
+
+
+class TokenBucket:
+	'''
+	Thread-safe token bucket refilled at a fixed number of tokens per minute.
+
+	Args:
+		• rate_per_minute (float): Tokens added per minute (i.e. the sustained request rate).
+		• burst (float): Fraction of rate_per_minute that may be spent at once. The bucket capacity is max(1, rate_per_minute * burst).
+	'''
+
+	def __init__ (self, rate_per_minute, burst=0.25):
+		self.rate_per_minute 	= float(rate_per_minute);
+		self.burst 				= burst;
+		self.capacity 			= max(1.0, self.rate_per_minute * burst);
+		self.tokens 			= self.capacity;
+		self.updated 			= time.monotonic();
+		self.resume_at 			= 0.0; 		# monotonic time before which no tokens are handed out (server says the window is spent)
+
+		#
+		# Most recent values reported by Tradier
+		#
+
+		self.server_allowed 	= None;
+		self.server_available 	= None;
+		self.server_reset 		= None; 	# epoch seconds at which the server-side window resets
+
+		self.lock = threading.Lock();
+
+	def _refill (self, now):
+		self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate_per_minute / 60.0);
+		self.updated = now;
+
+	def acquire (self, blocking=True, timeout=None):
+		'''
+		Take one token from the bucket, waiting for it to refill if necessary.
+
+		Returns:
+			• bool: True if a token was taken, False if blocking=False (or timeout elapsed) and no token was available.
+		'''
+		deadline = None if timeout is None else time.monotonic() + timeout;
+
+		while True:
+			with self.lock:
+				now = time.monotonic();
+				self._refill(now);
+
+				if now >= self.resume_at and self.tokens >= 1.0:
+					self.tokens -= 1.0;
+					return True;
+
+				wait = max(self.resume_at - now, (1.0 - self.tokens) * 60.0 / self.rate_per_minute);
+
+			if not blocking:
+				return False;
+
+			if deadline is not None:
+				remaining = deadline - time.monotonic();
+				if remaining <= 0:
+					return False;
+				wait = min(wait, remaining);
+
+			time.sleep(wait);
+
+	def calibrate (self, allowed=None, available=None, reset=None):
+		'''
+		Align the bucket with the limits reported by Tradier.
+
+		Args:
+			• allowed (int, optional): Requests permitted per window (X-Ratelimit-Allowed).
+			• available (int, optional): Requests left in the current window (X-Ratelimit-Available).
+			• reset (float, optional): Epoch seconds at which the current window resets (X-Ratelimit-Expiry).
+		'''
+		with self.lock:
+			now = time.monotonic();
+			self._refill(now);
+
+			if allowed:
+				self.server_allowed 	= allowed;
+				self.rate_per_minute 	= float(allowed);
+				self.capacity 			= max(1.0, self.rate_per_minute * self.burst);
+				self.tokens 			= min(self.tokens, self.capacity);
+
+			if available is not None:
+				self.server_available = available;
+				self.tokens = min(self.tokens, float(available));
+
+			if reset is not None:
+				self.server_reset = reset;
+				if available is not None and available <= 0:
+					self.resume_at = max(self.resume_at, now + max(0.0, reset - time.time()));
+
+	def pause (self, seconds):
+		'''
+		Hand out no tokens for the next `seconds` seconds (e.g. after a 429 response).
+		'''
+		with self.lock:
+			now = time.monotonic();
+			self.tokens = 0.0;
+			self.updated = now;
+			self.resume_at = max(self.resume_at, now + seconds);
+
+	def budget (self):
+		'''
+		Snapshot of the bucket's state as a dict.
+		'''
+		with self.lock:
+			now = time.monotonic();
+			self._refill(now);
+			return {
+				'available' 		: self.tokens if now >= self.resume_at else 0.0,
+				'capacity' 			: self.capacity,
+				'rate_per_minute' 	: self.rate_per_minute,
+				'resume_in' 		: max(0.0, self.resume_at - now),
+				'server_allowed' 	: self.server_allowed,
+				'server_available' 	: self.server_available,
+				'server_reset' 		: datetime.fromtimestamp(self.server_reset) if self.server_reset else None
+			};
+
+
+class RateLimiter:
+	'''
+	Client-side rate limiter that keeps one token bucket per Tradier endpoint group (market_data, trading, standard).
+
+	The Transport consults the limiter before every request, so concurrent threads and Async* tasks sharing a Transport
+	are smoothed against the same budget. After every response the matching bucket is recalibrated from Tradier's
+	X-Ratelimit-Allowed / X-Ratelimit-Available / X-Ratelimit-Expiry headers, and a 429 response pauses the group
+	until the window resets.
+
+	Args:
+		• limits (dict, optional): Requests per minute for each group. Defaults to DEFAULT_GROUP_LIMITS.
+		• burst (float, optional): Fraction of each group's per-minute limit that may be spent back-to-back. Default is 0.25.
+
+	Example:
+		>>> transport = Transport(rate_limiter=RateLimiter(limits={'market_data':60, 'trading':60, 'standard':60}))
+		>>> quotes = Quotes(tradier_acct, tradier_token, transport=transport)
+		>>> transport.rate_limiter.budget('market_data')
+		{'available': 15.0, 'capacity': 15.0, 'rate_per_minute': 60.0, 'resume_in': 0.0, 'server_allowed': None, 'server_available': None, 'server_reset': None}
+	'''
+
+	ORDER_PATH = re.compile(r'/v1/accounts/[^/]+/orders');
+
+	def __init__ (self, limits=None, burst=0.25):
+		limits = {**DEFAULT_GROUP_LIMITS, **(limits or {})};
+		self.buckets = {group:TokenBucket(rate, burst) for group, rate in limits.items()};
+
+	@classmethod
+	def endpoint_group (cls, method, url):
+		'''
+		Map a request onto its Tradier rate limit group.
+		'''
+		if '/v1/markets/' in url:
+			return 'market_data';
+		if method.upper() != 'GET' and cls.ORDER_PATH.search(url):
+			return 'trading';
+		return 'standard';
+
+	def acquire (self, method, url, blocking=True, timeout=None):
+		'''
+		Wait for budget in the request's endpoint group.
+
+		Returns:
+			• str or None: The endpoint group charged for the request, or None if no budget became available.
+		'''
+		group = self.endpoint_group(method, url);
+		return group if self.buckets[group].acquire(blocking, timeout) else None;
+
+	def update (self, group, response):
+		'''
+		Recalibrate a group's bucket from a response's rate limit headers.
+		'''
+		bucket = self.buckets[group];
+		headers = response.headers;
+
+		try:
+			allowed 	= int(headers['X-Ratelimit-Allowed']) if 'X-Ratelimit-Allowed' in headers else None;
+			available 	= int(headers['X-Ratelimit-Available']) if 'X-Ratelimit-Available' in headers else None;
+			reset 		= int(headers['X-Ratelimit-Expiry']) / 1000.0 if 'X-Ratelimit-Expiry' in headers else None;
+		except ValueError:
+			allowed, available, reset = None, None, None;
+
+		#
+		# On a 429 the group is paused until the server allows requests again: for Retry-After seconds if the response says so,
+		# else until the window in X-Ratelimit-Expiry resets, else (neither header present) for a full 60 second window
+		#
+
+		if response.status_code == 429:
+			available = 0;
+			retry_after = parse_retry_after(response);
+
+			if retry_after is not None:
+				reset = time.time() + retry_after;
+			elif reset is None:
+				reset = time.time() + 60.0;
+
+		if allowed is not None or available is not None or reset is not None:
+			bucket.calibrate(allowed, available, reset);
+
+	def budget (self, group=None):
+		'''
+		Current budget for one endpoint group, or a dict of budgets keyed by group if group is None.
+		'''
+		if group is not None:
+			return self.buckets[group].budget();
+		return {g:bucket.budget() for g, bucket in self.buckets.items()};
@@ -0,0 +1,84 @@
+import random;
+import time;
+from email.utils import parsedate_to_datetime;
+
+
+def parse_retry_after (response):
+	'''
+	Seconds requested by a response's Retry-After header (delta-seconds or HTTP date), or None if absent/unparseable.
+	'''
+	value = response.headers.get('Retry-After') if response is not None else None;
+	if not value:
+		return None;
+
+	try:
+		return max(0.0, float(value));
+	except ValueError:
+		pass;
+
+	try:
+		return max(0.0, parsedate_to_datetime(value).timestamp() - time.time());
+	except (TypeError, ValueError):
+		return None;
+
+
+class RetryPolicy:
+	'''
+	Retry policy applied by the Transport to failed requests, using capped exponential backoff with jitter.
+
+	Args:
+		• total (int, optional): Maximum number of retries after the first attempt. Default is 3.
+		• backoff_factor (float, optional): Base delay in seconds. Retry n waits up to backoff_factor * 2**n seconds. Default is 0.1.
+		• backoff_max (float, optional): Upper bound in seconds on any single backoff delay. Default is 10.
+		• jitter (bool, optional): If True, draw each delay uniformly from [0, backoff] ("full jitter") so that concurrent callers
+		  do not retry in lockstep. Default is True.
+		• status_forcelist (iterable of int, optional): Response status codes that trigger a retry. Default is 429, 500, 502, 503, 504.
+		• allowed_methods (iterable of str, optional): HTTP methods retried by default. Default is the idempotent methods
+		  (GET, HEAD, OPTIONS, PUT, DELETE), so order placement (POST) is never repeated implicitly.
+		• respect_retry_after (bool, optional): Wait for the server's Retry-After header (capped at retry_after_max) when present. Default is True.
+		• retry_after_max (float, optional): Upper bound in seconds on a Retry-After wait. Default is 60.
+
+	Notes:
+		• Failures to connect (requests.exceptions.ConnectTimeout) never reach Tradier and are retried for every method.
+		• Individual requests can opt in/out with Transport.request(..., retry=True/False), e.g. for POST endpoints that only read data.
+
+	Example:
+		>>> transport = Transport(retry=RetryPolicy(total=5, backoff_factor=0.05))
+		>>> quotes = Quotes(tradier_acct, tradier_token, transport=transport)
+	'''
+
+	def __init__ (self, total=3, backoff_factor=0.1, backoff_max=10.0, jitter=True, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'), respect_retry_after=True, retry_after_max=60.0):
+		self.total 					= total;
+		self.backoff_factor 		= backoff_factor;
+		self.backoff_max 			= backoff_max;
+		self.jitter 				= jitter;
+		self.status_forcelist 		= frozenset(status_forcelist);
+		self.allowed_methods 		= frozenset(m.upper() for m in allowed_methods);
+		self.respect_retry_after 	= respect_retry_after;
+		self.retry_after_max 		= retry_after_max;
+
+	def is_retryable_method (self, method):
+		return method.upper() in self.allowed_methods;
+
+	def backoff (self, attempt):
+		'''
+		Delay in seconds before retry number `attempt` (0-based).
+		'''
+		delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt));
+		return random.uniform(0, delay) if self.jitter else delay;
+
+	def retry_after (self, response):
+		'''
+		Seconds requested by the response's Retry-After header (delta-seconds or HTTP date), or None if absent/unparseable.
+		'''
+		return parse_retry_after(response);
+
+	def delay (self, attempt, response=None):
+		'''
+		Delay in seconds before retry number `attempt`, honoring Retry-After when the policy allows it.
+		'''
+		if self.respect_retry_after:
+			retry_after = self.retry_after(response);
+			if retry_after is not None:
+				return min(retry_after, self.retry_after_max);
+		return self.backoff(attempt);
@@ -0,0 +1,262 @@
+import importlib.util;
+
+import numpy as np;
+import pandas as pd;
+
+
+#
+# Column types of the records returned by each endpoint.
+# Columns missing from a schema (or fields Tradier adds later) are passed through and typed by pandas.
+#
+
+HISTORY_SCHEMA = {
+	'date' 		: 'datetime',
+	'open' 		: 'float64',
+	'high' 		: 'float64',
+	'low' 		: 'float64',
+	'close' 	: 'float64',
+	'volume' 	: 'int64'
+};
+
+QUOTE_SCHEMA = {
+	'symbol' 			: 'str',
+	'description' 		: 'str',
+	'exch' 				: 'category',
+	'type' 				: 'category',
+	'last' 				: 'float64',
+	'change' 			: 'float64',
+	'volume' 			: 'int64',
+	'open' 				: 'float64',
+	'high' 				: 'float64',
+	'low' 				: 'float64',
+	'close' 			: 'float64',
+	'bid' 				: 'float64',
+	'ask' 				: 'float64',
+	'change_percentage' : 'float64',
+	'average_volume' 	: 'int64',
+	'last_volume' 		: 'int64',
+	'trade_date' 		: 'int64',
+	'prevclose' 		: 'float64',
+	'week_52_high' 		: 'float64',
+	'week_52_low' 		: 'float64',
+	'bidsize' 			: 'int64',
+	'bidexch' 			: 'category',
+	'bid_date' 			: 'int64',
+	'asksize' 			: 'int64',
+	'askexch' 			: 'category',
+	'ask_date' 			: 'int64',
+	'root_symbols' 		: 'str',
+
+	# Option quotes only
+	'underlying' 		: 'str',
+	'strike' 			: 'float64',
+	'open_interest' 	: 'int64',
+	'contract_size' 	: 'int64',
+	'expiration_date' 	: 'str',
+	'expiration_type' 	: 'category',
+	'option_type' 		: 'category',
+	'root_symbol' 		: 'str'
+};
+
+TIMESALES_SCHEMA = {
+	'time' 		: 'datetime',
+	'timestamp' : 'int64',
+	'price' 	: 'float64',
+	'open' 		: 'float64',
+	'high' 		: 'float64',
+	'low' 		: 'float64',
+	'close' 	: 'float64',
+	'volume' 	: 'int64',
+	'vwap' 		: 'float64'
+};
+
+GAINLOSS_SCHEMA = {
+	'close_date' 		: 'datetime',
+	'cost' 				: 'float64',
+	'gain_loss' 		: 'float64',
+	'gain_loss_percent' : 'float64',
+	'open_date' 		: 'datetime',
+	'proceeds' 			: 'float64',
+	'quantity' 			: 'float64',
+	'symbol' 			: 'str',
+	'term' 				: 'int64'
+};
+
+POSITIONS_SCHEMA = {
+	'cost_basis' 	: 'float64',
+	'date_acquired' : 'datetime',
+	'id' 			: 'int64',
+	'quantity' 		: 'float64',
+	'symbol' 		: 'str'
+};
+
+
+#
+# Option chains are lists of option quotes, so they share the quote schema
+#
+
+CHAIN_SCHEMA = QUOTE_SCHEMA;
+
+
+#
+# Compact (opt-in) schemas for quote and chain frames, which are the largest frames held in memory.
+# 	• repeated strings (exchange codes, types, underlyings, roots) -> category
+# 	• symbols -> pyarrow-backed strings when pyarrow is installed, else category
+# 	• prices -> float32 (about 7 significant digits, ample for quoted prices)
+# 	• counts -> smallest integer type that holds every value
+# 	• epoch-millisecond timestamps and expiration dates -> datetime64
+#
+
+COMPACT_QUOTE_SCHEMA = {
+	'symbol' 			: 'string',
+	'description' 		: 'string',
+	'exch' 				: 'category',
+	'type' 				: 'category',
+	'last' 				: 'float32',
+	'change' 			: 'float32',
+	'volume' 			: 'int',
+	'open' 				: 'float32',
+	'high' 				: 'float32',
+	'low' 				: 'float32',
+	'close' 			: 'float32',
+	'bid' 				: 'float32',
+	'ask' 				: 'float32',
+	'change_percentage' : 'float32',
+	'average_volume' 	: 'int',
+	'last_volume' 		: 'int',
+	'trade_date' 		: 'datetime_ms',
+	'prevclose' 		: 'float32',
+	'week_52_high' 		: 'float32',
+	'week_52_low' 		: 'float32',
+	'bidsize' 			: 'int',
+	'bidexch' 			: 'category',
+	'bid_date' 			: 'datetime_ms',
+	'asksize' 			: 'int',
+	'askexch' 			: 'category',
+	'ask_date' 			: 'datetime_ms',
+	'root_symbols' 		: 'category',
+
+	# Option quotes only
+	'underlying' 		: 'category',
+	'strike' 			: 'float32',
+	'open_interest' 	: 'int',
+	'contract_size' 	: 'int',
+	'expiration_date' 	: 'datetime',
+	'expiration_type' 	: 'category',
+	'option_type' 		: 'category',
+	'root_symbol' 		: 'category'
+};
+
+COMPACT_CHAIN_SCHEMA = COMPACT_QUOTE_SCHEMA;
+
+
+#
+# Published schemas per endpoint
+#
+
+SCHEMAS = {
+	'history' 	: HISTORY_SCHEMA,
+	'quotes' 	: QUOTE_SCHEMA,
+	'chains' 	: CHAIN_SCHEMA,
+	'timesales' : TIMESALES_SCHEMA,
+	'gainloss' 	: GAINLOSS_SCHEMA,
+	'positions' : POSITIONS_SCHEMA
+};
+
+COMPACT_SCHEMAS = {
+	'quotes' 	: COMPACT_QUOTE_SCHEMA,
+	'chains' 	: COMPACT_CHAIN_SCHEMA
+};
+
+STRING_DTYPE = pd.StringDtype('pyarrow') if importlib.util.find_spec('pyarrow') is not None else 'category';
+
+
+def to_column (values, dtype):
+	'''
+	Convert a list of raw JSON values into a typed column.
+
+	Args:
+		• values (list): Values of one field across all records (None where the field is null or missing).
+		• dtype (str or None): One of 'float64', 'float32', 'int64', 'int' (smallest integer type that fits), 'datetime',
+		  'datetime_ms' (epoch milliseconds), 'category', 'string' (compact string), 'str', or None to let pandas infer the type.
+
+	Notes:
+		• int64 columns that contain nulls fall back to float64 (NaN), matching what pandas itself would produce.
+		• Compact 'int' columns that contain nulls use the smallest nullable integer type (Int8 ... Int64) instead.
+	'''
+	if dtype == 'float64':
+		return np.array(values, dtype='float64');
+
+	if dtype == 'float32':
+		return np.array(values, dtype='float32');
+
+	if dtype == 'int64':
+		try:
+			return np.array(values, dtype='int64');
+		except (TypeError, ValueError, OverflowError):
+			return np.array(values, dtype='float64');
+
+	if dtype == 'int':
+		try:
+			return pd.to_numeric(np.array(values, dtype='int64'), downcast='integer');
+		except (TypeError, ValueError, OverflowError):
+			return pd.to_numeric(pd.array(values, dtype='Int64'), downcast='integer');
+
+	if dtype == 'datetime_ms':
+		return pd.to_datetime(np.array(values, dtype='float64'), unit='ms');
+
+	if dtype == 'datetime':
+		return pd.to_datetime(values);
+
+	if dtype == 'category':
+		return pd.Categorical(values);
+
+	if dtype == 'string':
+		return pd.array(values, dtype=STRING_DTYPE) if STRING_DTYPE != 'category' else pd.Categorical(values);
+
+	return values;
+
+
+def records_to_frame (records, schema):
+	'''
+	Build a DataFrame straight from a list of flat JSON records, typing each column according to `schema`.
+
+	This replaces pd.json_normalize for endpoints whose records are flat: every column is gathered once and converted in a single
+	vectorized step, instead of being flattened record by record and left as object dtype.
+
+	Args:
+		• records (list of dict, or dict): Records from the API response. Tradier returns a bare dict when there is only one record.
+		• schema (dict): Column name -> type (see to_column).
+
+	Returns:
+		• pandas.DataFrame: One row per record. Columns appear in the order they first occur in the records.
+
+	Notes:
+		• If any record contains a nested object, the records are flattened with pd.json_normalize first, then typed per the schema.
+	'''
+	if isinstance(records, dict):
+		records = [records];
+
+	if not records:
+		return pd.DataFrame();
+
+	if any(isinstance(value, dict) for record in records for value in record.values()):
+		df = pd.json_normalize(records);
+		for column, dtype in schema.items():
+			if column in df:
+				df[column] = to_column(df[column].where(df[column].notna(), None).tolist(), dtype);
+		return df;
+
+	columns = dict.fromkeys(key for record in records for key in record);
+
+	return pd.DataFrame({column:to_column([record.get(column) for record in records], schema.get(column)) for column in columns});
+
+
+def restore_categoricals (df, schema):
+	'''
+	Re-apply categorical dtypes that pd.concat drops when frames with different categories are concatenated.
+	'''
+	for column, dtype in schema.items():
+		if column in df and (dtype == 'category' or (dtype == 'string' and STRING_DTYPE == 'category')) and not isinstance(df[column].dtype, pd.CategoricalDtype):
+			df[column] = df[column].astype('category');
+	return df;
@@ -0,0 +1,86 @@
+import os;
+import json;
+import tempfile;
+import importlib.util;
+
+import pandas as pd;
+
+
+#
+# Parquet needs pyarrow or fastparquet, neither of which is a hard dependency of the package.
+# Without them, frames are stored as pickles instead.
+#
+
+PARQUET_AVAILABLE = any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'));
+
+FILE_EXTENSIONS = {'parquet':'.parquet', 'pickle':'.pkl'};
+
+
+def default_format ():
+	return 'parquet' if PARQUET_AVAILABLE else 'pickle';
+
+
+def atomic_write (path, write):
+	'''
+	Write a file atomically: `write` is called with a temporary path in the same directory, which then replaces `path`.
+	Readers never observe a half-written file.
+	'''
+	directory = os.path.dirname(path) or '.';
+	os.makedirs(directory, exist_ok=True);
+
+	fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.splitext(path)[1]);
+	os.close(fd);
+
+	try:
+		write(tmp_path);
+		os.replace(tmp_path, path);
+	except BaseException:
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path);
+		raise;
+
+
+def write_frame (df, path):
+	'''
+	Atomically write a DataFrame to `path`, choosing Parquet or pickle from the file extension.
+	'''
+	if path.endswith(FILE_EXTENSIONS['parquet']):
+		atomic_write(path, lambda tmp_path: df.to_parquet(tmp_path, index=False));
+	else:
+		atomic_write(path, lambda tmp_path: df.to_pickle(tmp_path));
+
+
+def read_frame (path, columns=None):
+	'''
+	Read a DataFrame written by write_frame. Returns an empty DataFrame if `path` does not exist.
+	'''
+	if not os.path.exists(path):
+		return pd.DataFrame();
+
+	if path.endswith(FILE_EXTENSIONS['parquet']):
+		return pd.read_parquet(path, columns=columns);
+
+	df = pd.read_pickle(path);
+	return df[columns] if columns is not None else df;
+
+
+def write_json (obj, path):
+	'''
+	Atomically write a JSON document to `path`.
+	'''
+	def write (tmp_path):
+		with open(tmp_path, 'w') as f:
+			json.dump(obj, f);
+
+	atomic_write(path, write);
+
+
+def read_json (path, default=None):
+	'''
+	Read a JSON document written by write_json, or return `default` if it does not exist.
+	'''
+	if not os.path.exists(path):
+		return default;
+
+	with open(path) as f:
+		return json.load(f);
@@ -1,4 +1,7 @@
 from .base import Tradier
+from .retry import RetryPolicy
+from .stream_events import EventDecoder
+from .event_stream import MarketEventStream, ShardedMarketStream, AccountEventStream
 import requests;
 import time;
 import asyncio;
@@ -18,13 +21,17 @@ class Stream (Tradier):
 	- MARKET_STREAM_ENDPOINT (str): API endpoint for market event streaming.
 	- ACCOUNT_STREAM_ENDPOINT (str): API endpoint for account event streaming.
 	- MARKET_EVENTS_STREAM_ENDPOINT (str): API endpoint for specific market events.
+	- ACCOUNT_EVENTS_STREAM_ENDPOINT (str): WebSocket endpoint for account (order) events.
 
 	Methods:
 	- stream_market_events: Initiates market event streaming for specified symbols.
+	- market_events: Async iterator over market events, for use inside an existing event loop.
+	- stream_account_events: Initiates account (order status) event streaming.
+	- account_events: Async iterator over account events.
 	- http_market_stream_connect: Establishes an HTTP connection to get a streaming session ID.
 	- ws_market_connect: Connects to a WebSocket to receive and handle live market data.
 	"""
-	def __init__ (self, account_number, auth_token, live_trade=False):
+	def __init__ (self, account_number, auth_token, live_trade=False, transport=None):
 		"""
 		Initialize a new instance of the Stream class which is used for handling real-time
 		market data streaming through Tradier's API.
@@ -34,7 +41,7 @@ class Stream (Tradier):
 		- auth_token (str): The authorization token for API access.
 		- live_trade (bool): Flag to indicate if the stream is for live trading or simulation.
 		"""
-		Tradier.__init__(self, account_number, auth_token, live_trade);
+		Tradier.__init__(self, account_number, auth_token, live_trade, transport);
 
 		#
 		# Define Streaming Endpoints
@@ -43,13 +50,16 @@ class Stream (Tradier):
 		self.MARKET_STREAM_ENDPOINT = "v1/markets/events/session";
 		self.ACCOUNT_STREAM_ENDPOINT = "v1/accounts/events/session";
 		self.MARKET_EVENTS_STREAM_ENDPOINT = "v1/markets/events";
+		self.ACCOUNT_EVENTS_STREAM_ENDPOINT = "v1/accounts/events";
+
+		self.STREAM_URL = "https://stream.tradier.com"; 	# HTTP streaming host (protocol='http')
 
 
 	#
 	# Initiate Market Event Stream
 	#
 
-	def stream_market_events (self, symbol_list, filter_list=None, line_break=False, valid_ticks_only=True, advanced_details=True, callback=None):
+	def stream_market_events (self, symbol_list, filter_list=None, line_break=False, valid_ticks_only=True, advanced_details=True, callback=None, decode=False, reconnect=False, protocol='websocket'):
 		"""
 		Start asynchronous market event streaming for a list of symbols.
 		This function wraps the asynchronous connection in a synchronous callable method by using asyncio.run.
@@ -61,6 +71,13 @@ class Stream (Tradier):
 		- line_break (bool, optional): Whether to include line breaks in the streaming data.
 		- valid_ticks_only (bool, optional): Whether to receive only valid ticks.
 		- advanced_details (bool, optional): Whether to receive advanced detail level in data.
+		- callback (callable, optional): Called with each message (or each event if decode=True). Messages are printed if omitted.
+		- decode (bool, optional): If True, decode each message once into typed events (TradeEvent, QuoteEvent, SummaryEvent,
+		  TimesaleEvent, TradexEvent - see stream_events) using the transport's JSON decoder, and pass those to the callback.
+		- reconnect (bool, optional): If True, keep the stream alive: reconnect with backoff and a new session whenever the websocket
+		  drops, resubscribing to the same symbols and filters (see market_events). Default False ends the stream on disconnect.
+		- protocol (str, optional): 'websocket' (default) or 'http' to read Tradier's chunked HTTP stream instead, for hosts where
+		  websockets are blocked. Events and callback are the same.
 
 		Examples:
 			stream = Stream(tradier_acct, tradier_token, live_trade=True)
@@ -68,30 +85,194 @@ class Stream (Tradier):
 			stream.stream_market_events(symbol_list=['COP', 'AMD', 'BA'])
 			# Stream Kinder Morgan Inc. quotes and trade events with line break separating each event
 			stream.stream_market_events(symbol_list=['KMI'], filter_list=['trade', 'quote'], line_break=True)
+			# Typed events instead of raw JSON strings
+			stream.stream_market_events(symbol_list=['SPY'], filter_list=['quote'], callback=lambda q: print(q.symbol, q.bid, q.ask), decode=True)
 		"""
+		if reconnect or protocol != 'websocket':
+			#
+			# Build the event stream inside the loop that runs it, so its queue is bound to that loop
+			#
+
+			async def run ():
+				await self.run_events(self.market_events(symbol_list, filter_list, line_break, valid_ticks_only, advanced_details, decode=decode, reconnect=reconnect, protocol=protocol), callback);
+
+			asyncio.run(run());
+			return;
+
 		asyncio.run(
-			self.ws_market_connect(symbol_list, filter_list, line_break, valid_ticks_only, advanced_details, callback)
+			self.ws_market_connect(symbol_list, filter_list, line_break, valid_ticks_only, advanced_details, callback, decode)
 		)
 
+	async def run_events (self, events, callback=None):
+		"""
+		Hand every event of an event stream (market_events, account_events) to `callback` (print if omitted), reporting reconnections as they happen.
+		"""
+		handle = callback if callback is not None else print;
+
+		if events.on_gap is None:
+			events.on_gap = lambda gap: print(f"Stream reconnected after {gap['seconds']:.1f}s ({gap['reason']}).");
+
+		async with events:
+			async for event in events:
+				handle(event);
+
+
+	#
+	# Async Iterator over Market Events
+	#
+
+	def market_events (self, symbol_list, filter_list=None, line_break=False, valid_ticks_only=True, advanced_details=True, maxsize=10000, overflow='block', decode=True, reconnect=True, max_reconnects=None, stale_after=None, on_gap=None, shards=1, protocol='websocket'):
+		"""
+		Market events for a list of symbols as an async iterator, to run the stream inside an existing event loop (e.g. next to order logic).
+
+		The websocket is read by a background task into a bounded queue, so a slow consumer does not stall the socket reader.
+		What happens when the queue is full is set by `overflow`:
+		- 'block': the reader waits for the consumer (backpressure on the socket). Nothing is lost.
+		- 'drop_oldest': the oldest queued event is discarded.
+		- 'coalesce': only the latest pending event per (event type, symbol) is kept, replacing older ones in place.
+
+		Parameters:
+		- symbol_list (list): List of market symbols to subscribe to.
+		- filter_list (list, optional): List of event types to filter - (Valid Options: 'trade','quote','summary','timesale','tradex')
+		- line_break (bool, optional): Whether to include line breaks in the streaming data.
+		- valid_ticks_only (bool, optional): Whether to receive only valid ticks.
+		- advanced_details (bool, optional): Whether to receive advanced detail level in data.
+		- maxsize (int, optional): Maximum number of queued events. Default is 10000.
+		- overflow (str, optional): 'block', 'drop_oldest' or 'coalesce'. Default is 'block'.
+		- decode (bool, optional): Yield typed events (TradeEvent, QuoteEvent, ...) rather than raw messages. Default is True.
+		- reconnect (bool, optional): When the websocket drops, get a new session id, reconnect with backoff and resubscribe to the same
+		  symbols and filters. Default is True.
+		- max_reconnects (int, optional): Consecutive failed reconnection attempts before giving up and raising. Default is None (never give up).
+		- stale_after (float, optional): Treat the connection as dead if no message arrives for this many seconds. Default is None.
+		- on_gap (callable, optional): Called after each reconnection with the gap record
+		  {'disconnected', 'reconnected', 'seconds', 'attempts', 'reason'}. Gaps are also kept in the stream's `gaps`.
+		- shards (int, optional): Spread the symbols over this many websocket connections, each with its own session, merged into one
+		  iterator (see ShardedMarketStream). Each symbol stays on one connection, so its events keep their order. Default is 1.
+		- protocol (str, optional): 'websocket' (default), or 'http' to read the chunked HTTP stream (for hosts that cannot open
+		  websockets). The response is split into messages incrementally, never buffered whole. Over HTTP, subscription changes reconnect.
+
+		Returns:
+		- MarketEventStream (ShardedMarketStream if shards > 1): Async iterator (and async context manager) of events. stats() returns its backpressure metrics
+		  (queue depth, dropped, coalesced, time the reader spent blocked, ...) and connection state (connected, reconnects, gap durations).
+
+		Examples:
+			async with stream.market_events(['SPY', 'QQQ'], filter_list=['quote'], overflow='coalesce') as events:
+				async for quote in events:
+					print(quote.symbol, quote.bid, quote.ask)
+		"""
+		options = dict(maxsize=maxsize, overflow=overflow, decode=decode, reconnect=reconnect, max_reconnects=max_reconnects, stale_after=stale_after, on_gap=on_gap, protocol=protocol);
+
+		if shards > 1:
+			return ShardedMarketStream(self, symbol_list, shards, filter_list, line_break, valid_ticks_only, advanced_details, **options);
+
+		return MarketEventStream(self, symbol_list, filter_list, line_break, valid_ticks_only, advanced_details, **options);
+
+
+	#
+	# Account Event Stream
+	#
+
+	def stream_account_events (self, callback=None, exclude_accounts=None, decode=True):
+		"""
+		Stream order status events of the accounts tied to the access token, reconnecting automatically.
+		Like stream_market_events, this blocks and runs its own event loop via asyncio.run.
+
+		Parameters:
+		- callback (callable, optional): Called with each event (OrderEvent, or the raw message if decode=False). Events are printed if omitted.
+		- exclude_accounts (list, optional): Account numbers whose events should not be streamed.
+		- decode (bool, optional): Pass typed OrderEvent objects rather than raw messages. Default is True.
+
+		Examples:
+			stream = Stream(tradier_acct, tradier_token, live_trade=True)
+			stream.stream_account_events(callback=lambda order: print(order.id, order.status, order.executed_quantity))
+		"""
+		async def run ():
+			await self.run_events(self.account_events(exclude_accounts, decode=decode), callback);
+
+		asyncio.run(run());
+
+	def account_events (self, exclude_accounts=None, maxsize=10000, overflow='block', decode=True, reconnect=True, max_reconnects=None, stale_after=None, on_gap=None):
+		"""
+		Order status events of the accounts tied to the access token as an async iterator, pushed by Tradier as orders change,
+		instead of polling Account.get_orders.
+
+		Uses the same machinery as market_events: bounded queue with an overflow policy, reconnection with a fresh session and gap reports.
+		Heartbeats are consumed internally (they still count as traffic for stale_after).
+
+		Parameters:
+		- exclude_accounts (list, optional): Account numbers whose events should not be streamed.
+		- maxsize (int, optional): Maximum number of queued events. Default is 10000.
+		- overflow (str, optional): 'block', 'drop_oldest' or 'coalesce'. Default 'block' never drops an order update.
+		- decode (bool, optional): Yield typed OrderEvent objects rather than raw messages. Default is True.
+		- reconnect, max_reconnects, stale_after, on_gap: As for market_events.
+
+		Returns:
+		- AccountEventStream: Async iterator (and async context manager) of OrderEvent objects.
+
+		Examples:
+			async with stream.account_events() as events:
+				async for order in events:
+					if order.filled:
+						print(f"Order {order.id} filled at {order.avg_fill_price}")
+		"""
+		return AccountEventStream(
+			self, exclude_accounts,
+			maxsize=maxsize, overflow=overflow, decode=decode, reconnect=reconnect, max_reconnects=max_reconnects, stale_after=stale_after, on_gap=on_gap
+		);
+
 
 	#
 	# Establish HTTP Connection to Tradier
 	#
 
-	def http_market_stream_connect (self):
+	def http_market_stream_connect (self, max_attempts=None):
 		"""
 		Continuously attempt to establish an HTTP connection to the Tradier market stream endpoint
 		until a session ID is obtained. Handles reconnection attempts and errors.
 
+		Transient failures (connection errors, 429, 5xx) are retried by the transport's RetryPolicy within each attempt.
+		Between attempts, the wait grows exponentially (with jitter) up to the policy's backoff_max instead of a fixed delay.
+
+		Parameters:
+		- max_attempts (int, optional): Give up after this many attempts. Default None keeps trying indefinitely.
+
 		Returns:
 		- str: A session ID string used for initiating a WebSocket connection.
 
 		Raises:
-		- RuntimeError: If it fails to obtain the session ID after multiple attempts.
+		- RuntimeError: If it fails to obtain the session ID after max_attempts attempts.
+		"""
+		return self.http_stream_connect(self.MARKET_STREAM_ENDPOINT, max_attempts, 'market');
+
+	def http_account_stream_connect (self, max_attempts=None):
 		"""
-		while True:
+		Obtain a session ID for the account event stream, with the same retries as http_market_stream_connect.
+
+		Parameters:
+		- max_attempts (int, optional): Give up after this many attempts. Default None keeps trying indefinitely.
+
+		Returns:
+		- str: A session ID string used for initiating the account events WebSocket connection.
+
+		Raises:
+		- RuntimeError: If it fails to obtain the session ID after max_attempts attempts.
+		"""
+		return self.http_stream_connect(self.ACCOUNT_STREAM_ENDPOINT, max_attempts, 'account');
+
+	def http_stream_connect (self, endpoint, max_attempts=None, name='market'):
+		"""
+		Request a streaming session ID from a session endpoint (MARKET_STREAM_ENDPOINT or ACCOUNT_STREAM_ENDPOINT).
+		"""
+		policy = self.transport.retry or RetryPolicy();
+		attempt = 0;
+
+		while max_attempts is None or attempt < max_attempts:
+			if attempt:
+				time.sleep(policy.backoff(attempt - 1));
+			attempt += 1;
+
 			try:
-				r = requests.post(url=f"{self.BASE_URL}/{self.MARKET_STREAM_ENDPOINT}", headers=self.REQUESTS_HEADERS);
+				r = self.transport.post(url=f"{self.BASE_URL}/{endpoint}", headers=self.REQUESTS_HEADERS, retry=True);
 				r.raise_for_status();
 
 				session_info = r.json();
@@ -100,26 +281,25 @@ class Stream (Tradier):
 
 				if 'stream' not in session_info:
 					print("Error - session_info lacks 'stream'.");
-					time.sleep(10);
 					continue;
 
 				if 'sessionid' not in session_info['stream']:
 					print("Error - 'stream' not in session_info.stream.");
-					time.sleep(10);
 					continue;
 
 				return session_info['stream']['sessionid'];
 
 			except requests.RequestException as e:
 				print(f"API Error: {e}.");
-				time.sleep(10);
+
+		raise RuntimeError(f"No {name} stream session after {attempt} attempts.");
 
 
 	#
 	# Connect to WebSocket Stream
 	#
 
-	async def ws_market_connect (self, symbol_list, filter_list, line_break, valid_ticks_only, advanced_details, callback=None):
+	async def ws_market_connect (self, symbol_list, filter_list, line_break, valid_ticks_only, advanced_details, callback=None, decode=False):
 		"""
 		Asynchronously connect to the WebSocket stream endpoint and handle market data events.
 		This function should not need to be called directly. Use stream_market_events instead.
@@ -130,6 +310,8 @@ class Stream (Tradier):
 		- line_break (bool): Whether to append line breaks in the received data.
 		- valid_ticks_only (bool): Filter to only valid tick events.
 		- advanced_details (bool): Request for advanced details in the market data.
+		- callback (callable, optional): Called with each raw message, or with each typed event if decode=True.
+		- decode (bool, optional): Decode messages into typed events before handing them to the callback.
 
 		Once connected, sends the specified parameters as a payload and listens for incoming messages.
 		"""
@@ -152,8 +334,16 @@ class Stream (Tradier):
 
 				await websocket.send(payload);
 
-				async for message in websocket:
-					callback(message) if callback is not None else print(message)
+				if decode:
+					decoder = EventDecoder(self.transport.json_loads);
+					handle = callback if callback is not None else print;
+
+					async for message in websocket:
+						for event in decoder.decode(message):
+							handle(event);
+				else:
+					async for message in websocket:
+						callback(message) if callback is not None else print(message)
 
 		except websockets.ConnectionClosedError as e:
 			print(f"Websocket connection closed but idk why: {e}.");
@@ -0,0 +1,346 @@
+import re;
+
+from .json_decoder import get_json_loads;
+
+
+#
+# Field converters. Tradier sends most numbers in stream events as strings (e.g. "price":"281.8599", "date":"1557757190000").
+#
+
+def to_float (value):
+	return value if type(value) is float else float(value);
+
+
+def to_int (value):
+	return value if type(value) is int else int(float(value));
+
+
+def to_str (value):
+	return value;
+
+
+def to_bool (value):
+	return value if type(value) is bool else str(value).lower() == 'true';
+
+
+class StreamEvent:
+	'''
+	Base class of typed market stream events.
+
+	Events are plain objects with __slots__ (no per-instance __dict__), built straight from the decoded JSON message with numeric
+	fields converted once. Missing or empty fields are None. Events of the same type with the same values are equal and hash alike,
+	so they can be put in sets or used as dict keys.
+
+	Subclasses define:
+		• TYPE: the Tradier event type ('trade', 'quote', ...).
+		• FIELDS: (attribute, JSON key, converter) triples.
+	'''
+
+	__slots__ = ('symbol',);
+
+	TYPE = None;
+	FIELDS = ();
+
+	@classmethod
+	def from_dict (cls, data):
+		'''
+		Event built from one decoded JSON message (dict).
+		'''
+		get = data.get;
+		event = cls.__new__(cls);
+		event.symbol = get('symbol');
+
+		for attribute, key, convert in cls.FIELDS:
+			value = get(key);
+			setattr(event, attribute, convert(value) if value is not None and value != '' else None);
+
+		return event;
+
+	@property
+	def type (self):
+		return self.TYPE;
+
+	def to_dict (self):
+		return {'type':self.TYPE, 'symbol':self.symbol, **{attribute:getattr(self, attribute) for attribute, _, _ in self.FIELDS}};
+
+	def astuple (self):
+		return (self.symbol, *(getattr(self, attribute) for attribute, _, _ in self.FIELDS));
+
+	def __eq__ (self, other):
+		return type(self) is type(other) and self.astuple() == other.astuple();
+
+	def __hash__ (self):
+		return hash((type(self), self.astuple()));
+
+	def __repr__ (self):
+		return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items() if k != 'type')})";
+
+
+class TradeEvent (StreamEvent):
+	__slots__ = ('exch', 'price', 'size', 'cumulative_volume', 'date', 'last');
+
+	TYPE = 'trade';
+	FIELDS = (
+		('exch', 				'exch', 	to_str),
+		('price', 				'price', 	to_float),
+		('size', 				'size', 	to_int),
+		('cumulative_volume', 	'cvol', 	to_int),
+		('date', 				'date', 	to_int),
+		('last', 				'last', 	to_float)
+	);
+
+
+class TradexEvent (TradeEvent):
+	__slots__ = ();
+
+	TYPE = 'tradex';
+
+
+class QuoteEvent (StreamEvent):
+	__slots__ = ('bid', 'bid_size', 'bid_exch', 'bid_date', 'ask', 'ask_size', 'ask_exch', 'ask_date');
+
+	TYPE = 'quote';
+	FIELDS = (
+		('bid', 		'bid', 		to_float),
+		('bid_size', 	'bidsz', 	to_int),
+		('bid_exch', 	'bidexch', 	to_str),
+		('bid_date', 	'biddate', 	to_int),
+		('ask', 		'ask', 		to_float),
+		('ask_size', 	'asksz', 	to_int),
+		('ask_exch', 	'askexch', 	to_str),
+		('ask_date', 	'askdate', 	to_int)
+	);
+
+
+class SummaryEvent (StreamEvent):
+	__slots__ = ('open', 'high', 'low', 'close', 'prev_close');
+
+	TYPE = 'summary';
+	FIELDS = (
+		('open', 		'open', 		to_float),
+		('high', 		'high', 		to_float),
+		('low', 		'low', 			to_float),
+		('close', 		'close', 		to_float),
+		('prev_close', 	'prevClose', 	to_float)
+	);
+
+
+class TimesaleEvent (StreamEvent):
+	__slots__ = ('exch', 'bid', 'ask', 'last', 'size', 'date', 'seq', 'flag', 'cancel', 'correction', 'session');
+
+	TYPE = 'timesale';
+	FIELDS = (
+		('exch', 		'exch', 		to_str),
+		('bid', 		'bid', 			to_float),
+		('ask', 		'ask', 			to_float),
+		('last', 		'last', 		to_float),
+		('size', 		'size', 		to_int),
+		('date', 		'date', 		to_int),
+		('seq', 		'seq', 			to_int),
+		('flag', 		'flag', 		to_str),
+		('cancel', 		'cancel', 		to_bool),
+		('correction', 	'correction', 	to_bool),
+		('session', 	'session', 		to_str)
+	);
+
+
+class OrderEvent (StreamEvent):
+	'''
+	Order status update from the account event stream. `symbol` is not part of these events and is None.
+	'''
+
+	__slots__ = ('id', 'account', 'status', 'order_type', 'price', 'stop_price', 'avg_fill_price', 'executed_quantity', 'last_fill_quantity', 'remaining_quantity', 'transaction_date', 'create_date', 'tag');
+
+	TYPE = 'order';
+	FIELDS = (
+		('id', 					'id', 					to_int),
+		('account', 			'account', 				to_str),
+		('status', 				'status', 				to_str),
+		('order_type', 			'type', 				to_str),
+		('price', 				'price', 				to_float),
+		('stop_price', 			'stop_price', 			to_float),
+		('avg_fill_price', 		'avg_fill_price', 		to_float),
+		('executed_quantity', 	'executed_quantity', 	to_float),
+		('last_fill_quantity', 	'last_fill_quantity', 	to_float),
+		('remaining_quantity', 	'remaining_quantity', 	to_float),
+		('transaction_date', 	'transaction_date', 	to_str),
+		('create_date', 		'create_date', 			to_str),
+		('tag', 				'tag', 					to_str)
+	);
+
+	@property
+	def filled (self):
+		return self.status == 'filled';
+
+
+EVENT_TYPES = {cls.TYPE:cls for cls in (TradeEvent, TradexEvent, QuoteEvent, SummaryEvent, TimesaleEvent)};
+
+#
+# Account stream events carry their type under 'event' (and 'type' is the order type). Heartbeats only keep the connection alive.
+#
+
+ACCOUNT_EVENT_TYPES = {cls.TYPE:cls for cls in (OrderEvent,)};
+
+
+class EventDecoder:
+	'''
+	Decode raw stream messages into typed events.
+
+	Args:
+		• json_decoder (str or callable, optional): JSON decoder, as for Transport. Default is 'auto' (orjson/msgspec when installed).
+		• event_types (dict, optional): Event type -> event class. Default is EVENT_TYPES (market events); ACCOUNT_EVENT_TYPES for account events.
+		• type_key (str, optional): Key holding the event type. Default is 'type' ('event' in account events).
+		• ignore (iterable of str, optional): Event types to discard, e.g. ('heartbeat',). Default is none.
+
+	Notes:
+		• A message may hold several newline-separated events (line_break=True, or the HTTP stream); each becomes one event.
+		• Messages of unknown type (e.g. market stream heartbeats) are returned as the decoded dict.
+
+	Example:
+		>>> decoder = EventDecoder()
+		>>> decoder.decode('{"type":"trade","symbol":"SPY","exch":"J","price":"281.8599","size":"100","cvol":"16209108","date":"1557757190000","last":"281.8599"}')
+		[TradeEvent(symbol='SPY', exch='J', price=281.8599, size=100, cumulative_volume=16209108, date=1557757190000, last=281.8599)]
+	'''
+
+	def __init__ (self, json_decoder='auto', event_types=EVENT_TYPES, type_key='type', ignore=()):
+		self.loads 			= get_json_loads(json_decoder);
+		self.event_types 	= event_types;
+		self.type_key 		= type_key;
+		self.ignore 		= frozenset(ignore);
+
+	def decode_one (self, data):
+		'''
+		Typed event for one decoded JSON object.
+		'''
+		cls = self.event_types.get(data.get(self.type_key));
+		return cls.from_dict(data) if cls is not None else data;
+
+	def decode (self, message):
+		'''
+		List of events in a raw message (str or bytes).
+		'''
+		if isinstance(message, str):
+			message = message.strip();
+			lines = message.split('\n') if '\n' in message else (message,);
+		else:
+			message = message.strip();
+			lines = message.split(b'\n') if b'\n' in message else (message,);
+
+		loads = self.loads;
+		events = [self.decode_one(loads(line)) for line in lines if line.strip()];
+
+		if self.ignore:
+			events = [event for event in events if not (type(event) is dict and event.get(self.type_key) in self.ignore)];
+
+		return events;
+
+
+class MessageSplitter:
+	'''
+	Incremental splitter of a chunked byte stream (Tradier's HTTP stream) into complete JSON messages, holding back only the incomplete
+	tail between chunks so the response is never buffered whole.
+
+	Args:
+		• line_break (bool, optional): Messages are newline-delimited (linebreak=True in the stream request). The stream is then split
+		  on newlines with bytes operations only. If False, messages are concatenated JSON objects and are split by tracking brace depth
+		  outside of strings. Default is True.
+
+	Example:
+		>>> splitter = MessageSplitter(line_break=False)
+		>>> splitter.feed(b'{"type":"trade","symbol":"SPY"}{"type":"quo')
+		[b'{"type":"trade","symbol":"SPY"}']
+		>>> splitter.feed(b'te","symbol":"SPY"}')
+		[b'{"type":"quote","symbol":"SPY"}']
+	'''
+
+	#
+	# Everything up to the next brace outside of a string: runs of other characters and complete strings. Stops at a brace, at the opening
+	# quote of a string that continues in the next chunk, or at the end. STRING_REST resumes inside such a string, stopping at its closing
+	# quote, or at the end (or on a trailing backslash) of the chunk. Both are unrolled so that they run in linear time.
+	#
+
+	SKIP 		= re.compile(rb'[^{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}"]*)*');
+	STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*');
+
+	def __init__ (self, line_break=True):
+		self.line_break = line_break;
+		self.buffer 	= b'';
+
+		#
+		# Scanner state (line_break=False): bytes of the buffer already scanned, brace depth and whether that position is inside a string
+		#
+
+		self.scanned 	= 0;
+		self.depth 		= 0;
+		self.in_string 	= False;
+
+	def feed (self, chunk):
+		'''
+		Add a chunk of the stream. Returns the list of messages (bytes) completed by it.
+		'''
+		buffer = self.buffer + chunk if self.buffer else chunk;
+
+		if self.line_break:
+			end = buffer.rfind(b'\n');
+			if end < 0:
+				self.buffer = buffer;
+				return [];
+
+			self.buffer = buffer[end + 1:];
+			return [line for line in buffer[:end].split(b'\n') if line.strip()];
+
+		messages, start = [], 0;
+		depth, in_string, position, size = self.depth, self.in_string, self.scanned, len(buffer);
+
+		while True:
+			if in_string:
+				position = self.STRING_REST.match(buffer, position).end();
+				if position == size or buffer[position] != 0x22:
+					break;
+				in_string = False;
+				position += 1;
+				continue;
+
+			position = self.SKIP.match(buffer, position).end();
+			if position == size:
+				break;
+
+			character = buffer[position];
+
+			if character == 0x22: 				# a string that continues in the next chunk
+				in_string = True;
+				position += 1;
+			elif character == 0x7B: 			# {
+				if depth == 0:
+					#
+					# Fast path for flat objects (all of Tradier's events): up to the first closing brace, no nested object, no escapes and
+					# balanced quotes means that brace is outside any string and ends the message
+					#
+
+					end = buffer.find(b'}', position);
+					if end > 0 and buffer.count(b'{', position + 1, end) == 0 and buffer.count(b'\\', position, end) == 0 and buffer.count(b'"', position, end) % 2 == 0:
+						messages.append(buffer[position:end + 1]);
+						position = end + 1;
+						continue;
+
+					start = position;
+				depth += 1;
+				position += 1;
+			else: 								# }
+				depth -= 1;
+				position += 1;
+				if depth == 0:
+					messages.append(buffer[start:position]);
+
+		#
+		# Keep the incomplete message (from its opening brace) and the scanner state for the next chunk
+		#
+
+		if depth == 0:
+			self.buffer, self.scanned = buffer[position:], 0;
+		else:
+			self.buffer, self.scanned = buffer[start:], position - start;
+
+		self.depth, self.in_string = depth, in_string;
+
+		return messages;
@@ -0,0 +1,195 @@
+import threading;
+import time;
+import requests;
+from requests.adapters import HTTPAdapter;
+
+from .rate_limit import RateLimiter;
+from .retry import RetryPolicy;
+from .json_decoder import get_json_loads;
+
+
+class Transport:
+	'''
+	Pooled, keep-alive HTTP transport shared by the Tradier subclasses.
+
+	Every API call made by Account, Quotes, OptionsData, EquityOrder, OptionsOrder and Stream is routed through a Transport.
+	A Transport owns a single requests.Session whose connection pool keeps TCP/TLS connections to Tradier alive between calls,
+	so only the first request to a host pays for the handshake.
+
+	Args:
+		• pool_connections (int, optional): Number of per-host connection pools to cache. Default is 10.
+		• pool_maxsize (int, optional): Maximum number of keep-alive connections held open to a single host. Default is 10.
+		• pool_block (bool, optional): If True, callers wait for a free connection once pool_maxsize connections are in use instead of opening a throwaway one. Default is False.
+		• keep_alive (bool, optional): If False, send 'Connection: close' so that every request opens a fresh connection. Default is True.
+		• timeout (float or tuple, optional): Default (connect, read) timeout in seconds applied to every request. Default is (3.05, 30).
+		• rate_limiter (RateLimiter or False, optional): Client-side limiter consulted before every request. Defaults to a RateLimiter
+		  with Tradier's per-group limits. Pass False to disable client-side rate limiting.
+		• retry (RetryPolicy or False, optional): Policy used to retry transient failures (connection errors, 429, 5xx). Defaults to a
+		  RetryPolicy that only retries idempotent methods. Pass False to disable retries.
+		• json_decoder (str or callable, optional): Decoder behind response.json(). One of 'auto', 'orjson', 'msgspec', 'json' or a loads callable.
+		  Default 'auto' uses orjson or msgspec when installed and the standard library otherwise.
+
+	Notes:
+		• Tradier subclasses built with the same credentials share one Transport (see Transport.shared), so an Account and a Quotes object
+		  created side by side reuse the same connections.
+		• response.json() decodes the body once and caches the result, so repeated calls on the same response are free.
+		• Because the rate limiter lives on the Transport, every object sharing a Transport also shares its request budget.
+		• To customize pooling, construct a Transport and hand it to any Tradier subclass via its `transport` argument.
+
+	Example:
+		# Share a larger pool between a Quotes and an OptionsData object
+		>>> transport = Transport(pool_maxsize=32)
+		>>> quotes = Quotes(tradier_acct, tradier_token, transport=transport)
+		>>> options_data = OptionsData(tradier_acct, tradier_token, transport=transport)
+	'''
+
+	#
+	# Registry of shared transports keyed by credentials
+	#
+
+	_shared = dict();
+	_shared_lock = threading.Lock();
+
+	def __init__ (self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, timeout=(3.05, 30), rate_limiter=None, retry=None, json_decoder='auto'):
+		self.pool_connections 	= pool_connections;
+		self.pool_maxsize 		= pool_maxsize;
+		self.pool_block 		= pool_block;
+		self.keep_alive 		= keep_alive;
+		self.timeout 			= timeout;
+		self.rate_limiter 		= RateLimiter() if rate_limiter is None else (rate_limiter or None);
+		self.retry 				= RetryPolicy() if retry is None else (retry or None);
+		self.json_decoder 		= json_decoder;
+		self.json_loads 		= get_json_loads(json_decoder);
+
+		#
+		# Mount a pooled adapter for both schemes on a single session
+		#
+
+		self.session = requests.Session();
+		self._pool_lock = threading.Lock();
+		self.mount_adapter();
+
+		if not keep_alive:
+			self.session.headers['Connection'] = 'close';
+
+	def mount_adapter (self):
+		adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, pool_block=self.pool_block);
+		self.session.mount('https://', adapter);
+		self.session.mount('http://', adapter);
+
+	def ensure_pool_size (self, pool_maxsize):
+		'''
+		Grow the connection pool so it keeps at least `pool_maxsize` connections per host alive. Never shrinks it.
+		Used by the async classes so every call they run concurrently can reuse a kept-alive connection.
+		'''
+		with self._pool_lock:
+			if pool_maxsize <= self.pool_maxsize:
+				return;
+
+			self.pool_maxsize = pool_maxsize;
+			self.mount_adapter();
+
+	@classmethod
+	def shared (cls, auth_token, base_url):
+		'''
+		Return the Transport shared by every Tradier object built with the same auth token and base url, creating it on first use.
+		'''
+		key = (auth_token, base_url);
+		with cls._shared_lock:
+			if key not in cls._shared:
+				cls._shared[key] = cls();
+			return cls._shared[key];
+
+	def request (self, method, url, retry=None, **kwargs):
+		'''
+		Send an HTTP request over the pooled session. Accepts the same keyword arguments as requests.request.
+
+		Args:
+			• retry (bool, optional): Override the retry policy's method check for this request. True retries even non-idempotent
+			  methods (use for POST endpoints that only read data), False never retries. Default None defers to the policy.
+
+		Notes:
+			• Transient failures are retried with exponential backoff and jitter per the transport's RetryPolicy. Once retries are
+			  exhausted, the last response is returned (so raise_for_status behaves as usual) or the last connection error is raised.
+		'''
+		kwargs.setdefault('timeout', self.timeout);
+
+		policy = self.retry;
+		can_retry = policy is not None and retry is not False and (retry is True or policy.is_retryable_method(method));
+		attempt = 0;
+
+		while True:
+			try:
+				r = self.send(method, url, **kwargs);
+			except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+				never_sent = isinstance(e, requests.exceptions.ConnectTimeout);
+				if policy is None or retry is False or not (can_retry or never_sent) or attempt >= policy.total:
+					raise;
+				time.sleep(policy.backoff(attempt));
+				attempt += 1;
+				continue;
+
+			if can_retry and attempt < policy.total and r.status_code in policy.status_forcelist:
+				delay = policy.delay(attempt, r);
+				r.close();
+				time.sleep(delay);
+				attempt += 1;
+				continue;
+
+			return self.attach_json(r);
+
+	def attach_json (self, r):
+		'''
+		Replace response.json with a version that decodes the body once with the configured decoder and caches the result.
+		Decoding errors surface as requests.exceptions.JSONDecodeError, exactly like requests' own response.json().
+		'''
+		loads = self.json_loads;
+		decoded = list();
+
+		def json (**kwargs):
+			if not decoded:
+				try:
+					decoded.append(loads(r.content));
+				except ValueError as e:
+					raise requests.exceptions.JSONDecodeError(str(e), r.text, 0);
+			return decoded[0];
+
+		r.json = json;
+		return r;
+
+	def send (self, method, url, **kwargs):
+		'''
+		Send a single HTTP request (no retries), charging it against the rate limiter when one is configured.
+		'''
+		if self.rate_limiter is None:
+			return self.session.request(method=method, url=url, **kwargs);
+
+		group = self.rate_limiter.acquire(method, url);
+		r = self.session.request(method=method, url=url, **kwargs);
+		self.rate_limiter.update(group, r);
+
+		return r;
+
+	def get (self, url, params=None, **kwargs):
+		return self.request('GET', url, params=params, **kwargs);
+
+	def post (self, url, data=None, **kwargs):
+		return self.request('POST', url, data=data, **kwargs);
+
+	def put (self, url, data=None, **kwargs):
+		return self.request('PUT', url, data=data, **kwargs);
+
+	def delete (self, url, **kwargs):
+		return self.request('DELETE', url, **kwargs);
+
+	def budget (self, group=None):
+		'''
+		Remaining client-side request budget per endpoint group (see RateLimiter.budget). Returns None if rate limiting is disabled.
+		'''
+		return self.rate_limiter.budget(group) if self.rate_limiter is not None else None;
+
+	def close (self):
+		'''
+		Close every pooled connection held by this transport.
+		'''
+		self.session.close();
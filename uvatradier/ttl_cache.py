@@ -0,0 +1,161 @@
+import os;
+import time;
+import shutil;
+import threading;
+
+from types import MappingProxyType;
+from urllib.parse import quote;
+
+from .storage import write_json, read_json;
+
+
+def freeze (value):
+	'''
+	Read-only version of a JSON-like value: lists become tuples and dicts become read-only mappings, recursively.
+	'''
+	if isinstance(value, (list, tuple)):
+		return tuple(freeze(item) for item in value);
+	if isinstance(value, dict):
+		return MappingProxyType({key:freeze(item) for key, item in value.items()});
+	return value;
+
+
+def thaw (value):
+	'''
+	Plain (JSON-serializable) version of a value returned by freeze.
+	'''
+	if isinstance(value, tuple):
+		return [thaw(item) for item in value];
+	if isinstance(value, MappingProxyType):
+		return {key:thaw(item) for key, item in value.items()};
+	return value;
+
+
+class TTLCache:
+	'''
+	Thread-safe in-memory cache of reference data (option expirations, strikes, option symbols) whose entries expire after `ttl` seconds,
+	with optional persistence to disk so entries survive between processes.
+
+	Entries are keyed by (kind, symbol, *params) tuples, e.g. ('expirations', 'SPY', 'strikes'). Concurrent requests for a missing key
+	are collapsed into a single fetch.
+
+	Values are stored frozen (lists as tuples, dicts as read-only mappings, see freeze) and returned as is, so reads cost nothing and
+	callers cannot modify the cached copy. Use thaw to get a plain, mutable copy.
+
+	Layout (when persisted), one directory level per key part, each part URL-quoted:
+		path/
+			expirations/
+				SPY.json 			# {"key": ["expirations", "SPY"], "expires": 1729281600.0, "value": ["2024-10-18", ...]}
+				SPY/
+					strikes.json
+				BRK-B.json
+			options_symbols/
+				SPY.json
+
+	Args:
+		• ttl (float, optional): Seconds an entry stays fresh. Default is 900 (15 minutes).
+		• path (str, optional): Directory to persist entries in. Default is None (memory only).
+
+	Example:
+		# Keep expirations and option symbols for an hour, shared across runs
+		>>> options_data = OptionsData(tradier_acct, tradier_token, cache=TTLCache(ttl=3600, path='~/tradier_cache'))
+		>>> options_data.get_expiry_dates('SPY') 		# requests Tradier
+		>>> options_data.get_expiry_dates('SPY') 		# served from the cache
+		>>> options_data.invalidate_cache('SPY') 		# drop everything cached for SPY
+	'''
+
+	MISSING = object();
+
+	def __init__ (self, ttl=900.0, path=None):
+		self.ttl 	= ttl;
+		self.path 	= os.path.expanduser(path) if path else None;
+
+		self._entries = dict();
+		self._lock = threading.Lock();
+		self._key_locks = dict();
+
+	def key_lock (self, key):
+		'''
+		Per-key lock serializing fetches of the same key.
+		'''
+		with self._lock:
+			return self._key_locks.setdefault(key, threading.Lock());
+
+	def file_path (self, key):
+		return os.path.join(self.path, *(quote(str(part), safe='') for part in key)) + '.json';
+
+	def get (self, key, default=None):
+		'''
+		Cached value for `key` (frozen, see freeze), or `default` if it is missing or expired.
+		'''
+		with self._lock:
+			entry = self._entries.get(key);
+
+		if entry is None and self.path is not None:
+			stored = read_json(self.file_path(key));
+			if stored is not None and tuple(stored.get('key', ())) == key:
+				entry = {'expires':stored['expires'], 'value':freeze(stored['value'])};
+				with self._lock:
+					self._entries[key] = entry;
+
+		if entry is None or entry['expires'] <= time.time():
+			return default;
+
+		return entry['value'];
+
+	def set (self, key, value, ttl=None):
+		'''
+		Cache `value` under `key` for `ttl` seconds (default: the cache's ttl). Returns the frozen value as stored.
+		'''
+		entry = {'expires':time.time() + (self.ttl if ttl is None else ttl), 'value':freeze(value)};
+
+		with self._lock:
+			self._entries[key] = entry;
+
+		if self.path is not None:
+			write_json({'key':list(key), 'expires':entry['expires'], 'value':thaw(entry['value'])}, self.file_path(key));
+
+		return entry['value'];
+
+	def get_or_fetch (self, key, fetch):
+		'''
+		Cached value for `key`, calling `fetch()` and caching its result if the key is missing or expired.
+		Exceptions raised by `fetch` propagate and nothing is cached.
+		'''
+		value = self.get(key, self.MISSING);
+		if value is not self.MISSING:
+			return value;
+
+		with self.key_lock(key):
+			value = self.get(key, self.MISSING);
+			if value is self.MISSING:
+				value = self.set(key, fetch());
+			return value;
+
+	def invalidate (self, symbol=None, kind=None):
+		'''
+		Drop cached entries (in memory and on disk) for `symbol` and/or `kind`. With no arguments, drop everything.
+		'''
+		symbol = symbol.upper() if symbol else None;
+		matches = lambda key: (symbol is None or key[1] == symbol) and (kind is None or key[0] == kind);
+
+		with self._lock:
+			for key in [key for key in self._entries if matches(key)]:
+				del self._entries[key];
+
+		if self.path is None or not os.path.isdir(self.path):
+			return;
+
+		for entry_kind in os.listdir(self.path):
+			directory = os.path.join(self.path, entry_kind);
+			if not os.path.isdir(directory) or (kind is not None and entry_kind != quote(kind, safe='')):
+				continue;
+
+			names = os.listdir(directory) if symbol is None else [quote(symbol, safe=''), quote(symbol, safe='') + '.json'];
+
+			for name in names:
+				entry_path = os.path.join(directory, name);
+				if os.path.isdir(entry_path):
+					shutil.rmtree(entry_path);
+				elif os.path.exists(entry_path):
+					os.remove(entry_path);
@@ -0,0 +1,242 @@
+import threading;
+
+import numpy as np;
+import pandas as pd;
+
+from .occ import parse_occ;
+from .greeks import implied_volatility, bs_greeks, chain_contracts, chain_prices, time_to_expiry;
+
+
+class VolSurface:
+	'''
+	Implied volatility surface of one underlying, indexed by (expiry, strike or log-moneyness), that is updated incrementally.
+
+	Every contract's implied volatility is solved vectorized (greeks.implied_volatility). Each expiry's smile is then fitted as a
+	vega-weighted polynomial in log-moneyness k = ln(K / F) to total implied variance w(k) = iv^2 * T, using out-of-the-money
+	contracts (puts below the forward, calls above).
+
+	Updates only do the work their input requires:
+		• update(chain) and update_quotes(quotes) re-solve implied volatility only for contracts whose price changed, and refit
+		  only the expiries those contracts belong to. Other expiries are left untouched.
+		• set_underlying_price(price) re-solves every contract only if the underlying moved by more than `spot_tolerance`.
+
+	Args:
+		• underlying_price (float): Price of the underlying.
+		• rate (float, optional): Continuously compounded risk-free rate. Default is 0.
+		• dividend_yield (float, optional): Continuous dividend yield. Default is 0.
+		• price (str, optional): Option price to solve implied volatility from ('mid', 'bid', 'ask', 'last', ...). Default is 'mid'.
+		• degree (int, optional): Degree of the smile polynomial. Default is 2.
+		• spot_tolerance (float, optional): Relative move of the underlying below which implied volatilities are not re-solved. Default is 0.0005.
+
+	Example:
+		>>> surface = VolSurface(underlying_price=quotes.get_quote_day('SPY', last_price=True), rate=0.045)
+		>>> surface.update(options_data.get_chain_all('SPY'))
+
+		# Every minute: refresh one expiry's chain, or apply streamed option quotes
+		>>> surface.update(options_data.get_chain_day('SPY', expiry='2024-12-20'))
+		>>> surface.update_quotes([{'symbol':'SPY241220C00600000', 'bid':12.1, 'ask':12.3}])
+
+		>>> surface.iv('2024-12-20', strike=600)
+		>>> surface.grid(moneyness=np.linspace(-0.2, 0.2, 9))
+	'''
+
+	def __init__ (self, underlying_price, rate=0.0, dividend_yield=0.0, price='mid', degree=2, spot_tolerance=0.0005):
+		self.underlying_price 	= float(underlying_price);
+		self.rate 				= rate;
+		self.dividend_yield 	= dividend_yield;
+		self.price 				= price;
+		self.degree 			= degree;
+		self.spot_tolerance 	= spot_tolerance;
+
+		#
+		# One row per contract, indexed by OCC symbol: expiration_date, strike, option_type, price, T, iv, vega
+		#
+
+		self.points = pd.DataFrame(columns=['expiration_date', 'strike', 'option_type', 'price', 'T', 'iv', 'vega']).astype({'expiration_date':'datetime64[s]', 'strike':'float64', 'price':'float64', 'T':'float64', 'iv':'float64', 'vega':'float64'});
+		self.points.index.name = 'symbol';
+
+		self.fits = dict(); 			# expiry (datetime64[D]) -> (T, forward, polynomial coefficients of w(k) or None)
+		self.last_update = {'contracts':0, 'expiries':0};
+
+		self._lock = threading.RLock();
+
+	#
+	# Updates
+	#
+
+	def update (self, chain, underlying_price=None, valuation_time=None):
+		'''
+		Merge a chain DataFrame (from get_chain_day/get_chain_all, or any subset of contracts) into the surface.
+
+		Returns:
+			• dict: {'contracts': number of implied volatilities solved, 'expiries': number of smiles refitted}.
+		'''
+		if chain.empty:
+			return {'contracts':0, 'expiries':0};
+
+		strike, option_type, expiry = chain_contracts(chain);
+		incoming = pd.DataFrame({
+			'expiration_date' 	: expiry,
+			'strike' 			: strike,
+			'option_type' 		: pd.Series(option_type).str[0].str.upper().map({'C':'call', 'P':'put'}).to_numpy(),
+			'price' 			: chain_prices(chain, self.price)
+		}, index=pd.Index(chain['symbol'].to_numpy(), name='symbol'));
+
+		return self.merge(incoming, underlying_price, valuation_time);
+
+	def update_quotes (self, quotes, underlying_price=None, valuation_time=None):
+		'''
+		Merge streamed option quotes into the surface. `quotes` is a DataFrame or an iterable of dicts/objects with symbol, bid and ask
+		(and optionally last), e.g. quote events from the market stream. Strike, type and expiry are parsed from the OCC symbols.
+		'''
+		if not isinstance(quotes, pd.DataFrame):
+			quotes = pd.DataFrame([q if isinstance(q, dict) else {name:getattr(q, name, None) for name in ('symbol', 'bid', 'ask', 'last')} for q in quotes]);
+
+		if quotes.empty:
+			return {'contracts':0, 'expiries':0};
+
+		quotes = quotes.drop_duplicates(subset='symbol', keep='last');
+		parsed = parse_occ(quotes['symbol'].to_numpy(), errors='coerce');
+		valid = parsed['root_symbol'].notna().to_numpy();
+
+		chain = quotes[valid].assign(
+			strike 			= parsed['strike'].to_numpy()[valid],
+			option_type 	= parsed['option_type'].astype(str).to_numpy()[valid],
+			expiration_date = parsed['expiration_date'].to_numpy()[valid]
+		);
+
+		return self.update(chain, underlying_price, valuation_time);
+
+	def set_underlying_price (self, underlying_price, valuation_time=None):
+		'''
+		Move the underlying price. Implied volatilities are re-solved (and every smile refitted) only if it moved by more than spot_tolerance.
+		'''
+		with self._lock:
+			if not self.spot_moved(underlying_price):
+				self.last_update = {'contracts':0, 'expiries':0};
+				return self.last_update;
+
+			self.underlying_price = float(underlying_price);
+
+			if self.points.empty:
+				self.last_update = {'contracts':0, 'expiries':0};
+				return self.last_update;
+
+			return self.solve(np.ones(len(self.points), dtype=bool), valuation_time);
+
+	def spot_moved (self, underlying_price):
+		return underlying_price is not None and abs(float(underlying_price) / self.underlying_price - 1) > self.spot_tolerance;
+
+	def merge (self, incoming, underlying_price=None, valuation_time=None):
+		with self._lock:
+			incoming = incoming[~incoming.index.duplicated(keep='last')];
+			resolve_all = self.spot_moved(underlying_price);
+
+			#
+			# Unless the underlying moved, only contracts that are new or whose price changed need their implied volatility solved again
+			#
+
+			if not resolve_all:
+				previous_price = self.points['price'].reindex(incoming.index).to_numpy(dtype=np.float64);
+				price = incoming['price'].to_numpy(dtype=np.float64);
+				incoming = incoming[~((previous_price == price) | (np.isnan(previous_price) & np.isnan(price) & incoming.index.isin(self.points.index)))];
+
+				if incoming.empty:
+					self.last_update = {'contracts':0, 'expiries':0};
+					return self.last_update;
+
+			self.points = pd.concat([self.points.drop(incoming.index, errors='ignore'), incoming.assign(T=np.nan, iv=np.nan, vega=np.nan)]) if len(self.points) else incoming.assign(T=np.nan, iv=np.nan, vega=np.nan);
+
+			if resolve_all:
+				self.underlying_price = float(underlying_price);
+				return self.solve(np.ones(len(self.points), dtype=bool), valuation_time);
+
+			return self.solve(self.points.index.isin(incoming.index), valuation_time);
+
+	def solve (self, selected, valuation_time=None):
+		'''
+		Solve implied volatility (and vega, used to weight the smile fit) for the selected points, then refit their expiries.
+		'''
+		points = self.points[selected];
+		S = self.underlying_price;
+
+		T = time_to_expiry(points['expiration_date'].to_numpy(), valuation_time);
+		iv = implied_volatility(points['price'].to_numpy(), S, points['strike'].to_numpy(), T, points['option_type'].to_numpy(), self.rate, self.dividend_yield);
+		vega = bs_greeks(S, points['strike'].to_numpy(), T, iv, points['option_type'].to_numpy(), self.rate, self.dividend_yield)['vega'];
+
+		self.points.loc[selected, 'T'] = T;
+		self.points.loc[selected, 'iv'] = iv;
+		self.points.loc[selected, 'vega'] = vega;
+
+		expiries = np.unique(points['expiration_date'].to_numpy().astype('datetime64[D]'));
+		for expiry in expiries:
+			self.fit(expiry);
+
+		self.last_update = {'contracts':int(selected.sum()), 'expiries':len(expiries)};
+		return self.last_update;
+
+	def fit (self, expiry):
+		'''
+		Fit one expiry's smile: vega-weighted polynomial of total implied variance in log-moneyness, on out-of-the-money contracts.
+		'''
+		points = self.points[self.points['expiration_date'].to_numpy().astype('datetime64[D]') == expiry];
+		T = float(np.nanmean(points['T'])) if len(points) and points['T'].notna().any() else np.nan;
+		forward = self.underlying_price * np.exp((self.rate - self.dividend_yield) * T);
+
+		k = np.log(points['strike'].to_numpy() / forward);
+		out_of_the_money = np.where(points['option_type'].to_numpy() == 'call', k >= 0, k < 0);
+		usable = out_of_the_money & np.isfinite(points['iv'].to_numpy()) & (points['vega'].to_numpy() > 0);
+
+		coefficients = None;
+		if usable.sum() > self.degree:
+			w = np.square(points['iv'].to_numpy()[usable]) * points['T'].to_numpy()[usable];
+			coefficients = np.polyfit(k[usable], w, self.degree, w=np.sqrt(points['vega'].to_numpy()[usable]));
+
+		self.fits[expiry] = (T, forward, coefficients);
+
+	#
+	# Queries
+	#
+
+	def expiries (self):
+		'''
+		Expiries with points on the surface, as a sorted DatetimeIndex.
+		'''
+		return pd.DatetimeIndex(sorted(self.fits));
+
+	def iv (self, expiry, strike=None, moneyness=None):
+		'''
+		Fitted implied volatility of an expiry at the given strike(s) or log-moneyness value(s) ln(K / F).
+		NaN if the expiry has no fit, or where the fitted total variance is not positive (far outside the quoted strikes).
+		'''
+		T, forward, coefficients = self.fits.get(np.datetime64(pd.Timestamp(expiry).date(), 'D'), (np.nan, np.nan, None));
+
+		if strike is not None:
+			moneyness = np.log(np.asarray(strike, dtype=np.float64) / forward);
+		moneyness = np.asarray(moneyness, dtype=np.float64);
+
+		if coefficients is None:
+			return np.full(moneyness.shape, np.nan) if moneyness.ndim else np.nan;
+
+		variance = np.polyval(coefficients, moneyness);
+
+		with np.errstate(invalid='ignore'):
+			iv = np.where(variance > 0, np.sqrt(np.maximum(variance, 0) / T), np.nan);
+
+		return iv if iv.ndim else float(iv);
+
+	def grid (self, moneyness=np.linspace(-0.2, 0.2, 9)):
+		'''
+		Fitted implied volatilities as a DataFrame indexed by expiry, with one column per log-moneyness value.
+		'''
+		moneyness = np.asarray(moneyness, dtype=np.float64);
+		expiries = self.expiries();
+
+		return pd.DataFrame([self.iv(expiry, moneyness=moneyness) for expiry in expiries], index=expiries, columns=moneyness);
+
+	def smiles (self):
+		'''
+		Per-expiry fit parameters: time to expiry, forward, and the smile polynomial coefficients (highest power first).
+		'''
+		rows = {pd.Timestamp(expiry):{'T':T, 'forward':forward, **{f"c{self.degree - i}":c for i, c in enumerate(coefficients if coefficients is not None else [np.nan] * (self.degree + 1))}} for expiry, (T, forward, coefficients) in self.fits.items()};
+		return pd.DataFrame.from_dict(rows, orient='index').sort_index();